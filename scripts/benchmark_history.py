@@ -0,0 +1,333 @@
+"""
+Persistent history of benchmark timings, stored in a DuckDB database file.
+
+Recording a run:
+    python3 scripts/benchmark_history.py import --db=history.duckdb --file=timings.tsv --source=benchmark_runner
+The file has the "name\trun\ttiming" format that the benchmark runner writes to stderr.
+scripts/regression_test_runner.py and scripts/regression_test_python.py record their timings
+directly when they are passed --history=history.duckdb.
+
+Reporting step changes and slow drift, and rendering per-benchmark trend charts:
+    python3 scripts/benchmark_history.py report --db=history.duckdb --charts=charts/
+"""
+
+import argparse
+import csv
+import hashlib
+import html
+import os
+import platform
+import re
+import statistics
+import subprocess
+import uuid
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+
+import duckdb
+
+
+SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS runs (
+        run_id VARCHAR PRIMARY KEY,
+        source VARCHAR,
+        label VARCHAR,
+        recorded_at TIMESTAMP,
+        commit_hash VARCHAR,
+        machine VARCHAR,
+        machine_info VARCHAR,
+        threads INTEGER
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS timings (
+        run_id VARCHAR,
+        benchmark VARCHAR,
+        nrun INTEGER,
+        timing DOUBLE
+    )
+    """,
+]
+
+
+def git_commit(path: Optional[str] = None) -> Optional[str]:
+    """Returns the commit checked out at the given path, or None if it is not inside a git repository"""
+    if path is not None and not os.path.isdir(path):
+        path = os.path.dirname(os.path.abspath(path))
+    try:
+        proc = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], cwd=path, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=30
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if proc.returncode != 0:
+        return None
+    return proc.stdout.decode('utf8').strip()
+
+
+def machine_fingerprint() -> Tuple[str, str]:
+    """
+    Returns a short fingerprint of the machine together with the description it was computed from.
+    Timings are only compared between runs with the same fingerprint.
+    """
+    memory = None
+    if hasattr(os, 'sysconf'):
+        try:
+            memory = os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES')
+        except (ValueError, OSError):
+            pass
+    cpu_model = platform.processor()
+    if os.path.isfile('/proc/cpuinfo'):
+        with open('/proc/cpuinfo', 'r') as f:
+            for line in f:
+                if line.startswith('model name'):
+                    cpu_model = line.split(':', 1)[1].strip()
+                    break
+    info = (
+        f"host={platform.node()};system={platform.system()};arch={platform.machine()};"
+        f"cpu={cpu_model};cores={os.cpu_count()};memory={memory}"
+    )
+    return hashlib.sha1(info.encode('utf8')).hexdigest()[:12], info
+
+
+def read_timings(file_name: str) -> List[Tuple[str, int, float]]:
+    """Reads "name\trun\ttiming" rows, skipping headers, log lines and failed runs"""
+    result = []
+    with open(file_name, 'r') as f:
+        for row in csv.reader(f, delimiter='\t'):
+            if len(row) < 3:
+                continue
+            try:
+                result.append((row[0], int(row[1]), float(row[2])))
+            except ValueError:
+                continue
+    return result
+
+
+class BenchmarkHistory:
+    def __init__(self, db_path: str):
+        self.con = duckdb.connect(db_path)
+        for statement in SCHEMA:
+            self.con.execute(statement)
+
+    def start_run(
+        self,
+        source: str,
+        threads: Optional[int] = None,
+        commit: Optional[str] = None,
+        label: Optional[str] = None,
+    ) -> str:
+        run_id = str(uuid.uuid4())
+        machine, machine_info = machine_fingerprint()
+        self.con.execute(
+            "INSERT INTO runs VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [run_id, source, label, datetime.now(), commit, machine, machine_info, threads],
+        )
+        return run_id
+
+    def add_timings(self, run_id: str, benchmark: str, timings: Iterable[float], first_run: int = 0):
+        rows = [[run_id, benchmark, first_run + i, float(t)] for i, t in enumerate(timings)]
+        if len(rows) == 0:
+            return
+        self.con.executemany("INSERT INTO timings VALUES (?, ?, ?, ?)", rows)
+
+    def add_rows(self, run_id: str, rows: Iterable[Tuple[str, int, float]]):
+        rows = [[run_id, name, nrun, timing] for name, nrun, timing in rows]
+        if len(rows) == 0:
+            return
+        self.con.executemany("INSERT INTO timings VALUES (?, ?, ?, ?)", rows)
+
+    def series(self, benchmark_filter: Optional[str] = None):
+        """
+        Returns the per-run median timing of every benchmark, grouped by everything that affects the timing.
+        Each series is ordered by the time it was recorded at.
+        """
+        query = """
+            SELECT benchmark, source, machine, threads,
+                   list(commit_hash ORDER BY recorded_at),
+                   list(recorded_at ORDER BY recorded_at),
+                   list(median_timing ORDER BY recorded_at),
+                   list(min_timing ORDER BY recorded_at),
+                   list(max_timing ORDER BY recorded_at)
+            FROM (
+                SELECT run_id, benchmark, source, machine, threads, commit_hash, recorded_at,
+                       median(timing) AS median_timing, min(timing) AS min_timing, max(timing) AS max_timing
+                FROM timings JOIN runs USING (run_id)
+                GROUP BY ALL
+            )
+        """
+        params = []
+        if benchmark_filter is not None:
+            query += " WHERE benchmark LIKE ?"
+            params.append(benchmark_filter)
+        query += " GROUP BY ALL ORDER BY ALL"
+        return self.con.execute(query, params).fetchall()
+
+    def close(self):
+        self.con.close()
+
+
+def detect_step_changes(medians: List[float], window: int, threshold: float) -> List[Tuple[int, float]]:
+    """
+    Finds the runs at which the timing changed, returns (index of the first run after the change, relative change).
+    A step has to exceed the threshold, and the windows of runs before and after the step may not overlap.
+    Of adjacent candidates only the largest change is reported.
+    """
+    candidates = []
+    for i in range(window, len(medians) - window + 1):
+        before = medians[i - window : i]
+        after = medians[i : i + window]
+        before_median = statistics.median(before)
+        if before_median <= 0:
+            continue
+        change = statistics.median(after) / before_median - 1
+        separated = min(after) > max(before) or max(after) < min(before)
+        if abs(change) > threshold and separated:
+            candidates.append((i, change))
+    steps = []
+    for index, change in candidates:
+        if len(steps) > 0 and index - steps[-1][0] < window:
+            if abs(change) > abs(steps[-1][1]):
+                steps[-1] = (index, change)
+            continue
+        steps.append((index, change))
+    return steps
+
+
+def detect_drift(medians: List[float], window: int) -> Optional[float]:
+    """Returns the relative change between the first and the last runs of the series"""
+    if len(medians) < 2 * window:
+        return None
+    first = statistics.median(medians[:window])
+    if first <= 0:
+        return None
+    return statistics.median(medians[-window:]) / first - 1
+
+
+def render_chart(file_name: str, title: str, commits, medians, minimums, maximums, steps):
+    """Renders the per-run median timings as an SVG line chart, with the min/max of each run and the step changes"""
+    width = 800
+    height = 300
+    margin = 50
+    count = len(medians)
+    top = max(maximums) * 1.1 or 1.0
+
+    def x(i):
+        if count == 1:
+            return margin + (width - 2 * margin) / 2
+        return margin + i * (width - 2 * margin) / (count - 1)
+
+    def y(value):
+        return height - margin - value / top * (height - 2 * margin)
+
+    elements = [
+        f'<text x="{width / 2}" y="20" text-anchor="middle" font-size="14">{html.escape(title)}</text>',
+        f'<line x1="{margin}" y1="{height - margin}" x2="{width - margin}" y2="{height - margin}" stroke="black"/>',
+        f'<line x1="{margin}" y1="{margin}" x2="{margin}" y2="{height - margin}" stroke="black"/>',
+        f'<text x="{margin - 5}" y="{y(top) + 4}" text-anchor="end" font-size="10">{top:.3f}s</text>',
+        f'<text x="{margin - 5}" y="{y(0) + 4}" text-anchor="end" font-size="10">0s</text>',
+    ]
+    for index, change in steps:
+        step_x = (x(index - 1) + x(index)) / 2
+        color = 'red' if change > 0 else 'green'
+        elements.append(
+            f'<line x1="{step_x}" y1="{margin}" x2="{step_x}" y2="{height - margin}" stroke="{color}" stroke-dasharray="4"/>'
+        )
+        elements.append(
+            f'<text x="{step_x + 3}" y="{margin + 10}" font-size="10" fill="{color}">{change * 100:+.1f}%</text>'
+        )
+    for i in range(count):
+        elements.append(
+            f'<line x1="{x(i)}" y1="{y(minimums[i])}" x2="{x(i)}" y2="{y(maximums[i])}" stroke="lightgray"/>'
+        )
+    points = " ".join(f"{x(i)},{y(medians[i])}" for i in range(count))
+    elements.append(f'<polyline points="{points}" fill="none" stroke="steelblue"/>')
+    for i in range(count):
+        commit = html.escape((commits[i] or 'unknown')[:10])
+        elements.append(
+            f'<circle cx="{x(i)}" cy="{y(medians[i])}" r="3" fill="steelblue"><title>{commit}: {medians[i]:.4f}s</title></circle>'
+        )
+    for i in (0, count - 1):
+        commit = html.escape((commits[i] or 'unknown')[:10])
+        elements.append(f'<text x="{x(i)}" y="{height - margin + 15}" text-anchor="middle" font-size="10">{commit}</text>')
+    with open(file_name, 'w') as f:
+        f.write(f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}">\n')
+        f.write("\n".join(elements))
+        f.write('\n</svg>\n')
+
+
+def chart_file_name(benchmark, source, machine, threads):
+    name = re.sub(r'[^A-Za-z0-9_.-]+', '_', f"{source}_{benchmark}_{machine}_{threads}")
+    return name.strip('_') + '.svg'
+
+
+def report(history: BenchmarkHistory, args) -> int:
+    regressions = 0
+    for benchmark, source, machine, threads, commits, _, medians, minimums, maximums in history.series(args.benchmark):
+        steps = detect_step_changes(medians, args.window, args.threshold)
+        drift = detect_drift(medians, args.window)
+        description = f"{benchmark} ({source}, machine {machine}, threads {threads}, {len(medians)} runs)"
+        for index, change in steps:
+            kind = 'SLOWER' if change > 0 else 'FASTER'
+            regressions += change > 0
+            print(f"{kind} {change * 100:+.1f}% {description}")
+            print(f"    between {commits[index - 1]} and {commits[index]}")
+        if drift is not None and len(steps) == 0 and abs(drift) > args.threshold:
+            kind = 'DRIFT SLOWER' if drift > 0 else 'DRIFT FASTER'
+            regressions += drift > 0
+            print(f"{kind} {drift * 100:+.1f}% {description}")
+            print(f"    between {commits[0]} and {commits[-1]}")
+        if args.charts is not None:
+            os.makedirs(args.charts, exist_ok=True)
+            render_chart(
+                os.path.join(args.charts, chart_file_name(benchmark, source, machine, threads)),
+                description,
+                commits,
+                medians,
+                minimums,
+                maximums,
+                steps,
+            )
+    if regressions == 0:
+        print("No step changes or drift towards slower timings detected")
+    return 1 if regressions > 0 and args.fail else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Store and analyze the history of benchmark timings")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    import_parser = subparsers.add_parser('import', help="Append the timings of a run to the history")
+    import_parser.add_argument("--db", type=str, required=True, help="Path of the history database")
+    import_parser.add_argument("--file", type=str, required=True, help="File with name\\trun\\ttiming rows")
+    import_parser.add_argument("--source", type=str, default='benchmark_runner', help="Tool that produced the timings")
+    import_parser.add_argument("--label", type=str, default=None, help="Free-form label of the run")
+    import_parser.add_argument("--commit", type=str, default=None, help="Commit (default: HEAD of the working dir)")
+    import_parser.add_argument("--threads", type=int, default=None, help="Number of threads used for the run")
+
+    report_parser = subparsers.add_parser('report', help="Detect step changes and drift, and render trend charts")
+    report_parser.add_argument("--db", type=str, required=True, help="Path of the history database")
+    report_parser.add_argument("--benchmark", type=str, default=None, help="LIKE pattern of the benchmarks to report")
+    report_parser.add_argument("--window", type=int, default=5, help="Number of runs compared around a step")
+    report_parser.add_argument("--threshold", type=float, default=0.1, help="Minimal relative change to report")
+    report_parser.add_argument("--charts", type=str, default=None, help="Directory to write SVG trend charts to")
+    report_parser.add_argument("--fail", action="store_true", help="Exit with 1 if the timings got slower")
+    args = parser.parse_args()
+
+    history = BenchmarkHistory(args.db)
+    try:
+        if args.command == 'import':
+            rows = read_timings(args.file)
+            commit = args.commit if args.commit is not None else git_commit()
+            run_id = history.start_run(args.source, args.threads, commit, args.label)
+            history.add_rows(run_id, rows)
+            print(f"Recorded {len(rows)} timings as run {run_id}")
+            return 0
+        return report(history, args)
+    finally:
+        history.close()
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -1,17 +1,21 @@
 import glob
 import json
+import math
 import os
+import queue
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
 
 
 OLD_DB_NAME = "old.duckdb"
 NEW_DB_NAME = "new.duckdb"
-PROFILE_FILENAME = "duckdb_profile.json"
 
-ENABLE_PROFILING = "PRAGMA enable_profiling=json"
-PROFILE_OUTPUT = f"PRAGMA profile_output='{PROFILE_FILENAME}'"
+# the profile is returned as the result of the query, so no profile file is written
+EXPLAIN_ANALYZE = "EXPLAIN (ANALYZE, FORMAT JSON)"
+# printed after every query by the CLI runner to find the end of the output of the query
+END_OF_QUERY = "__plan_cost_runner_end_of_query__"
 
 BANNER_SIZE = 52
 
@@ -20,6 +24,11 @@ def print_usage():
     print(
         f"Expected usage: python3 scripts/{os.path.basename(__file__)} --old=/old/duckdb_cli --new=/new/duckdb_cli --dir=/path/to/benchmark/dir"
     )
+    print("--old and --new are either the path of a CLI or a directory containing the duckdb Python package")
+    print("Optional arguments:")
+    print("  --workers=N  number of queries that are profiled concurrently (default: number of cores / 4)")
+    print("  --threads=N  number of threads used by every query (default: number of cores / workers)")
+    print("  --top=N      number of worst offenders to report (default: 10)")
     exit(1)
 
 
@@ -27,6 +36,10 @@ def parse_args():
     old = None
     new = None
     benchmark_dir = None
+    cpu_count = os.cpu_count() or 1
+    workers = max(1, cpu_count // 4)
+    threads = None
+    top = 10
     for arg in sys.argv[1:]:
         if arg.startswith("--old="):
             old = arg.replace("--old=", "")
@@ -34,19 +47,139 @@ def parse_args():
             new = arg.replace("--new=", "")
         elif arg.startswith("--dir="):
             benchmark_dir = arg.replace("--dir=", "")
+        elif arg.startswith("--workers="):
+            workers = int(arg.replace("--workers=", ""))
+        elif arg.startswith("--threads="):
+            threads = int(arg.replace("--threads=", ""))
+        elif arg.startswith("--top="):
+            top = int(arg.replace("--top=", ""))
         else:
             print_usage()
-    if old == None or new == None or benchmark_dir == None:
+    if old == None or new == None or benchmark_dir == None or workers < 1:
         print_usage()
-    return old, new, benchmark_dir
+    if threads is None:
+        threads = max(1, cpu_count // workers)
+    return old, new, benchmark_dir, workers, threads, top
 
 
-def init_db(cli, dbname, benchmark_dir):
+class QueryFailure(Exception):
+    pass
+
+
+def strip_query(query):
+    return query.strip().rstrip(";")
+
+
+class CLIRunner:
+    """Profiles queries in a single long-running CLI process, queries are fed through stdin"""
+
+    def __init__(self, cli, dbname, threads=None, read_only=True):
+        args = [cli, "-list", "-noheader"]
+        if read_only:
+            args.append("-readonly")
+        args.append(dbname)
+        self.process = subprocess.Popen(
+            args, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+        )
+        if threads is not None:
+            self.run_script(f"SET threads={threads};")
+
+    def communicate(self, sql):
+        self.process.stdin.write(f"{sql}\nSELECT '{END_OF_QUERY}';\n")
+        self.process.stdin.flush()
+        lines = []
+        while True:
+            line = self.process.stdout.readline()
+            if not line:
+                raise QueryFailure("The CLI exited unexpectedly:\n" + "".join(lines))
+            if line.rstrip("\n") == END_OF_QUERY:
+                return "".join(lines)
+            lines.append(line)
+
+    def run_script(self, sql):
+        output = self.communicate(sql)
+        if "Error" in output:
+            raise QueryFailure(output)
+
+    def profile(self, query):
+        output = self.communicate(f"{EXPLAIN_ANALYZE} {strip_query(query)};")
+        prefix = "analyzed_plan|"
+        if not output.startswith(prefix):
+            raise QueryFailure(output)
+        return json.loads(output[len(prefix) :])
+
+    def close(self):
+        self.process.stdin.close()
+        self.process.wait()
+
+
+class PythonRunner:
+    """Profiles queries in a worker process that loads the duckdb Python package of a build once"""
+
+    def __init__(self, module_dir, dbname, threads=None, read_only=True):
+        args = [sys.executable, os.path.abspath(__file__), "--python-worker", module_dir, dbname]
+        args.append("read_only" if read_only else "read_write")
+        self.process = subprocess.Popen(args, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+        if threads is not None:
+            self.run_script(f"SET threads={threads};")
+
+    def communicate(self, request):
+        self.process.stdin.write(json.dumps(request) + "\n")
+        self.process.stdin.flush()
+        line = self.process.stdout.readline()
+        if not line:
+            raise QueryFailure("The Python worker exited unexpectedly")
+        response = json.loads(line)
+        if "error" in response:
+            raise QueryFailure(response["error"])
+        return response
+
+    def run_script(self, sql):
+        self.communicate({"script": sql})
+
+    def profile(self, query):
+        return json.loads(self.communicate({"query": f"{EXPLAIN_ANALYZE} {strip_query(query)}"})["profile"])
+
+    def close(self):
+        self.process.stdin.close()
+        self.process.wait()
+
+
+def python_worker(module_dir, dbname, mode):
+    # import the duckdb package of the build, instead of an installed one
+    sys.path.insert(0, module_dir)
+    import duckdb
+
+    con = duckdb.connect(dbname, read_only=mode == "read_only")
+    for line in sys.stdin:
+        request = json.loads(line)
+        try:
+            if "script" in request:
+                con.execute(request["script"])
+                response = {}
+            else:
+                response = {"profile": con.execute(request["query"]).fetchall()[0][1]}
+        except Exception as e:
+            response = {"error": str(e)}
+        sys.stdout.write(json.dumps(response) + "\n")
+        sys.stdout.flush()
+
+
+def create_runner(build, dbname, threads=None, read_only=True):
+    if os.path.isdir(build):
+        return PythonRunner(build, dbname, threads, read_only)
+    return CLIRunner(build, dbname, threads, read_only)
+
+
+def init_db(build, dbname, benchmark_dir):
     print(f"INITIALIZING {dbname} ...")
-    subprocess.run(
-        f"{cli} {dbname} < {benchmark_dir}/init/schema.sql", shell=True, check=True, stdout=subprocess.DEVNULL
-    )
-    subprocess.run(f"{cli} {dbname} < {benchmark_dir}/init/load.sql", shell=True, check=True, stdout=subprocess.DEVNULL)
+    runner = create_runner(build, dbname, read_only=False)
+    try:
+        for script in ["schema.sql", "load.sql"]:
+            with open(os.path.join(benchmark_dir, "init", script), "r") as file:
+                runner.run_script(file.read())
+    finally:
+        runner.close()
     print("INITIALIZATION DONE")
 
 
@@ -56,6 +189,8 @@ class PlanCost:
         self.build_side = 0
         self.probe_side = 0
         self.time = 0
+        # (operator name, cardinality, timing) of every operator of the plan, in pre-order
+        self.operators = []
 
     def __add__(self, other):
         self.total += other.total
@@ -86,11 +221,23 @@ class PlanCost:
     def __eq__(self, other):
         return self.total == other.total and self.build_side == other.build_side and self.probe_side == other.probe_side
 
+    def intermediate_cardinality(self):
+        return sum(cardinality for _, cardinality, _ in self.operators)
+
+    def cardinality_by_operator(self):
+        result = {}
+        for name, cardinality, _ in self.operators:
+            result[name] = result.get(name, 0) + cardinality
+        return result
+
+
+def op_name(op):
+    # newer profiles use 'operator_name' instead of 'name'
+    return op.get('name', op.get('operator_name', '')).strip()
+
 
 def is_measured_join(op) -> bool:
-    if 'name' not in op:
-        return False
-    if op['name'] != 'HASH_JOIN':
+    if op_name(op) != 'HASH_JOIN':
         return False
     if 'Join Type' not in op['extra_info']:
         return False
@@ -101,8 +248,6 @@ def is_measured_join(op) -> bool:
 
 def op_inspect(op) -> PlanCost:
     cost = PlanCost()
-    if 'Query' in op:
-        cost.time = op['operator_timing']
     if is_measured_join(op):
         cost.total = op['operator_cardinality']
         if 'operator_cardinality' in op['children'][0]:
@@ -123,27 +268,41 @@ def op_inspect(op) -> PlanCost:
     return cost
 
 
-def query_plan_cost(cli, dbname, query):
+def collect_operators(op, operators):
+    name = op_name(op)
+    # the EXPLAIN ANALYZE operator itself is not part of the plan
+    if name != 'EXPLAIN_ANALYZE':
+        operators.append((name, op.get('operator_cardinality', 0), op.get('operator_timing', 0)))
+    for child_op in op['children']:
+        collect_operators(child_op, operators)
+
+
+def plan_cost(profile) -> PlanCost:
+    cost = op_inspect(profile)
+    cost.time = profile.get('latency', profile.get('operator_timing', 0))
+    for child_op in profile['children']:
+        collect_operators(child_op, cost.operators)
+    return cost
+
+
+def profile_query(runners, query_name, query):
+    # every worker owns an old and a new runner, so the queries of both builds run in the same conditions
+    old_runner, new_runner = runners.get()
     try:
-        subprocess.run(
-            f"{cli} --readonly {dbname} -c \"{ENABLE_PROFILING};{PROFILE_OUTPUT};{query}\"",
-            shell=True,
-            check=True,
-            capture_output=True,
-        )
-    except subprocess.CalledProcessError as e:
-        print("-------------------------")
-        print("--------Failure----------")
-        print("-------------------------")
-        print(e.stderr.decode('utf8'))
-        print("-------------------------")
-        print("--------Output----------")
-        print("-------------------------")
-        print(e.output.decode('utf8'))
-        print("-------------------------")
-        raise e
-    with open(PROFILE_FILENAME, 'r') as file:
-        return op_inspect(json.load(file))
+        try:
+            old_cost = plan_cost(old_runner.profile(query))
+            new_cost = plan_cost(new_runner.profile(query))
+        except QueryFailure as e:
+            print("-------------------------")
+            print("--------Failure----------")
+            print("-------------------------")
+            print(f"Query: {query_name}")
+            print(str(e))
+            print("-------------------------")
+            raise
+        return query_name, old_cost, new_cost
+    finally:
+        runners.put((old_runner, new_runner))
 
 
 def print_banner(text):
@@ -171,33 +330,116 @@ def print_diffs(diffs):
         print("New probe cost:", new_cost.probe_side)
 
 
+def cost_ratio(old, new):
+    # avoid dividing by zero for queries without intermediates
+    return (new + 1) / (old + 1)
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+def print_distribution(results):
+    print_banner("COST DISTRIBUTION")
+    print("Ratio new/old over all queries")
+    print(f"{'metric':<26}{'geomean':>9}{'min':>9}{'p10':>9}{'median':>9}{'p90':>9}{'max':>9}")
+    metrics = [
+        ("intermediate cardinality", lambda cost: cost.intermediate_cardinality()),
+        ("join cardinality", lambda cost: cost.total),
+        ("build side cardinality", lambda cost: cost.build_side),
+        ("time", lambda cost: cost.time),
+    ]
+    for name, metric in metrics:
+        if name == "time":
+            ratios = [new.time / old.time for _, old, new in results if old.time > 0]
+        else:
+            ratios = [cost_ratio(metric(old), metric(new)) for _, old, new in results]
+        if not ratios:
+            continue
+        geomean = math.exp(sum(math.log(ratio) for ratio in ratios if ratio > 0) / len(ratios))
+        columns = [geomean, min(ratios), percentile(ratios, 0.1), percentile(ratios, 0.5)]
+        columns += [percentile(ratios, 0.9), max(ratios)]
+        print(f"{name:<26}" + "".join(f"{value:>9.3f}" for value in columns))
+
+
+def print_worst_offenders(results, top):
+    offenders = [
+        (cost_ratio(old.intermediate_cardinality(), new.intermediate_cardinality()), query_name, old, new)
+        for query_name, old, new in results
+    ]
+    offenders = [offender for offender in offenders if offender[0] > 1]
+    if not offenders:
+        return
+    offenders.sort(key=lambda x: (-x[0], x[1]))
+    print_banner("WORST OFFENDERS")
+    for ratio, query_name, old_cost, new_cost in offenders[:top]:
+        print("")
+        print("Query:", query_name)
+        print(f"Intermediate cardinality: {old_cost.intermediate_cardinality()} -> {new_cost.intermediate_cardinality()}")
+        print(f"Ratio: {ratio:.3f}")
+        print(f"Time: {old_cost.time:.4f} -> {new_cost.time:.4f}")
+        # the operators that account for the increase
+        old_operators = old_cost.cardinality_by_operator()
+        new_operators = new_cost.cardinality_by_operator()
+        deltas = []
+        for name in set(old_operators) | set(new_operators):
+            delta = new_operators.get(name, 0) - old_operators.get(name, 0)
+            if delta > 0:
+                deltas.append((delta, name))
+        for delta, name in sorted(deltas, reverse=True)[:3]:
+            print(f"  {name}: {old_operators.get(name, 0)} -> {new_operators.get(name, 0)} (+{delta})")
+
+
 def main():
-    old, new, benchmark_dir = parse_args()
+    if len(sys.argv) == 5 and sys.argv[1] == "--python-worker":
+        python_worker(sys.argv[2], sys.argv[3], sys.argv[4])
+        return
+
+    old, new, benchmark_dir, workers, threads, top = parse_args()
     init_db(old, OLD_DB_NAME, benchmark_dir)
     init_db(new, NEW_DB_NAME, benchmark_dir)
 
-    improvements = []
-    regressions = []
-
     files = glob.glob(f"{benchmark_dir}/queries/*.sql")
     files.sort()
 
-    print("")
-    print("RUNNING BENCHMARK QUERIES")
-    for f in tqdm(files):
+    queries = []
+    for f in files:
         query_name = f.split("/")[-1].replace(".sql", "")
-
         with open(f, "r") as file:
-            query = file.read()
+            queries.append((query_name, file.read()))
 
-        old_cost = query_plan_cost(old, OLD_DB_NAME, query)
-        new_cost = query_plan_cost(new, NEW_DB_NAME, query)
+    print("")
+    print(f"RUNNING BENCHMARK QUERIES ({workers} workers, {threads} threads per query)")
+    runners = queue.Queue()
+    all_runners = []
+    for _ in range(workers):
+        pair = (create_runner(old, OLD_DB_NAME, threads), create_runner(new, NEW_DB_NAME, threads))
+        all_runners += pair
+        runners.put(pair)
+
+    results = []
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(profile_query, runners, name, query) for name, query in queries]
+            for future in tqdm(as_completed(futures), total=len(futures)):
+                results.append(future.result())
+    finally:
+        for runner in all_runners:
+            runner.close()
+    results.sort(key=lambda x: x[0])
 
+    improvements = []
+    regressions = []
+    for query_name, old_cost, new_cost in results:
         if old_cost > new_cost:
             improvements.append((query_name, old_cost, new_cost))
         elif new_cost > old_cost:
             regressions.append((query_name, old_cost, new_cost))
 
+    print_distribution(results)
+    print_worst_offenders(results, top)
+
     exit_code = 0
     if improvements:
         print_banner("IMPROVEMENTS DETECTED")
@@ -211,7 +453,6 @@ def main():
 
     os.remove(OLD_DB_NAME)
     os.remove(NEW_DB_NAME)
-    os.remove(PROFILE_FILENAME)
 
     exit(exit_code)
 
@@ -0,0 +1,317 @@
+"""
+Benchmarks of the Python client, covering the fetch and ingestion paths between DuckDB and Python.
+
+Every benchmark is declared in BENCHMARKS below: the input it starts from, the action that is timed, the
+data shapes it applies to and the optional modules it requires. Every benchmark runs for every combination
+of data shape, row count and thread count, e.g. "python/fetchall/wide/rows=1000000/threads=4".
+The timings are written as "name\tnrun\ttiming" rows, the format of the C++ benchmark runner, so they can be
+compared with scripts/regression_check.py or recorded with scripts/benchmark_history.py.
+
+Usage:
+    python3 scripts/python_benchmark_runner.py --rows=100000,1000000 --threads=1,4 --out-file=timings.tsv
+"""
+
+import argparse
+import functools
+import importlib
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+from typing import Any, Callable, NamedTuple, Optional, Tuple
+
+import duckdb
+from duckdb.typing import BIGINT
+
+# the query every fetch benchmark runs
+SELECT_DATA = 'SELECT * FROM data'
+
+WIDE_COLUMNS = 100
+
+# every shape has a BIGINT column "i" with the row number, "{rows}" is replaced with the row count
+SHAPES = {
+    'narrow': 'SELECT i, i * 0.5 AS d FROM range({rows}) t(i)',
+    'wide': 'SELECT i, ' + ', '.join(f'i + {k} AS c{k}' for k in range(1, WIDE_COLUMNS)) + ' FROM range({rows}) t(i)',
+    'strings': """
+        SELECT i, 'string_' || (i % 1000) AS short_str, repeat(md5(i::VARCHAR), 4) AS long_str, i::VARCHAR AS num_str
+        FROM range({rows}) t(i)
+    """,
+    'nulls': """
+        SELECT i,
+               CASE WHEN i % 10 = 0 THEN i END AS int_col,
+               CASE WHEN i % 10 = 0 THEN i * 0.5 END AS double_col,
+               CASE WHEN i % 10 = 0 THEN 'value_' || i END AS str_col
+        FROM range({rows}) t(i)
+    """,
+    'nested': """
+        SELECT i,
+               {'a': i, 'b': i::VARCHAR} AS struct_col,
+               [i, i + 1, i + 2] AS list_col,
+               {'x': [i, NULL], 'y': {'z': i::VARCHAR}} AS nested_col
+        FROM range({rows}) t(i)
+    """,
+}
+ALL_SHAPES = tuple(SHAPES.keys())
+# executemany binds every value separately, this is too slow for the wide shape
+ROW_SHAPES = ('narrow', 'strings', 'nulls')
+
+
+def prepare_table(con: duckdb.DuckDBPyConnection):
+    return None
+
+
+def prepare_rows(con: duckdb.DuckDBPyConnection):
+    return con.execute(SELECT_DATA).fetchall()
+
+
+def prepare_pandas(con: duckdb.DuckDBPyConnection):
+    return con.execute(SELECT_DATA).df()
+
+
+def prepare_arrow(con: duckdb.DuckDBPyConnection):
+    return con.execute(SELECT_DATA).arrow()
+
+
+def prepare_polars(con: duckdb.DuckDBPyConnection):
+    return con.execute(SELECT_DATA).pl()
+
+
+def prepare_fsspec_parquet(con: duckdb.DuckDBPyConnection):
+    import fsspec
+
+    filesystem = fsspec.filesystem('memory')
+    con.register_filesystem(filesystem)
+    local_dir = tempfile.mkdtemp()
+    try:
+        local_file = os.path.join(local_dir, 'data.parquet')
+        con.execute(f"COPY data TO '{local_file}' (FORMAT PARQUET)")
+        filesystem.put(local_file, '/python_benchmark/data.parquet')
+    finally:
+        shutil.rmtree(local_dir)
+    return 'memory://python_benchmark/data.parquet'
+
+
+# how the input of a benchmark is created from the "data" table, this is not timed
+INPUTS = {
+    'table': prepare_table,
+    'rows': prepare_rows,
+    'pandas': prepare_pandas,
+    'arrow': prepare_arrow,
+    'polars': prepare_polars,
+    'fsspec_parquet': prepare_fsspec_parquet,
+}
+
+
+def create_target(con: duckdb.DuckDBPyConnection):
+    con.execute('CREATE OR REPLACE TABLE target AS FROM data LIMIT 0')
+
+
+def insert_rows(con: duckdb.DuckDBPyConnection, rows):
+    create_target(con)
+    column_count = len(con.table('data').columns)
+    con.executemany(f"INSERT INTO target VALUES ({', '.join('?' * column_count)})", rows)
+
+
+def append_pandas(con: duckdb.DuckDBPyConnection, df):
+    create_target(con)
+    con.append('target', df)
+
+
+def scan_replacement(con: duckdb.DuckDBPyConnection, input_data):
+    # found by the replacement scan through the name of the local variable
+    con.execute('CREATE OR REPLACE TABLE target AS SELECT * FROM input_data')
+
+
+def read_fsspec_parquet(con: duckdb.DuckDBPyConnection, path):
+    con.execute(f"CREATE OR REPLACE TABLE target AS SELECT * FROM read_parquet('{path}')")
+
+
+def consume_record_batches(con: duckdb.DuckDBPyConnection, _):
+    reader = con.execute(SELECT_DATA).fetch_record_batch()
+    for _ in reader:
+        pass
+
+
+def register_native_udf(con: duckdb.DuckDBPyConnection):
+    con.create_function('bench_udf', lambda x: x + 1, [BIGINT], BIGINT)
+
+
+def register_arrow_udf(con: duckdb.DuckDBPyConnection):
+    import pyarrow.compute as pc
+
+    con.create_function('bench_udf', lambda x: pc.add(x, 1), [BIGINT], BIGINT, type='arrow')
+
+
+def call_udf(con: duckdb.DuckDBPyConnection, _):
+    con.execute('SELECT sum(bench_udf(i)) FROM data').fetchall()
+
+
+def map_identity(con: duckdb.DuckDBPyConnection, _):
+    con.table('data').map(lambda df: df).aggregate('count(*)').fetchall()
+
+
+class PythonBenchmark(NamedTuple):
+    name: str
+    # key of INPUTS
+    input: str
+    # the timed action, called with the connection and the input
+    run: Callable[[duckdb.DuckDBPyConnection, Any], Any]
+    shapes: Tuple[str, ...] = ALL_SHAPES
+    # modules that have to be importable for the benchmark to run
+    requires: Tuple[str, ...] = ()
+    # cap on the number of rows, for the paths that go through Python row by row; larger row counts are lowered to it
+    max_rows: Optional[int] = None
+    # called once with the connection before the runs, this is not timed
+    setup: Optional[Callable[[duckdb.DuckDBPyConnection], None]] = None
+
+
+BENCHMARKS = [
+    # fetching results
+    PythonBenchmark('fetchall', 'table', lambda con, _: con.execute(SELECT_DATA).fetchall()),
+    PythonBenchmark('fetchnumpy', 'table', lambda con, _: con.execute(SELECT_DATA).fetchnumpy(), requires=('numpy',)),
+    PythonBenchmark('df', 'table', lambda con, _: con.execute(SELECT_DATA).df(), requires=('pandas',)),
+    PythonBenchmark('arrow', 'table', lambda con, _: con.execute(SELECT_DATA).arrow(), requires=('pyarrow',)),
+    PythonBenchmark('pl', 'table', lambda con, _: con.execute(SELECT_DATA).pl(), requires=('polars', 'pyarrow')),
+    PythonBenchmark('fetch_record_batch', 'table', consume_record_batches, requires=('pyarrow',)),
+    # ingesting data
+    PythonBenchmark('executemany', 'rows', insert_rows, shapes=ROW_SHAPES, max_rows=10000),
+    PythonBenchmark('append', 'pandas', append_pandas, requires=('pandas',)),
+    PythonBenchmark('scan_pandas', 'pandas', scan_replacement, requires=('pandas',)),
+    PythonBenchmark('scan_arrow', 'arrow', scan_replacement, requires=('pyarrow',)),
+    PythonBenchmark('scan_polars', 'polars', scan_replacement, requires=('polars', 'pyarrow')),
+    PythonBenchmark('fsspec_parquet', 'fsspec_parquet', read_fsspec_parquet, requires=('fsspec',)),
+    # calling into Python
+    PythonBenchmark(
+        'native_udf',
+        'table',
+        call_udf,
+        shapes=('narrow',),
+        max_rows=1000000,
+        setup=register_native_udf,
+    ),
+    PythonBenchmark(
+        'arrow_udf', 'table', call_udf, shapes=('narrow',), requires=('pyarrow',), setup=register_arrow_udf
+    ),
+    PythonBenchmark('map', 'table', map_identity, requires=('pandas',)),
+]
+
+
+def parse_int_list(value: str):
+    return [int(x) for x in value.split(',') if len(x) > 0]
+
+
+parser = argparse.ArgumentParser(description="Run the Python client benchmarks")
+parser.add_argument("--verbose", action="store_true", help="Enable verbose mode", default=False)
+parser.add_argument("--threads", type=parse_int_list, help="Comma separated thread counts", default=[1])
+parser.add_argument("--rows", type=parse_int_list, help="Comma separated row counts", default=[1000000])
+parser.add_argument("--shapes", type=str, help="Comma separated data shapes", default=','.join(ALL_SHAPES))
+parser.add_argument("--nruns", type=int, help="Number of timed runs", default=5)
+parser.add_argument("--filter", type=str, help="Regex that the benchmark names have to match", default=None)
+parser.add_argument("--list", action="store_true", help="List the benchmarks instead of running them")
+parser.add_argument("--out-file", type=str, help="Output file path", default=None)
+parser.add_argument("--history", type=str, help="Append the timings to a benchmark history database", default=None)
+
+
+@functools.lru_cache(maxsize=None)
+def is_available(module: str):
+    try:
+        importlib.import_module(module)
+        return True
+    except ImportError:
+        return False
+
+
+def benchmark_instances(args):
+    shapes = args.shapes.split(',')
+    for shape in shapes:
+        if shape not in SHAPES:
+            raise ValueError(f"Unknown data shape {shape}, expected one of {', '.join(ALL_SHAPES)}")
+    name_filter = re.compile(args.filter) if args.filter is not None else None
+    for benchmark in BENCHMARKS:
+        for shape in shapes:
+            if shape not in benchmark.shapes:
+                continue
+            row_counts = args.rows
+            if benchmark.max_rows is not None:
+                row_counts = sorted(set(min(rows, benchmark.max_rows) for rows in args.rows))
+            for rows in row_counts:
+                for threads in args.threads:
+                    name = f"python/{benchmark.name}/{shape}/rows={rows}/threads={threads}"
+                    if name_filter is not None and not name_filter.search(name):
+                        continue
+                    yield name, benchmark, shape, rows, threads
+
+
+def run_benchmark(benchmark: PythonBenchmark, shape: str, rows: int, threads: int, nruns: int):
+    con = duckdb.connect()
+    try:
+        con.execute(f"SET threads={threads}")
+        con.execute(f"CREATE TABLE data AS {SHAPES[shape].replace('{rows}', str(rows))}")
+        input_data = INPUTS[benchmark.input](con)
+        if benchmark.setup is not None:
+            benchmark.setup(con)
+        # warm-up run
+        benchmark.run(con, input_data)
+        timings = []
+        for _ in range(nruns):
+            start = time.perf_counter()
+            result = benchmark.run(con, input_data)
+            end = time.perf_counter()
+            del result
+            timings.append(end - start)
+        return timings
+    finally:
+        con.close()
+
+
+def main():
+    args = parser.parse_args()
+    instances = list(benchmark_instances(args))
+    if args.list:
+        for name, *_ in instances:
+            print(name)
+        return 0
+
+    out = open(args.out_file, 'w+') if args.out_file is not None else sys.stdout
+    history = None
+    run_id = None
+    if args.history is not None:
+        from benchmark_history import BenchmarkHistory, git_commit
+
+        history = BenchmarkHistory(args.history)
+        threads = args.threads[0] if len(args.threads) == 1 else None
+        run_id = history.start_run('python_benchmark_runner', threads, git_commit(), duckdb.__version__)
+    failed = False
+    try:
+        out.write("name\tnrun\ttiming\n")
+        for name, benchmark, shape, rows, threads in instances:
+            missing = [module for module in benchmark.requires if not is_available(module)]
+            if len(missing) > 0:
+                if args.verbose:
+                    print(f"Skipping {name}, missing module(s) {', '.join(missing)}", file=sys.stderr)
+                continue
+            if args.verbose:
+                print(f"Running {name}", file=sys.stderr)
+            try:
+                timings = run_benchmark(benchmark, shape, rows, threads, args.nruns)
+            except Exception as e:
+                print(f"Failed to run benchmark {name}: {e}", file=sys.stderr)
+                failed = True
+                continue
+            for nrun, timing in enumerate(timings):
+                out.write(f"{name}\t{nrun}\t{timing}\n")
+            out.flush()
+            if history is not None:
+                history.add_timings(run_id, name, timings)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+        if history is not None:
+            history.close()
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    exit(main())
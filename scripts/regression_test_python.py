@@ -23,6 +23,7 @@ parser.add_argument("--threads", type=int, help="Number of threads", default=Non
 parser.add_argument("--nruns", type=int, help="Number of runs", default=10)
 parser.add_argument("--out-file", type=str, help="Output file path", default=None)
 parser.add_argument("--scale-factor", type=float, help="Set the scale factor TPCH is generated at", default=1.0)
+parser.add_argument("--history", type=str, help="Append the timings to a benchmark history database", default=None)
 args, unknown_args = parser.parse_known_args()
 
 verbose = args.verbose
@@ -30,6 +31,7 @@ threads = args.threads
 nruns = args.nruns
 out_file = args.out_file
 scale_factor = args.scale_factor
+history_file = args.history
 
 if unknown_args:
     parser.error(f"Unrecognized parameter(s): {', '.join(unknown_args)}")
@@ -43,6 +45,15 @@ def print_msg(message: str):
 
 def write_result(benchmark_name, nrun, t):
     bench_result = f"{benchmark_name}\t{nrun}\t{t}"
+    if history_file is not None:
+        if not hasattr(write_result, 'history'):
+            from benchmark_history import BenchmarkHistory, git_commit
+
+            write_result.history = BenchmarkHistory(history_file)
+            write_result.run_id = write_result.history.start_run(
+                'regression_test_python', threads, git_commit(), duckdb.__version__
+            )
+        write_result.history.add_timings(write_result.run_id, benchmark_name, [t], nrun)
     if out_file is not None:
         if not hasattr(write_result, 'file'):
             write_result.file = open(out_file, 'w+')
@@ -53,6 +64,8 @@ def write_result(benchmark_name, nrun, t):
 
 
 def close_result():
+    if hasattr(write_result, 'history'):
+        write_result.history.close()
     if not hasattr(write_result, 'file'):
         return
     write_result.file.close()
@@ -7,6 +7,10 @@ import statistics
 import math
 import functools
 import shutil
+import random
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 print = functools.partial(print, flush=True)
 
@@ -35,6 +39,41 @@ number_repetitions = 5
 regression_threshold_percentage = 0.1
 # minimal seconds diff for something to be a regression (for very fast benchmarks)
 regression_threshold_seconds = 0.05
+# significance level of the statistical test
+significance_level = 0.05
+# number of resamples used for the bootstrap confidence interval
+bootstrap_resamples = 2000
+
+
+def print_usage():
+    print(
+        "Expected usage: python3 scripts/regression_test_runner.py --old=/old/benchmark_runner --new=/new/benchmark_runner --benchmarks=/benchmark/list.csv"
+    )
+    print("Optional arguments:")
+    print("  --threads=N        number of threads used by the benchmark runner")
+    print("  --rounds=N         number of interleaved old/new runs per benchmark (default: 1)")
+    print("  --warmup=N         number of discarded runs per benchmark and binary (default: 0)")
+    print("  --test=TEST        'mannwhitney' (default) or 'bootstrap'")
+    print("  --alpha=A          significance level of the test (default: 0.05)")
+    print("  --cpus=0-3,8       cores to run the benchmarks on (default: all available cores)")
+    print("  --pin              pin the benchmark processes to the selected cores")
+    print("  --parallel=N       run N benchmarks concurrently, each pinned to a disjoint set of cores")
+    print("  --verbose          print the output of the benchmark runner")
+    print("  --nofail           do not report regressions, only failures")
+    print("  --history=FILE     append all timings to a benchmark history database (see benchmark_history.py)")
+    exit(1)
+
+
+def parse_cpu_list(cpu_list):
+    cpus = []
+    for entry in cpu_list.split(','):
+        if '-' in entry:
+            start, end = entry.split('-')
+            cpus += list(range(int(start), int(end) + 1))
+        else:
+            cpus.append(int(entry))
+    return cpus
+
 
 old_runner = None
 new_runner = None
@@ -42,7 +81,14 @@ benchmark_file = None
 verbose = False
 threads = None
 no_regression_fail = False
-for arg in sys.argv:
+number_rounds = 1
+number_warmups = 0
+statistical_test = 'mannwhitney'
+pin_cpus = False
+parallel = 1
+cpus = None
+history_file = None
+for arg in sys.argv[1:]:
     if arg.startswith("--old="):
         old_runner = arg.replace("--old=", "")
     elif arg.startswith("--new="):
@@ -55,11 +101,39 @@ for arg in sys.argv:
         threads = int(arg.replace("--threads=", ""))
     elif arg.startswith("--nofail"):
         no_regression_fail = True
+    elif arg.startswith("--rounds="):
+        number_rounds = int(arg.replace("--rounds=", ""))
+    elif arg.startswith("--warmup="):
+        number_warmups = int(arg.replace("--warmup=", ""))
+    elif arg.startswith("--test="):
+        statistical_test = arg.replace("--test=", "")
+    elif arg.startswith("--alpha="):
+        significance_level = float(arg.replace("--alpha=", ""))
+    elif arg.startswith("--cpus="):
+        cpus = parse_cpu_list(arg.replace("--cpus=", ""))
+    elif arg == "--pin":
+        pin_cpus = True
+    elif arg.startswith("--parallel="):
+        parallel = int(arg.replace("--parallel=", ""))
+    elif arg.startswith("--history="):
+        history_file = arg.replace("--history=", "")
+    else:
+        print(f"Unrecognized argument {arg}")
+        print_usage()
 
 if old_runner is None or new_runner is None or benchmark_file is None:
-    print(
-        "Expected usage: python3 scripts/regression_test_runner.py --old=/old/benchmark_runner --new=/new/benchmark_runner --benchmarks=/benchmark/list.csv"
-    )
+    print_usage()
+
+if statistical_test not in ('mannwhitney', 'bootstrap'):
+    print(f"Unrecognized statistical test {statistical_test}, expected 'mannwhitney' or 'bootstrap'")
+    exit(1)
+
+if number_rounds < 1 or number_warmups < 0 or parallel < 1:
+    print("--rounds and --parallel must be at least 1, --warmup can not be negative")
+    exit(1)
+
+if parallel > 1 and number_warmups == 0:
+    print("--parallel requires at least one warm-up run to generate the benchmark data")
     exit(1)
 
 if not os.path.isfile(old_runner):
@@ -70,67 +144,232 @@ if not os.path.isfile(new_runner):
     print(f"Failed to find new runner {new_runner}")
     exit(1)
 
+can_pin = hasattr(os, 'sched_setaffinity')
+if parallel > 1:
+    # concurrent benchmarks that share cores would disturb each other's timings
+    pin_cpus = True
+if pin_cpus and not can_pin:
+    print("Pinning benchmarks to cores is not supported on this platform")
+    if parallel > 1:
+        exit(1)
+    pin_cpus = False
+if cpus is None:
+    cpus = sorted(os.sched_getaffinity(0)) if can_pin else list(range(os.cpu_count() or 1))
+
+# divide the cores over the benchmarks that run concurrently
+cpus_per_set = len(cpus) // parallel
+if threads is not None and pin_cpus:
+    cpus_per_set = min(cpus_per_set, threads)
+if cpus_per_set == 0:
+    print(f"Cannot run {parallel} benchmarks concurrently on {len(cpus)} cores")
+    exit(1)
+core_sets = queue.Queue()
+for i in range(parallel):
+    core_sets.put(cpus[i * cpus_per_set : (i + 1) * cpus_per_set])
+
 complete_timings = {old_runner: [], new_runner: []}
+output_lock = threading.Lock()
+
+history = None
+history_runs = {}
+if history_file is not None:
+    from benchmark_history import BenchmarkHistory, git_commit
 
+    history = BenchmarkHistory(history_file)
+    for runner, label in ((old_runner, 'old'), (new_runner, 'new')):
+        history_runs[runner] = history.start_run('benchmark_runner', threads, git_commit(runner), label)
 
-def run_benchmark(runner, benchmark):
+
+def run_benchmark(runner, benchmark, cores, record=True):
     benchmark_args = [runner, benchmark]
     if threads is not None:
         benchmark_args += ["--threads=%d" % (threads,)]
     timeout_seconds = 600
     try:
-        proc = subprocess.run(benchmark_args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, timeout=timeout_seconds)
-        out = proc.stdout.decode('utf8')
-        err = proc.stderr.decode('utf8')
+        proc = subprocess.Popen(benchmark_args, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        if pin_cpus:
+            # the runner has not started benchmarking yet, any threads it creates later inherit the affinity
+            try:
+                os.sched_setaffinity(proc.pid, cores)
+            except ProcessLookupError:
+                pass
+        try:
+            out, err = proc.communicate(timeout=timeout_seconds)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            raise
+        out = out.decode('utf8')
+        err = err.decode('utf8')
         returncode = proc.returncode
     except subprocess.TimeoutExpired:
-        print("Failed to run benchmark " + benchmark)
-        print(f"Aborted due to exceeding the limit of {timeout_seconds} seconds")
+        with output_lock:
+            print("Failed to run benchmark " + benchmark)
+            print(f"Aborted due to exceeding the limit of {timeout_seconds} seconds")
         return 'Failed to run benchmark ' + benchmark
     if returncode != 0:
-        print("Failed to run benchmark " + benchmark)
-        print(
-            '''====================================================
+        with output_lock:
+            print("Failed to run benchmark " + benchmark)
+            print(
+                '''====================================================
 ==============         STDERR          =============
 ====================================================
 '''
-        )
-        print(err)
-        print(
-            '''====================================================
+            )
+            print(err)
+            print(
+                '''====================================================
 ==============         STDOUT          =============
 ====================================================
 '''
-        )
-        print(out)
+            )
+            print(out)
         return 'Failed to run benchmark ' + benchmark
     if verbose:
-        print(err)
+        with output_lock:
+            print(err)
     # read the input CSV
     f = StringIO(err)
     csv_reader = csv.reader(f, delimiter='\t')
-    header = True
     timings = []
     try:
         for row in csv_reader:
-            if len(row) == 0:
+            # skip the banner and the header
+            if len(row) < 3 or row[2] == 'timing':
                 continue
-            if header:
-                header = False
-            else:
-                timings.append(row[2])
-                complete_timings[runner].append(row[2])
-        return float(statistics.median(timings))
+            # TIMEOUT or INCORRECT fail the benchmark
+            timings.append(float(row[2]))
+        if len(timings) == 0:
+            raise ValueError("no timings")
     except:
-        print("Failed to run benchmark " + benchmark)
-        print(err)
+        with output_lock:
+            print("Failed to run benchmark " + benchmark)
+            print(err)
         return 'Failed to run benchmark ' + benchmark
+    if record:
+        complete_timings[runner].extend(timings)
+    return timings
+
+
+def mann_whitney_greater(old, new):
+    """
+    One-sided Mann-Whitney U test of the hypothesis that the new timings are larger than the old ones.
+    Uses the normal approximation with a correction for ties, returns the p-value.
+    """
+    n_old = len(old)
+    n_new = len(new)
+    values = sorted([(x, 0) for x in old] + [(x, 1) for x in new])
+    # assign the average rank to tied values
+    rank_sum_new = 0.0
+    tie_correction = 0.0
+    i = 0
+    while i < len(values):
+        j = i
+        while j < len(values) and values[j][0] == values[i][0]:
+            j += 1
+        average_rank = (i + 1 + j) / 2.0
+        tied = j - i
+        tie_correction += tied**3 - tied
+        rank_sum_new += average_rank * sum(1 for k in range(i, j) if values[k][1] == 1)
+        i = j
+    u_new = rank_sum_new - n_new * (n_new + 1) / 2.0
+    n = n_old + n_new
+    mean_u = n_old * n_new / 2.0
+    variance_u = n_old * n_new / 12.0 * ((n + 1) - tie_correction / (n * (n - 1)))
+    if variance_u <= 0:
+        # all timings are identical
+        return 1.0
+    z = (u_new - mean_u - 0.5) / math.sqrt(variance_u)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def bootstrap_ratio_interval(old, new, seed):
+    """
+    Percentile bootstrap confidence interval of median(new) / median(old).
+    """
+    rng = random.Random(seed)
+    ratios = []
+    for _ in range(bootstrap_resamples):
+        old_median = statistics.median(rng.choices(old, k=len(old)))
+        new_median = statistics.median(rng.choices(new, k=len(new)))
+        ratios.append(new_median / old_median if old_median > 0 else math.inf)
+    ratios.sort()
+    lower = ratios[int(math.floor(significance_level / 2 * (len(ratios) - 1)))]
+    upper = ratios[int(math.ceil((1 - significance_level / 2) * (len(ratios) - 1)))]
+    return lower, upper
+
+
+def is_regression(benchmark, old, new):
+    """
+    Returns whether the new timings are a regression, together with a description of the test result.
+    A regression has to be both statistically significant and larger than the regression threshold.
+    """
+    old_median = statistics.median(old)
+    new_median = statistics.median(new)
+    exceeds_threshold = (old_median + regression_threshold_seconds) * (
+        1.0 + regression_threshold_percentage
+    ) < new_median
+    if statistical_test == 'mannwhitney':
+        p_value = mann_whitney_greater(old, new)
+        significant = p_value < significance_level
+        description = f"Mann-Whitney p-value: {p_value:.4f}"
+    else:
+        lower, upper = bootstrap_ratio_interval(old, new, benchmark)
+        significant = lower > 1.0
+        confidence = int(round((1 - significance_level) * 100))
+        description = f"{confidence}% confidence interval of new/old: [{lower:.3f}, {upper:.3f}]"
+    return exceeds_threshold and significant, description
 
 
-def run_benchmarks(runner, benchmark_list):
+def warm_up_benchmark(benchmark):
+    """
+    Runs both binaries for a benchmark without recording the timings.
+    This also generates the cached benchmark data, which is why the warm-up runs never run concurrently.
+    """
+    cores = core_sets.get()
+    try:
+        for _ in range(number_warmups):
+            for runner in (old_runner, new_runner):
+                res = run_benchmark(runner, benchmark, cores, record=False)
+                if isinstance(res, str):
+                    return res
+        return None
+    finally:
+        core_sets.put(cores)
+
+
+def measure_benchmark(benchmark):
+    """
+    Runs the old and the new binary for a benchmark in interleaved order.
+    The order alternates every round so that a gradual change of the machine state affects both binaries equally.
+    """
+    cores = core_sets.get()
+    try:
+        old_timings = []
+        new_timings = []
+        for round_idx in range(number_rounds):
+            order = [(old_runner, old_timings), (new_runner, new_timings)]
+            if round_idx % 2 == 1:
+                order.reverse()
+            for runner, timings in order:
+                res = run_benchmark(runner, benchmark, cores)
+                if isinstance(res, str):
+                    return (res, new_timings) if runner == old_runner else (old_timings, res)
+                timings.extend(res)
+        return old_timings, new_timings
+    finally:
+        core_sets.put(cores)
+
+
+def measure_benchmarks(benchmark_list):
     results = {}
     for benchmark in benchmark_list:
-        results[benchmark] = run_benchmark(runner, benchmark)
+        error = warm_up_benchmark(benchmark)
+        if error is not None:
+            results[benchmark] = (error, error)
+    remaining = [benchmark for benchmark in benchmark_list if benchmark not in results]
+    with ThreadPoolExecutor(max_workers=parallel) as executor:
+        results.update(zip(remaining, executor.map(measure_benchmark, remaining)))
     return results
 
 
@@ -138,9 +377,12 @@ def run_benchmarks(runner, benchmark_list):
 with open(benchmark_file, 'r') as f:
     benchmark_list = [x.strip() for x in f.read().split('\n') if len(x) > 0]
 
-multiply_percentage = 1.0 + regression_threshold_percentage
+if pin_cpus:
+    print(f"Running {parallel} benchmark(s) at a time, pinned to cores " + ", ".join(str(c) for c in cpus))
+
 other_results = []
 error_list = []
+history_run_counts = {}
 for i in range(number_repetitions):
     regression_list = []
     if len(benchmark_list) == 0:
@@ -153,21 +395,28 @@ for i in range(number_repetitions):
 '''
     )
 
-    old_results = run_benchmarks(old_runner, benchmark_list)
-    new_results = run_benchmarks(new_runner, benchmark_list)
+    results = measure_benchmarks(benchmark_list)
 
     for benchmark in benchmark_list:
-        old_res = old_results[benchmark]
-        new_res = new_results[benchmark]
+        old_res, new_res = results[benchmark]
+        if history is not None:
+            for runner, res in ((old_runner, old_res), (new_runner, new_res)):
+                if not isinstance(res, str):
+                    # the repeated measurements of a benchmark continue the run numbering
+                    first_run = history_run_counts.get((runner, benchmark), 0)
+                    history.add_timings(history_runs[runner], benchmark, res, first_run)
+                    history_run_counts[(runner, benchmark)] = first_run + len(res)
         if isinstance(old_res, str) or isinstance(new_res, str):
             # benchmark failed to run - always a regression
-            error_list.append([benchmark, old_res, new_res])
-        elif (no_regression_fail == False) and (
-            (old_res + regression_threshold_seconds) * multiply_percentage < new_res
-        ):
-            regression_list.append([benchmark, old_res, new_res])
+            error_list.append([benchmark, old_res, new_res, ''])
+            continue
+        old_median = statistics.median(old_res)
+        new_median = statistics.median(new_res)
+        regression, description = is_regression(benchmark, old_res, new_res)
+        if (no_regression_fail == False) and regression:
+            regression_list.append([benchmark, old_median, new_median, description])
         else:
-            other_results.append([benchmark, old_res, new_res])
+            other_results.append([benchmark, old_median, new_median, description])
     benchmark_list = [x[0] for x in regression_list]
 
 exit_code = 0
@@ -184,6 +433,8 @@ if len(regression_list) > 0:
         print(f"{regression[0]}")
         print(f"Old timing: {regression[1]}")
         print(f"New timing: {regression[2]}")
+        if regression[3]:
+            print(regression[3])
         print("")
     print(
         '''====================================================
@@ -204,6 +455,8 @@ for res in other_results:
     print(f"{res[0]}")
     print(f"Old timing: {res[1]}")
     print(f"New timing: {res[2]}")
+    if verbose:
+        print(res[3])
     print("")
 
 time_a = geomean(complete_timings[old_runner])
@@ -224,6 +477,9 @@ else:
     print(f"Old timing geometric mean: {time_a}")
     print(f"New timing geometric mean: {time_b}")
 
+if history is not None:
+    history.close()
+
 # nuke cached benchmark data between runs
 if os.path.isdir("duckdb_benchmark_data"):
     shutil.rmtree('duckdb_benchmark_data')
@@ -1,4 +1,5 @@
 from hashlib import md5
+from functools import lru_cache
 import gc
 
 from .base_statement import BaseStatement
@@ -31,13 +32,13 @@ import typing
 
 from .logger import SQLLogicTestLogger
 import duckdb
+import numpy as np
 import os
 import math
 import time
 import threading
 
 import re
-from functools import cmp_to_key
 from enum import Enum
 
 ### Helper structs
@@ -121,16 +122,42 @@ class FailException(TestException):
 
 class QueryResult:
     def __init__(self, result: List[Tuple[Any]], types: List[str], error: Optional[Exception] = None):
-        self._result = result
+        self._rows = result
+        # Set when the result was already converted to the sqllogictest string representation
+        self._columns: Optional[List[np.ndarray]] = None
         self.types = types
         self.error = error
         if not error:
             self._column_count = len(self.types)
             self._row_count = len(result)
 
+    @classmethod
+    def from_stringified_columns(cls, columns: List[np.ndarray], types: List[str]) -> "QueryResult":
+        result = cls([], types)
+        result._rows = None
+        result._columns = columns
+        result._row_count = len(columns[0]) if columns else 0
+        return result
+
+    @property
+    def _result(self) -> List[Tuple[Any]]:
+        if self._rows is None:
+            self._rows = list(zip(*self._columns))
+        return self._rows
+
     def get_value(self, column, row):
+        if self._columns is not None:
+            return self._columns[column][row]
         return self._result[row][column]
 
+    def stringified_values(self, is_sqlite_test: bool) -> List[str]:
+        if self._columns is None:
+            return duck_db_convert_result(self, is_sqlite_test)
+        if self._row_count == 0:
+            return []
+        # Interleave the columns into a row-major list of values
+        return np.column_stack(self._columns).ravel().tolist()
+
     def row_count(self) -> int:
         return self._row_count
 
@@ -174,32 +201,13 @@ class QueryResult:
             compare_hash = query_has_label or (runner.hash_threshold > 0 and total_value_count > runner.hash_threshold)
             is_hash = False
 
-        result_values_string = duck_db_convert_result(self, runner.original_sqlite_test)
+        result_values_string = self.stringified_values(runner.original_sqlite_test)
 
         if runner.output_result_mode:
             logger.output_result(self, result_values_string)
 
         if sort_style == SortStyle.ROW_SORT:
-            ncols = self.column_count
-            nrows = int(total_value_count / ncols)
-            rows = [result_values_string[i * ncols : (i + 1) * ncols] for i in range(nrows)]
-
-            # Define the comparison function
-            def compare_rows(a, b):
-                for col_idx, val in enumerate(a):
-                    a_val = val
-                    b_val = b[col_idx]
-                    if a_val != b_val:
-                        return -1 if a_val < b_val else 1
-                return 0
-
-            # Sort the individual rows based on element comparison
-            sorted_rows = sorted(rows, key=cmp_to_key(compare_rows))
-            rows = sorted_rows
-
-            for row_idx, row in enumerate(rows):
-                for col_idx, val in enumerate(row):
-                    result_values_string[row_idx * ncols + col_idx] = val
+            result_values_string = row_sort_values(result_values_string, self.column_count)
         elif sort_style == SortStyle.VALUE_SORT:
             result_values_string.sort()
 
@@ -208,10 +216,6 @@ class QueryResult:
             fname = context.replace_keywords(values[0])
             try:
                 comparison_values = load_result_from_file(fname, self)
-                # FIXME this is kind of dumb
-                # We concatenate it with tabs just so we can split it again later
-                for x in range(len(comparison_values)):
-                    comparison_values[x] = "\t".join(list(comparison_values[x]))
             except duckdb.Error as e:
                 logger.print_error_header(str(e))
                 context.fail(f"Failed to load result from {fname}")
@@ -220,11 +224,7 @@ class QueryResult:
 
         hash_value = ""
         if runner.output_hash_mode or compare_hash:
-            hash_context = md5()
-            for val in result_values_string:
-                hash_context.update(str(val).encode())
-                hash_context.update("\n".encode())
-            digest = hash_context.hexdigest()
+            digest = hash_values(result_values_string)
             hash_value = f"{total_value_count} values hashing to {digest}"
             if runner.output_hash_mode:
                 logger.output_hash(hash_value)
@@ -532,12 +532,21 @@ def result_is_file(result: str):
     return result.startswith('<FILE>:')
 
 
-def load_result_from_file(fname, result: QueryResult):
+def load_result_from_file(fname, result: QueryResult) -> List[str]:
+    fname = fname.replace("<FILE>:", "")
+    try:
+        modification_time = os.path.getmtime(fname)
+    except OSError:
+        # Let the CSV reader produce the error
+        modification_time = None
+    return list(load_result_file(fname, result.column_count, modification_time))
+
+
+# Result files are often compared against inside of loops, only parse them once
+@lru_cache(maxsize=16)
+def load_result_file(fname: str, column_count: int, modification_time: Optional[float]) -> Tuple[str, ...]:
     con = duckdb.connect()
     con.execute(f"PRAGMA threads={os.cpu_count()}")
-    column_count = result.column_count
-
-    fname = fname.replace("<FILE>:", "")
 
     struct_definition = "STRUCT_PACK("
     for i in range(column_count):
@@ -559,7 +568,27 @@ def load_result_from_file(fname, result: QueryResult):
     """
     )
 
-    return csv_result.fetchall()
+    # FIXME this is kind of dumb
+    # We concatenate it with tabs just so we can split it again later
+    return tuple("\t".join(row) for row in csv_result.fetchall())
+
+
+def row_sort_values(values: List[str], column_count: int) -> List[str]:
+    if not values:
+        return values
+    rows = np.array(values, dtype=object).reshape(-1, column_count)
+    # Stable sort on every column, starting with the last, results in the rows being sorted on all columns
+    order = np.arange(len(rows))
+    for column in reversed(range(column_count)):
+        order = order[np.argsort(rows[order, column], kind='stable')]
+    return rows[order].ravel().tolist()
+
+
+def hash_values(values: List[str]) -> str:
+    hash_context = md5()
+    if values:
+        hash_context.update(("\n".join(values) + "\n").encode())
+    return hash_context.hexdigest()
 
 
 def convert_value(value, type: str):
@@ -590,6 +619,22 @@ def sql_logic_test_convert_value(value, sql_type, is_sqlite_test: bool) -> str:
     return res
 
 
+def sql_logic_test_convert_expression(column: str, sql_type, is_sqlite_test: bool) -> str:
+    """
+    SQL equivalent of 'sql_logic_test_convert_value', used to convert an entire column in one go
+    """
+    if is_sqlite_test and (
+        sql_type in [duckdb.typing.BOOLEAN, duckdb.typing.DOUBLE, duckdb.typing.FLOAT]
+        or any([type_str in str(sql_type) for type_str in ['DECIMAL', 'HUGEINT']])
+    ):
+        converted = f"{column}::VARCHAR::BIGINT::VARCHAR"
+    elif sql_type == duckdb.typing.BOOLEAN:
+        converted = f"CASE WHEN {column} THEN '1' ELSE '0' END"
+    else:
+        converted = f"CASE WHEN {column}::VARCHAR = '' THEN '(empty)' ELSE replace({column}::VARCHAR, chr(0), '\\0') END"
+    return f"CASE WHEN {column} IS NULL THEN 'NULL' ELSE {converted} END"
+
+
 def duck_db_convert_result(result: QueryResult, is_sqlite_test: bool) -> List[str]:
     out_result = []
     row_count = result.row_count()
@@ -846,7 +891,12 @@ class SQLLogicContext:
                 # We create new names for the columns, because they might be duplicated
                 aliased_columns = [f'c{i}' for i in range(len(original_types))]
 
-                expressions = [f'"{name}"::VARCHAR' for name, sql_type in zip(aliased_columns, original_types)]
+                # Convert the values to their string representation for comparison in SQL
+                is_sqlite_test = self.runner.original_sqlite_test
+                expressions = []
+                for name, sql_type in zip(aliased_columns, original_types):
+                    expression = sql_logic_test_convert_expression(f'"{name}"', sql_type, is_sqlite_test)
+                    expressions.append(f'{expression} AS "{name}"')
                 aliased_table = ", ".join(aliased_columns)
                 expression_list = ", ".join(expressions)
                 try:
@@ -857,8 +907,10 @@ class SQLLogicContext:
                     stringified_rel = conn.query(transformed_query)
                 except duckdb.Error as e:
                     self.fail(f"Could not select from the ValueRelation: {str(e)}")
-                result = stringified_rel.fetchall()
-                query_result = QueryResult(result, original_types)
+                result = stringified_rel.fetchnumpy()
+                query_result = QueryResult.from_stringified_columns(
+                    [result[name] for name in aliased_columns], original_types
+                )
             elif duckdb.ExpectedResultType.CHANGED_ROWS in statement.expected_result_type:
                 conn.execute(sql_query)
                 result = conn.fetchall()
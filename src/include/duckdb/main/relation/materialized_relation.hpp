@@ -17,6 +17,9 @@ class MaterializedRelation : public Relation {
 public:
 	MaterializedRelation(const shared_ptr<ClientContext> &context, unique_ptr<ColumnDataCollection> &&collection,
 	                     vector<string> names, string alias = "materialized");
+	//! Creates a relation over a collection that can be shared with other relations
+	MaterializedRelation(const shared_ptr<ClientContext> &context, shared_ptr<ColumnDataCollection> collection,
+	                     vector<string> names, string alias = "materialized");
 	vector<ColumnDefinition> columns;
 	string alias;
 	shared_ptr<ColumnDataCollection> collection;
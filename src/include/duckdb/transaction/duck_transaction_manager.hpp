@@ -54,6 +54,11 @@ public:
 
 	//! Returns the current version of the catalog (incremented whenever anything changes, not stored between restarts)
 	DUCKDB_API idx_t GetCatalogVersion(Transaction &transaction);
+	//! Returns the current version of the data (incremented whenever a transaction that made changes commits, not
+	//! stored between restarts)
+	idx_t GetDataVersion() const {
+		return data_version;
+	}
 
 	void PushCatalogEntry(Transaction &transaction_p, CatalogEntry &entry, data_ptr_t extra_data = nullptr,
 	                      idx_t extra_data_size = 0);
@@ -109,6 +114,8 @@ private:
 
 	atomic<idx_t> last_uncommitted_catalog_version = {TRANSACTION_ID_START};
 	idx_t last_committed_version = 0;
+	//! The amount of committed transactions that made changes
+	atomic<idx_t> data_version = {0};
 
 protected:
 	virtual void OnCommitCheckpointDecision(const CheckpointDecision &decision, DuckTransaction &transaction) {
@@ -12,6 +12,13 @@ namespace duckdb {
 MaterializedRelation::MaterializedRelation(const shared_ptr<ClientContext> &context,
                                            unique_ptr<ColumnDataCollection> &&collection_p, vector<string> names,
                                            string alias_p)
+    : MaterializedRelation(context, shared_ptr<ColumnDataCollection>(std::move(collection_p)), std::move(names),
+                           std::move(alias_p)) {
+}
+
+MaterializedRelation::MaterializedRelation(const shared_ptr<ClientContext> &context,
+                                           shared_ptr<ColumnDataCollection> collection_p, vector<string> names,
+                                           string alias_p)
     : Relation(context, RelationType::MATERIALIZED_RELATION), alias(std::move(alias_p)),
       collection(std::move(collection_p)) {
 	// create constant expressions for the values
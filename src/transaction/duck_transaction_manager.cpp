@@ -224,6 +224,7 @@ ErrorData DuckTransactionManager::CommitTransaction(ClientContext &context, Tran
 		}
 	}
 
+	bool changes_made = transaction.ChangesMade();
 	// check if we can checkpoint
 	unique_ptr<StorageLockKey> lock;
 	auto undo_properties = transaction.GetUndoProperties();
@@ -268,6 +269,9 @@ ErrorData DuckTransactionManager::CommitTransaction(ClientContext &context, Tran
 		if (transaction.catalog_version >= TRANSACTION_ID_START) {
 			transaction.catalog_version = ++last_committed_version;
 		}
+		if (changes_made) {
+			data_version++;
+		}
 	}
 	OnCommitCheckpointDecision(checkpoint_decision, transaction);
 
@@ -13,6 +13,7 @@
 
 #include "pid.hpp"
 #include "duckdb/function/table/read_csv.hpp"
+#include <chrono>
 #include <cmath>
 #include <fstream>
 
@@ -25,6 +26,7 @@ static string custom_test_directory;
 static int debug_initialize_value = -1;
 static bool single_threaded = false;
 static case_insensitive_set_t required_requires;
+static string memory_leak_stats_path;
 
 bool NO_FAIL(QueryResult &result) {
 	if (result.HasError()) {
@@ -99,6 +101,34 @@ bool IsRequired(string require) {
 	return required_requires.count(require);
 }
 
+void SetMemoryLeakStatsPath(string path) {
+	memory_leak_stats_path = path;
+}
+
+void TestMemoryLeakStats(Connection &con) {
+	if (memory_leak_stats_path.empty()) {
+		return;
+	}
+	// the memory leak tests call this in a tight loop - only sample a few times per second
+	static std::chrono::steady_clock::time_point last_sample;
+	auto now = std::chrono::steady_clock::now();
+	if (now - last_sample < std::chrono::milliseconds(250)) {
+		return;
+	}
+	last_sample = now;
+	auto result = con.Query("SELECT tag, memory_usage_bytes, temporary_storage_bytes FROM duckdb_memory()");
+	if (result->HasError()) {
+		return;
+	}
+	// the timestamp is in seconds since the epoch, so the samples can be matched with the RSS of the process
+	auto timestamp = std::chrono::duration<double>(std::chrono::system_clock::now().time_since_epoch()).count();
+	std::ofstream out(memory_leak_stats_path, std::ios::app);
+	for (idx_t row = 0; row < result->RowCount(); row++) {
+		out << std::fixed << timestamp << "\t" << result->GetValue(0, row).ToString() << "\t"
+		    << result->GetValue(1, row).ToString() << "\t" << result->GetValue(2, row).ToString() << "\n";
+	}
+}
+
 string GetTestDirectory() {
 	if (custom_test_directory.empty()) {
 		return TESTING_DIRECTORY_NAME;
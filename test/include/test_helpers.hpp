@@ -47,6 +47,9 @@ void SetDebugInitialize(int value);
 void SetSingleThreaded();
 void AddRequire(string require);
 bool IsRequired(string require);
+void SetMemoryLeakStatsPath(string path);
+//! Appends the memory usage reported by duckdb_memory() to the file passed with --memory-leak-stats (if any)
+void TestMemoryLeakStats(Connection &con);
 string GetTestDirectory();
 string GetCSVPath();
 void WriteCSV(string path, const char *csv);
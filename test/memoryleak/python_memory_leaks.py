@@ -0,0 +1,121 @@
+# Memory leak scenarios for long-running Python client sessions
+# Like the [memoryleak] unittests these run forever, test_memory_leaks.py measures their memory usage
+# Usage: python3 test/memoryleak/python_memory_leaks.py <scenario> [--stats=file]
+import sys
+import time
+
+import duckdb
+
+STATS_INTERVAL = 0.25
+
+
+class MemoryStats:
+    """Appends the memory usage reported by duckdb_memory() to a file, in the format of the unittest"""
+
+    def __init__(self, path):
+        self.path = path
+        self.last_sample = 0
+
+    def sample(self, con):
+        if self.path is None:
+            return
+        now = time.time()
+        if now - self.last_sample < STATS_INTERVAL:
+            return
+        self.last_sample = now
+        rows = con.execute("SELECT tag, memory_usage_bytes, temporary_storage_bytes FROM duckdb_memory()").fetchall()
+        with open(self.path, 'a') as f:
+            for tag, memory_usage, temporary_storage in rows:
+                f.write(f"{now:.6f}\t{tag}\t{memory_usage}\t{temporary_storage}\n")
+
+
+def cursors(stats):
+    con = duckdb.connect()
+    con.execute("CREATE TABLE t1 AS SELECT i, concat('thisisalongstring', i) s FROM range(100000) t(i)")
+    while True:
+        stats.sample(con)
+        cursor = con.cursor()
+        cursor.execute("SELECT * FROM t1 WHERE i % 1000 = 0").fetchall()
+        cursor.close()
+
+
+def relations(stats):
+    con = duckdb.connect()
+    while True:
+        stats.sample(con)
+        rel = con.sql("SELECT i, i * 2 AS j FROM range(10000) t(i)")
+        rel.filter("i % 7 = 0").aggregate("sum(j)").fetchall()
+        rel.create_view("v1")
+        con.execute("DROP VIEW v1")
+
+
+def registered_objects(stats):
+    con = duckdb.connect()
+    try:
+        import pandas
+    except ImportError:
+        print("registered_objects requires pandas")
+        exit(1)
+    df = pandas.DataFrame({'i': range(10000), 's': [f'thisisalongstring{i}' for i in range(10000)]})
+    while True:
+        stats.sample(con)
+        con.register('df_view', df)
+        con.execute("SELECT count(*), max(s) FROM df_view").fetchall()
+        con.unregister('df_view')
+
+
+def udfs(stats):
+    from duckdb.typing import BIGINT
+
+    con = duckdb.connect()
+
+    def plus_one(x):
+        return x + 1
+
+    while True:
+        stats.sample(con)
+        con.create_function('plus_one', plus_one, [BIGINT], BIGINT)
+        con.execute("SELECT sum(plus_one(i)) FROM range(1000) t(i)").fetchall()
+        con.remove_function('plus_one')
+
+
+def prepared_parameters(stats):
+    con = duckdb.connect()
+    while True:
+        stats.sample(con)
+        con.execute("SELECT ?::VARCHAR || ?, ?", ['thisisalongstring', 42, [1, 2, 3]]).fetchall()
+
+
+SCENARIOS = {
+    'cursors': cursors,
+    'relations': relations,
+    'registered_objects': registered_objects,
+    'udfs': udfs,
+    'prepared_parameters': prepared_parameters,
+}
+
+
+def main():
+    if len(sys.argv) >= 2 and sys.argv[1] == '--list':
+        for name in SCENARIOS:
+            print(name)
+        return
+    stats_path = None
+    scenario = None
+    for arg in sys.argv[1:]:
+        if arg.startswith('--stats='):
+            stats_path = arg.replace('--stats=', '')
+        elif scenario is None and arg in SCENARIOS:
+            scenario = arg
+        else:
+            print(f"Usage: python3 {sys.argv[0]} [--list] <scenario> [--stats=file]")
+            print(f"Scenarios: {', '.join(SCENARIOS)}")
+            exit(1)
+    if scenario is None:
+        print(f"Usage: python3 {sys.argv[0]} [--list] <scenario> [--stats=file]")
+        exit(1)
+    SCENARIOS[scenario](MemoryStats(stats_path))
+
+
+if __name__ == '__main__':
+    main()
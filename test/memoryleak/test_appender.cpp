@@ -46,9 +46,12 @@ TEST_CASE("Test repeated appending small chunks to a table", "[memoryleak]") {
 		FAIL("Failed to set memory limit");
 	}
 
+	// the C API connection wraps a Connection, which is used to sample duckdb_memory()
+	auto &connection = *reinterpret_cast<Connection *>(con);
 	long n1 = 0;
 	double d1 = 0.5;
 	for (int i = 0; i < 100000; i++) {
+		TestMemoryLeakStats(connection);
 		duckdb_appender appender;
 		if (duckdb_appender_create(con, NULL, "test", &appender) == DuckDBError) {
 			FAIL("Failed to create appender");
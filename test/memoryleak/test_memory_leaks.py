@@ -2,6 +2,11 @@ import subprocess
 import time
 import argparse
 import os
+import re
+import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 parser = argparse.ArgumentParser(description='Runs the memory leak tests')
 
@@ -24,6 +29,7 @@ parser.add_argument(
     '--threshold-percentage',
     dest='threshold_percentage',
     action='store',
+    type=float,
     help='The percentage threshold before we consider an increase a regression',
     default=0.01,
 )
@@ -31,9 +37,39 @@ parser.add_argument(
     '--threshold-absolute',
     dest='threshold_absolute',
     action='store',
+    type=float,
     help='The absolute threshold before we consider an increase a regression',
     default=1000,
 )
+parser.add_argument(
+    '--parallel',
+    dest='parallel',
+    action='store',
+    type=int,
+    help='The number of tests to run concurrently',
+    default=1,
+)
+parser.add_argument(
+    '--timeline-dir',
+    dest='timeline_dir',
+    action='store',
+    help='Directory in which the memory timeline of every test is stored (as tab-separated values)',
+    default=None,
+)
+parser.add_argument(
+    '--python',
+    dest='python',
+    action='store_true',
+    help='Run the Python client session scenarios (python_memory_leaks.py) instead of the unittests',
+    default=False,
+)
+parser.add_argument(
+    '--python-executable',
+    dest='python_executable',
+    action='store',
+    help='The Python interpreter used to run the Python client session scenarios',
+    default=sys.executable,
+)
 parser.add_argument('--verbose', dest='verbose', action='store', help='Verbose output', default=True)
 
 args = parser.parse_args()
@@ -43,33 +79,40 @@ test_filter = args.test
 test_time = int(args.timeout)
 verbose = args.verbose
 measurements_per_second = 1.0
+# the window (in seconds) over which the memory usage must have stabilized
+stabilization_window = 10
+python_scenarios = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'python_memory_leaks.py')
+print_lock = threading.Lock()
 
-# get a list of all unittests
-proc = subprocess.Popen([unittest_program, '-l', '[memoryleak]'], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-stdout = proc.stdout.read().decode('utf8')
-stderr = proc.stderr.read().decode('utf8')
-if proc.returncode is not None and proc.returncode != 0:
-    print("Failed to run program " + unittest_program)
-    print(proc.returncode)
-    print(stdout)
-    print(stderr)
-    exit(1)
 
-test_cases = []
-first_line = True
-for line in stdout.splitlines():
-    if first_line:
-        first_line = False
-        continue
-    if len(line.strip()) == 0:
-        continue
-    splits = line.rsplit('\t', 1)
-    if test_filter == '*' or test_filter in splits[0]:
-        test_cases.append(splits[0])
+def list_tests():
+    if args.python:
+        command = [args.python_executable, python_scenarios, '--list']
+    else:
+        command = [unittest_program, '-l', '[memoryleak]']
+    proc = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    stdout, stderr = proc.communicate()
+    stdout = stdout.decode('utf8')
+    stderr = stderr.decode('utf8')
+    if proc.returncode != 0:
+        print("Failed to run program " + command[0])
+        print(proc.returncode)
+        print(stdout)
+        print(stderr)
+        exit(1)
 
-if len(test_cases) == 0:
-    print(f"No tests matching filter \"{test_filter}\" found")
-    exit(0)
+    test_cases = []
+    lines = stdout.splitlines()
+    if not args.python:
+        # skip the header of the unittest output
+        lines = lines[1:]
+    for line in lines:
+        if len(line.strip()) == 0:
+            continue
+        splits = line.rsplit('\t', 1)
+        if test_filter == '*' or test_filter in splits[0]:
+            test_cases.append(splits[0])
+    return test_cases
 
 
 def sizeof_fmt(num, suffix="B"):
@@ -80,81 +123,193 @@ def sizeof_fmt(num, suffix="B"):
     return f"{num:.1f}Yi{suffix}"
 
 
+def get_rss(pid):
+    statm = f'/proc/{pid}/statm'
+    if os.path.exists(statm):
+        with open(statm, 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    ps_proc = subprocess.Popen(f'ps -o rss= -p {pid}'.split(' '), stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    res = ps_proc.communicate()[0].decode('utf8').strip()
+    return int(res) * 1024
+
+
+def read_memory_stats(path):
+    """Reads the duckdb_memory() samples written by the test, as a dictionary of tag -> [(time, bytes)]"""
+    stats = {}
+    if not os.path.exists(path):
+        return stats
+    with open(path, 'r') as f:
+        for line in f:
+            splits = line.rstrip('\n').split('\t')
+            if len(splits) != 4:
+                # the last line might be partially written
+                continue
+            timestamp, tag, memory_usage, temporary_storage = splits
+            stats.setdefault(tag, []).append((float(timestamp), int(memory_usage)))
+    return stats
+
+
+def growth_slope(times, values):
+    """Least-squares fit of the memory growth, in bytes per second"""
+    if len(values) < 2:
+        return 0.0
+    mean_time = sum(times) / len(times)
+    mean_value = sum(values) / len(values)
+    covariance = sum((t - mean_time) * (v - mean_value) for t, v in zip(times, values))
+    variance = sum((t - mean_time) ** 2 for t in times)
+    if variance == 0:
+        return 0.0
+    return covariance / variance
+
+
+def has_memory_leak(times, rss):
+    if len(rss) <= int(measurements_per_second * stabilization_window):
+        # not enough measurements yet
+        return True
+    start = times[-1] - stabilization_window
+    window = [(t, memory) for t, memory in zip(times, rss) if t >= start]
+    slope = growth_slope([t for t, _ in window], [memory for _, memory in window])
+    growth = slope * stabilization_window
+    return growth > (max(rss) * args.threshold_percentage + args.threshold_absolute)
+
+
+def write_timeline(test_case, times, rss, stats):
+    os.makedirs(args.timeline_dir, exist_ok=True)
+    file_name = re.sub('[^a-zA-Z0-9_-]+', '_', test_case).strip('_') + '.tsv'
+    tags = sorted(stats.keys())
+    with open(os.path.join(args.timeline_dir, file_name), 'w') as f:
+        f.write('\t'.join(['source', 'time', 'bytes']) + '\n')
+        for t, memory in zip(times, rss):
+            f.write(f'rss\t{t - times[0]:.3f}\t{memory}\n')
+        for tag in tags:
+            for t, memory in stats[tag]:
+                f.write(f'{tag}\t{t - times[0]:.3f}\t{memory}\n')
+
+
+def read_output(output_file):
+    output_file.seek(0)
+    output = output_file.read().decode('utf8', errors='replace')
+    output_file.close()
+    return output
+
+
 def run_test(test_case):
-    # launch the unittest program
-    proc = subprocess.Popen(
-        [unittest_program, test_case, '--memory-leak-tests'], stdout=subprocess.PIPE, stderr=subprocess.PIPE
-    )
+    output = []
+    stats_file = tempfile.NamedTemporaryFile(prefix='duckdb_memory_leak_', suffix='.tsv', delete=False)
+    stats_file.close()
+    os.remove(stats_file.name)
+    # launch the test
+    if args.python:
+        command = [args.python_executable, python_scenarios, test_case, f'--stats={stats_file.name}']
+    else:
+        command = [unittest_program, test_case, '--memory-leak-stats', stats_file.name]
+    # the output goes to temporary files rather than pipes: nothing reads the pipes while the test runs, so a test
+    # that fills the pipe buffer would block (and stop allocating) until it is killed
+    stdout_file = tempfile.TemporaryFile()
+    stderr_file = tempfile.TemporaryFile()
+    proc = subprocess.Popen(command, stdout=stdout_file, stderr=stderr_file)
     pid = proc.pid
 
     # capture the memory output for the duration of the program running
     leak = True
+    times = []
     rss = []
+    start = time.time()
     for i in range(int(test_time * measurements_per_second)):
         time.sleep(1.0 / measurements_per_second)
         if proc.poll() is not None:
-            print("------------------------------------------------")
-            print("                    FAILURE                     ")
-            print("------------------------------------------------")
-            print("                    stdout:                     ")
-            print("------------------------------------------------")
-            print(proc.stdout.read().decode('utf8'))
-            print("------------------------------------------------")
-            print("                    stderr:                     ")
-            print("------------------------------------------------")
-            print(proc.stderr.read().decode('utf8'))
-            exit(1)
-        ps_proc = subprocess.Popen(f'ps -o rss= -p {pid}'.split(' '), stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        res = ps_proc.stdout.read().decode('utf8').strip()
-        memory_usage_in_bytes = int(res) * 1024
-        if verbose:
-            print(f"{i / measurements_per_second}: {sizeof_fmt(memory_usage_in_bytes)}")
-
+            output.append("------------------------------------------------")
+            output.append("                    FAILURE                     ")
+            output.append("------------------------------------------------")
+            output.append(f"Test case \"{test_case}\" exited")
+            output.append("------------------------------------------------")
+            output.append("                    stdout:                     ")
+            output.append("------------------------------------------------")
+            output.append(read_output(stdout_file))
+            output.append("------------------------------------------------")
+            output.append("                    stderr:                     ")
+            output.append("------------------------------------------------")
+            output.append(read_output(stderr_file))
+            if os.path.exists(stats_file.name):
+                os.remove(stats_file.name)
+            return False, output
+        memory_usage_in_bytes = get_rss(pid)
+        times.append(time.time())
         rss.append(memory_usage_in_bytes)
-        if not has_memory_leak(rss):
+        if not has_memory_leak(times, rss):
             leak = False
             break
 
     proc.terminate()
+    proc.wait()
+    stdout_file.close()
+    stderr_file.close()
+    stats = read_memory_stats(stats_file.name)
+    if os.path.exists(stats_file.name):
+        os.remove(stats_file.name)
+    if args.timeline_dir:
+        write_timeline(test_case, times, rss, stats)
+
     if leak:
-        print("------------------------------------------------")
-        print("                     ERROR                      ")
-        print("------------------------------------------------")
-        print(f"Memory leak detected in test case \"{test_case}\"")
-        print("------------------------------------------------")
+        output.append("------------------------------------------------")
+        output.append("                     ERROR                      ")
+        output.append("------------------------------------------------")
+        output.append(f"Memory leak detected in test case \"{test_case}\"")
+        output.append("------------------------------------------------")
     elif verbose:
-        print("------------------------------------------------")
-        print("                    Success!                    ")
-        print("------------------------------------------------")
-        print("------------------------------------------------")
-        print(f"No memory leaks detected in test case \"{test_case}\"")
-        print("------------------------------------------------")
+        output.append("------------------------------------------------")
+        output.append("                    Success!                    ")
+        output.append("------------------------------------------------")
+        output.append("------------------------------------------------")
+        output.append(f"No memory leaks detected in test case \"{test_case}\"")
+        output.append("------------------------------------------------")
     if verbose or leak:
-        print("Observed memory usages")
-        print("------------------------------------------------")
-        for i in range(len(rss)):
-            memory = rss[i]
-            print(f"{i / measurements_per_second}: {sizeof_fmt(memory)}")
-        if leak:
-            exit(1)
-
-
-def has_memory_leak(rss):
-    measurement_count = int(measurements_per_second * 10)
-    if len(rss) <= measurement_count:
-        # not enough measurements yet
-        return True
-    differences = []
-    for i in range(1, len(rss)):
-        differences.append(rss[i] - rss[i - 1])
-    max_memory = max(rss)
-    sum_differences = sum(differences[-measurement_count:])
-    return sum_differences > (max_memory * args.threshold_percentage + args.threshold_absolute)
+        output.append(f"RSS growth: {sizeof_fmt(growth_slope(times, rss))}/s over the whole run")
+        if stats:
+            # the growth per component of DuckDB shows which part of the system is leaking
+            output.append("DuckDB memory growth per tag")
+            output.append("------------------------------------------------")
+            slopes = []
+            for tag, samples in stats.items():
+                if not any(memory for _, memory in samples):
+                    continue
+                slope = growth_slope([t for t, _ in samples], [memory for _, memory in samples])
+                slopes.append((slope, tag, samples[-1][1]))
+            for slope, tag, last in sorted(slopes, reverse=True):
+                output.append(f"{tag}: {sizeof_fmt(slope)}/s (last: {sizeof_fmt(last)})")
+            output.append("------------------------------------------------")
+        output.append("Observed memory usages")
+        output.append("------------------------------------------------")
+        for t, memory in zip(times, rss):
+            output.append(f"{t - start:.1f}: {sizeof_fmt(memory)}")
+    return not leak, output
+
+
+def run_and_report(index, test_count, test_case):
+    success, output = run_test(test_case)
+    with print_lock:
+        print(f"[{index}/{test_count}] {test_case}")
+        for line in output:
+            print(line)
+    return success
+
 
+test_cases = list_tests()
+if len(test_cases) == 0:
+    print(f"No tests matching filter \"{test_filter}\" found")
+    exit(0)
 
 try:
-    for index, test in enumerate(test_cases):
-        print(f"[{index}/{len(test_cases)}] {test}")
-        run_test(test)
+    with ThreadPoolExecutor(max_workers=args.parallel) as executor:
+        results = list(
+            executor.map(
+                lambda x: run_and_report(x[0], len(test_cases), x[1]),
+                enumerate(test_cases),
+            )
+        )
 finally:
-    os.system('killall -9 unittest')
+    if not args.python:
+        os.system('killall -9 unittest')
+
+if not all(results):
+    exit(1)
@@ -18,6 +18,7 @@ TEST_CASE("Test in-memory database scanning from tables", "[memoryleak]") {
 	REQUIRE_NO_FAIL(
 	    con.Query("create table t1 as select i, concat('thisisalongstring', i) s from range(1000000) t(i);"));
 	while (true) {
+		TestMemoryLeakStats(con);
 		REQUIRE_NO_FAIL(con.Query("SELECT * FROM t1"));
 	}
 }
@@ -31,6 +32,7 @@ TEST_CASE("Rollback create table", "[memoryleak]") {
 	DuckDB db(":memory:", &config);
 	Connection con(db);
 	while (true) {
+		TestMemoryLeakStats(con);
 		REQUIRE_NO_FAIL(con.Query("BEGIN"));
 		REQUIRE_NO_FAIL(con.Query("CREATE TABLE t2(i INT);"));
 		REQUIRE_NO_FAIL(con.Query("ROLLBACK"));
@@ -54,6 +56,7 @@ TEST_CASE("DB temporary table insertion", "[memoryleak]") {
 	}
 	Connection con(db);
 	while (true) {
+		TestMemoryLeakStats(con);
 		REQUIRE_NO_FAIL(con.Query("BEGIN"));
 		REQUIRE_NO_FAIL(con.Query("CREATE OR REPLACE TEMPORARY TABLE t2(i int)"));
 		REQUIRE_NO_FAIL(con.Query("insert into t2 SELECT * FROM t1;"));
@@ -72,6 +75,7 @@ TEST_CASE("DB temporary table insertion", "[memoryleak]") {
 //	Connection con(db);
 //	REQUIRE_NO_FAIL(con.Query("CREATE TABLE t1(i INT);"));
 //	while (true) {
+//		TestMemoryLeakStats(con);
 //		REQUIRE_NO_FAIL(con.Query("INSERT INTO t1 SELECT * FROM range(100000)"));
 //		REQUIRE_NO_FAIL(con.Query("DELETE FROM t1"));
 //	}
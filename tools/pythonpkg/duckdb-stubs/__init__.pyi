@@ -8,6 +8,8 @@ import duckdb.typing as typing
 import duckdb.functional as functional
 from duckdb.typing import DuckDBPyType
 from duckdb.functional import FunctionNullHandling, PythonUDFType
+from duckdb.profiling import QueryProfile
+from duckdb.connection_pool import ConnectionPool
 from duckdb.value.constant import (
     Value,
     NullValue,
@@ -42,7 +44,7 @@ from duckdb.value.constant import (
 # We also run this in python3.7, where this is needed
 from typing_extensions import Literal
 # stubgen override - missing import of Set
-from typing import Any, ClassVar, Set, Optional, Callable
+from typing import Any, ClassVar, Set, Optional, Callable, Awaitable, AsyncIterator
 from io import StringIO, TextIOBase
 from pathlib import Path
 
@@ -200,6 +202,37 @@ class Statement:
     @property
     def type(self) -> StatementType: ...
 
+class PreparedStatement:
+    def __init__(self, *args, **kwargs) -> None: ...
+    def execute(self, parameters: object = None) -> PreparedStatement: ...
+    def executemany(self, parameters: object = None) -> PreparedStatement: ...
+    def relation(self, parameters: object = None, *, alias: str = "") -> DuckDBPyRelation: ...
+    def fetchone(self) -> Optional[tuple]: ...
+    def fetchmany(self, size: int = 1) -> List[Any]: ...
+    def fetchall(self) -> List[Any]: ...
+    def fetchnumpy(self) -> dict: ...
+    def fetchdf(self, *, date_as_object: bool = False) -> pandas.DataFrame: ...
+    def df(self, *, date_as_object: bool = False) -> pandas.DataFrame: ...
+    def fetch_arrow_table(self, rows_per_batch: int = 1000000) -> pyarrow.lib.Table: ...
+    def arrow(self, rows_per_batch: int = 1000000) -> pyarrow.lib.Table: ...
+    def pl(self, rows_per_batch: int = 1000000) -> polars.DataFrame: ...
+    def fetch_record_batch(self, rows_per_batch: int = 1000000, *, prefetch: int = 0) -> pyarrow.lib.RecordBatchReader: ...
+    def close(self) -> None: ...
+    @property
+    def query(self) -> str: ...
+    @property
+    def type(self) -> StatementType: ...
+    @property
+    def parameter_names(self) -> List[str]: ...
+    @property
+    def parameter_types(self) -> List[DuckDBPyType]: ...
+    @property
+    def columns(self) -> List[str]: ...
+    @property
+    def types(self) -> List[DuckDBPyType]: ...
+    @property
+    def description(self) -> List[Any]: ...
+
 class Expression:
     def __init__(self, *args, **kwargs) -> None: ...
     def __neg__(self) -> "Expression": ...
@@ -299,7 +332,14 @@ class DuckDBPyConnection:
     def row_type(self, fields: Union[Dict[str, DuckDBPyType], List[str]]) -> DuckDBPyType: ...
     def map_type(self, key: DuckDBPyType, value: DuckDBPyType) -> DuckDBPyType: ...
     def duplicate(self) -> DuckDBPyConnection: ...
-    def execute(self, query: object, parameters: object = None) -> DuckDBPyConnection: ...
+    def execute(self, query: object, parameters: object = None, *, profile: bool = False) -> DuckDBPyConnection: ...
+    def get_profile(self) -> QueryProfile: ...
+    def prepare(self, query: object) -> PreparedStatement: ...
+    def set_statement_cache_size(self, size: int) -> None: ...
+    def statement_cache_info(self) -> Dict[str, int]: ...
+    def set_result_cache_size(self, size: int) -> None: ...
+    def result_cache_info(self) -> Dict[str, int]: ...
+    def execute_async(self, query: object, parameters: object = None) -> Awaitable[DuckDBPyConnection]: ...
     def executemany(self, query: object, parameters: object = None) -> DuckDBPyConnection: ...
     def close(self) -> None: ...
     def interrupt(self) -> None: ...
@@ -314,7 +354,7 @@ class DuckDBPyConnection:
     def pl(self, rows_per_batch: int = 1000000) -> polars.DataFrame: ...
     def fetch_arrow_table(self, rows_per_batch: int = 1000000) -> pyarrow.lib.Table: ...
     def arrow(self, rows_per_batch: int = 1000000) -> pyarrow.lib.Table: ...
-    def fetch_record_batch(self, rows_per_batch: int = 1000000) -> pyarrow.lib.RecordBatchReader: ...
+    def fetch_record_batch(self, rows_per_batch: int = 1000000, *, prefetch: int = 0) -> pyarrow.lib.RecordBatchReader: ...
     def torch(self) -> dict: ...
     def tf(self) -> dict: ...
     def begin(self) -> DuckDBPyConnection: ...
@@ -421,12 +461,15 @@ class DuckDBPyRelation:
     def except_(self, other_rel: DuckDBPyRelation) -> DuckDBPyRelation: ...
     def execute(self, *args, **kwargs) -> DuckDBPyRelation: ...
     def explain(self, type: Optional[Literal['standard', 'analyze'] | int] = 'standard') -> str: ...
+    def profile(self) -> QueryProfile: ...
     def fetchall(self) -> List[Any]: ...
     def fetchmany(self, size: int = ...) -> List[Any]: ...
     def fetchnumpy(self) -> dict: ...
     def fetchone(self) -> Optional[tuple]: ...
     def fetchdf(self, *args, **kwargs) -> Any: ...
-    def fetch_arrow_reader(self, batch_size: int = ...) -> pyarrow.lib.RecordBatchReader: ...
+    def fetch_arrow_reader(self, batch_size: int = ..., *, prefetch: int = 0) -> pyarrow.lib.RecordBatchReader: ...
+    def fetch_arrow_async(self, batch_size: int = ...) -> Awaitable[pyarrow.lib.Table]: ...
+    def record_batches_async(self, batch_size: int = ...) -> AsyncIterator[pyarrow.lib.RecordBatch]: ...
     def fetch_arrow_table(self, rows_per_batch: int = ...) -> pyarrow.lib.Table: ...
     def filter(self, filter_expr: Union[Expression, str]) -> DuckDBPyRelation: ...
     def insert(self, values: object) -> None: ...
@@ -441,7 +484,7 @@ class DuckDBPyRelation:
     def select(self, *cols: Union[str, Expression]) -> DuckDBPyRelation: ...
     def pl(self, rows_per_batch: int = ..., connection: DuckDBPyConnection = ...) -> polars.DataFrame: ...
     def query(self, virtual_table_name: str, sql_query: str) -> DuckDBPyRelation: ...
-    def record_batch(self, batch_size: int = ...) -> pyarrow.lib.RecordBatchReader: ...
+    def record_batch(self, batch_size: int = ..., *, prefetch: int = 0) -> pyarrow.lib.RecordBatchReader: ...
     def select_types(self, types: List[Union[str, DuckDBPyType]]) -> DuckDBPyRelation: ...
     def select_dtypes(self, types: List[Union[str, DuckDBPyType]]) -> DuckDBPyRelation: ...
     def set_alias(self, alias: str) -> DuckDBPyRelation: ...
@@ -625,7 +668,14 @@ def struct_type(fields: Union[Dict[str, DuckDBPyType], List[str]], *, connection
 def row_type(fields: Union[Dict[str, DuckDBPyType], List[str]], *, connection: DuckDBPyConnection = ...) -> DuckDBPyType: ...
 def map_type(key: DuckDBPyType, value: DuckDBPyType, *, connection: DuckDBPyConnection = ...) -> DuckDBPyType: ...
 def duplicate(*, connection: DuckDBPyConnection = ...) -> DuckDBPyConnection: ...
-def execute(query: object, parameters: object = None, *, connection: DuckDBPyConnection = ...) -> DuckDBPyConnection: ...
+def execute(query: object, parameters: object = None, *, profile: bool = False, connection: DuckDBPyConnection = ...) -> DuckDBPyConnection: ...
+def get_profile(*, connection: DuckDBPyConnection = ...) -> QueryProfile: ...
+def prepare(query: object, *, connection: DuckDBPyConnection = ...) -> PreparedStatement: ...
+def set_statement_cache_size(size: int, *, connection: DuckDBPyConnection = ...) -> None: ...
+def statement_cache_info(*, connection: DuckDBPyConnection = ...) -> Dict[str, int]: ...
+def set_result_cache_size(size: int, *, connection: DuckDBPyConnection = ...) -> None: ...
+def result_cache_info(*, connection: DuckDBPyConnection = ...) -> Dict[str, int]: ...
+def execute_async(query: object, parameters: object = None, *, connection: DuckDBPyConnection = ...) -> Awaitable[DuckDBPyConnection]: ...
 def executemany(query: object, parameters: object = None, *, connection: DuckDBPyConnection = ...) -> DuckDBPyConnection: ...
 def close(*, connection: DuckDBPyConnection = ...) -> None: ...
 def interrupt(*, connection: DuckDBPyConnection = ...) -> None: ...
@@ -640,7 +690,7 @@ def fetch_df_chunk(vectors_per_chunk: int = 1, *, date_as_object: bool = False,
 def pl(rows_per_batch: int = 1000000, *, connection: DuckDBPyConnection = ...) -> polars.DataFrame: ...
 def fetch_arrow_table(rows_per_batch: int = 1000000, *, connection: DuckDBPyConnection = ...) -> pyarrow.lib.Table: ...
 def arrow(rows_per_batch: int = 1000000, *, connection: DuckDBPyConnection = ...) -> pyarrow.lib.Table: ...
-def fetch_record_batch(rows_per_batch: int = 1000000, *, connection: DuckDBPyConnection = ...) -> pyarrow.lib.RecordBatchReader: ...
+def fetch_record_batch(rows_per_batch: int = 1000000, *, prefetch: int = 0, connection: DuckDBPyConnection = ...) -> pyarrow.lib.RecordBatchReader: ...
 def torch(*, connection: DuckDBPyConnection = ...) -> dict: ...
 def tf(*, connection: DuckDBPyConnection = ...) -> dict: ...
 def begin(*, connection: DuckDBPyConnection = ...) -> DuckDBPyConnection: ...
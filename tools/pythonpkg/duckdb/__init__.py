@@ -15,6 +15,7 @@ from .duckdb import (
     DuckDBPyRelation,
     DuckDBPyConnection,
     Statement,
+    PreparedStatement,
     ExplainType,
     StatementType,
     ExpectedResultType,
@@ -32,6 +33,7 @@ from .duckdb import (
 _exported_symbols.extend([
     "DuckDBPyRelation",
     "DuckDBPyConnection",
+    "PreparedStatement",
     "ExplainType",
     "PythonExceptionHandling",
     "Expression",
@@ -80,6 +82,13 @@ from .duckdb import (
 	map_type,
 	duplicate,
 	execute,
+	get_profile,
+	prepare,
+	set_statement_cache_size,
+	statement_cache_info,
+	set_result_cache_size,
+	result_cache_info,
+	execute_async,
 	executemany,
 	close,
 	interrupt,
@@ -163,6 +172,13 @@ _exported_symbols.extend([
 	'map_type',
 	'duplicate',
 	'execute',
+	'get_profile',
+	'prepare',
+	'set_statement_cache_size',
+	'statement_cache_info',
+	'set_result_cache_size',
+	'result_cache_info',
+	'execute_async',
 	'executemany',
 	'close',
 	'interrupt',
@@ -290,6 +306,12 @@ _exported_symbols.extend([
     "connect"
 ])
 
+from .connection_pool import ConnectionPool
+
+_exported_symbols.extend([
+    "ConnectionPool"
+])
+
 # Exceptions
 from .duckdb import (
     Error,
@@ -0,0 +1,61 @@
+import asyncio
+from typing import Any, Callable
+
+
+class AsyncQuery:
+    """
+    An awaitable for work that runs on a background thread, created by the 'async' methods of the connection
+    and the relation.
+
+    'notify' is called by the background thread (holding the GIL) once the work is done, after which 'finish'
+    produces the result of the awaitable on the event loop.
+    Cancelling the awaitable calls 'interrupt', which interrupts the running query.
+    """
+
+    def __init__(self, finish: Callable[[], Any], interrupt: Callable[[], None]):
+        self._loop = asyncio.get_running_loop()
+        self._future = self._loop.create_future()
+        self._finish = finish
+        self._interrupt = interrupt
+        self._future.add_done_callback(self._on_done)
+
+    def notify(self) -> None:
+        self._loop.call_soon_threadsafe(self._complete)
+
+    def _complete(self) -> None:
+        if self._future.done():
+            # the awaitable was cancelled
+            return
+        try:
+            self._future.set_result(self._finish())
+        except BaseException as e:
+            self._future.set_exception(e)
+
+    def _on_done(self, future: asyncio.Future) -> None:
+        if future.cancelled():
+            self._interrupt()
+
+    def __await__(self):
+        return self._future.__await__()
+
+
+class AsyncRecordBatchIterator:
+    """
+    Asynchronously iterates over the record batches of a query result, created by 'record_batches_async'.
+    Every batch is fetched on a background thread.
+    """
+
+    def __init__(self, fetch_next: Callable[[], AsyncQuery]):
+        self._fetch_next = fetch_next
+
+    def __aiter__(self) -> "AsyncRecordBatchIterator":
+        return self
+
+    async def __anext__(self):
+        batch = await self._fetch_next()
+        if batch is None:
+            raise StopAsyncIteration
+        return batch
+
+
+__all__ = ["AsyncQuery", "AsyncRecordBatchIterator"]
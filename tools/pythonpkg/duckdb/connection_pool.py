@@ -0,0 +1,191 @@
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+import duckdb
+
+
+class ConnectionPool:
+    """
+    A thread-safe pool of connections to a single database.
+
+    All connections of the pool are cursors of the same database instance, so every thread that checked out a
+    connection can run a query concurrently with the other threads.
+
+    'size' is the maximum amount of connections, connections are only created when they are needed.
+    'timeout' is the default amount of seconds 'checkout' waits for a connection to become available (None waits
+    forever).
+    With 'reset' enabled a connection is replaced by a fresh connection when it is checked in, so settings, temporary
+    tables, registered objects and open transactions do not leak to the next user of the connection.
+    Otherwise only a transaction that was left open is rolled back.
+    With 'health_check' enabled a connection is verified with a trivial query before it is checked out, connections
+    that fail the check are replaced.
+    """
+
+    def __init__(
+        self,
+        database: str = ':memory:',
+        size: Optional[int] = None,
+        config: Optional[Dict[str, Any]] = None,
+        read_only: bool = False,
+        timeout: Optional[float] = None,
+        reset: bool = True,
+        health_check: bool = True,
+    ):
+        if size is None:
+            size = os.cpu_count() or 1
+        if size < 1:
+            raise duckdb.InvalidInputException("The size of a connection pool has to be at least 1")
+        self._database = duckdb.connect(database, read_only=read_only, config=config or {})
+        self._size = size
+        self._timeout = timeout
+        self._reset = reset
+        self._health_check = health_check
+        self._condition = threading.Condition()
+        self._idle = deque()
+        # the connections that are checked out, by their id
+        self._checked_out: Dict[int, duckdb.DuckDBPyConnection] = {}
+        self._connection_count = 0
+        self._closed = False
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def idle(self) -> int:
+        """The amount of connections that are available without creating a new connection"""
+        with self._condition:
+            return len(self._idle)
+
+    @property
+    def checked_out(self) -> int:
+        with self._condition:
+            return len(self._checked_out)
+
+    def _create_connection(self) -> duckdb.DuckDBPyConnection:
+        return self._database.cursor()
+
+    def _discard(self, connection: duckdb.DuckDBPyConnection) -> None:
+        try:
+            connection.close()
+        except duckdb.Error:
+            pass
+
+    def _is_healthy(self, connection: duckdb.DuckDBPyConnection) -> bool:
+        try:
+            return connection.execute('SELECT 1').fetchone() == (1,)
+        except duckdb.Error:
+            return False
+
+    def checkout(self, timeout: Optional[float] = ...) -> duckdb.DuckDBPyConnection:
+        """
+        Takes a connection from the pool, waiting at most 'timeout' seconds for a connection to become available.
+        Every connection that is checked out has to be returned with 'checkin'.
+        """
+        if timeout is ...:
+            timeout = self._timeout
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise duckdb.ConnectionException("Connection pool already closed!")
+                if self._idle:
+                    connection = self._idle.popleft()
+                    break
+                if self._connection_count < self._size:
+                    # reserve the slot, the connection is created outside of the lock
+                    self._connection_count += 1
+                    connection = None
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise duckdb.ConnectionException(
+                        f"Timed out waiting for a connection, all {self._size} connections of the pool are in use"
+                    )
+                self._condition.wait(remaining)
+
+        try:
+            if connection is None:
+                connection = self._create_connection()
+            elif self._health_check and not self._is_healthy(connection):
+                self._discard(connection)
+                connection = self._create_connection()
+        except BaseException:
+            with self._condition:
+                self._connection_count -= 1
+                self._condition.notify()
+            raise
+        with self._condition:
+            self._checked_out[id(connection)] = connection
+        return connection
+
+    def checkin(self, connection: duckdb.DuckDBPyConnection) -> None:
+        """Returns a connection that was taken from the pool with 'checkout'"""
+        with self._condition:
+            if id(connection) not in self._checked_out:
+                raise duckdb.InvalidInputException("This connection was not checked out from this pool")
+            del self._checked_out[id(connection)]
+            closed = self._closed
+
+        if closed:
+            self._discard(connection)
+            return
+        replacement = None
+        try:
+            if self._reset:
+                self._discard(connection)
+                replacement = self._create_connection()
+            else:
+                try:
+                    connection.rollback()
+                except duckdb.TransactionException:
+                    # there was no open transaction
+                    pass
+                replacement = connection
+        except duckdb.Error:
+            # the connection can not be reused, a new connection is created when it is needed
+            self._discard(connection)
+        with self._condition:
+            if replacement is None:
+                self._connection_count -= 1
+            else:
+                self._idle.append(replacement)
+            self._condition.notify()
+
+    @contextmanager
+    def connection(self, timeout: Optional[float] = ...) -> Iterator[duckdb.DuckDBPyConnection]:
+        """Checks out a connection for the duration of the 'with' block"""
+        connection = self.checkout(timeout)
+        try:
+            yield connection
+        finally:
+            self.checkin(connection)
+
+    def close(self) -> None:
+        """
+        Closes all connections of the pool and the database.
+        Connections that are still checked out are closed as well, checking them in afterwards is a no-op.
+        """
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._condition.notify_all()
+        for connection in idle:
+            self._discard(connection)
+        self._database.close()
+
+    def __enter__(self) -> "ConnectionPool":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self.close()
+
+
+__all__ = ["ConnectionPool"]
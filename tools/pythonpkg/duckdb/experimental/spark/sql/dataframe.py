@@ -3,6 +3,7 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Dict,
     List,
     Optional,
     Tuple,
@@ -33,13 +34,74 @@ from ..errors import PySparkValueError
 from .functions import _to_column_expr, col
 
 
+def _column_name(column: "ColumnOrName") -> str:
+    if isinstance(column, str):
+        return column
+    if isinstance(column, Column):
+        return str(column.expr).strip('"')
+    raise PySparkTypeError(
+        error_class="NOT_COLUMN_OR_STR",
+        message_parameters={"arg_name": "cols", "arg_type": type(column).__name__},
+    )
+
+
+def _references_any(expr: Expression, names: List[str]) -> bool:
+    # Conservative textual check, a false positive only costs us an extra projection
+    text = str(expr).casefold()
+    return "*" in text or any(name in text for name in names)
+
+
 class DataFrame:
-    def __init__(self, relation: duckdb.DuckDBPyRelation, session: "SparkSession"):
-        self.relation = relation
+    def __init__(self, relation: Optional[duckdb.DuckDBPyRelation], session: "SparkSession"):
+        self._relation = relation
         self.session = session
         self._schema = None
-        if self.relation is not None:
-            self._schema = duckdb_to_spark_schema(self.relation.columns, self.relation.types)
+        # Pending projection on top of '_projection_base', materialized on first access of 'relation'
+        # This lets chains of 'withColumn' collapse into a single projection
+        self._projection_base: Optional[duckdb.DuckDBPyRelation] = None
+        self._projection: List[Tuple[str, Expression]] = []
+        self._projection_defined: List[str] = []
+        # Hints and partitioning requested through 'hint', 'repartition' and 'coalesce'
+        self._hints: List[str] = []
+        self._num_partitions: Optional[int] = None
+        # The columns that are hashed to assign the rows to the partitions (all columns when empty)
+        self._partition_cols: List[str] = []
+
+    def _derive(self, relation: Optional[duckdb.DuckDBPyRelation]) -> "DataFrame":
+        # A DataFrame derived from this one (by a projection, filter, sort, ...) keeps its hints and partitioning
+        df = DataFrame(relation, self.session)
+        df._hints = list(self._hints)
+        df._num_partitions = self._num_partitions
+        df._partition_cols = list(self._partition_cols)
+        return df
+
+    def _copy(self) -> "DataFrame":
+        df = self._derive(self.relation)
+        df._schema = self._schema
+        return df
+
+    def _from_projection(
+        self,
+        base: duckdb.DuckDBPyRelation,
+        projection: List[Tuple[str, Expression]],
+        defined: List[str],
+    ) -> "DataFrame":
+        df = self._derive(None)
+        df._projection_base = base
+        df._projection = projection
+        df._projection_defined = defined
+        return df
+
+    @property
+    def relation(self) -> duckdb.DuckDBPyRelation:
+        if self._relation is None and self._projection_base is not None:
+            self._relation = self._projection_base.select(*[expr for _, expr in self._projection])
+        return self._relation
+
+    def _projection_columns(self) -> List[str]:
+        if self._projection_base is not None:
+            return [name for name, _ in self._projection]
+        return self.relation.columns
 
     def show(self, **kwargs) -> None:
         self.relation.show()
@@ -77,6 +139,7 @@ class DataFrame:
 
         """
         self.relation.create_view(name, True)
+        self.session._invalidate_statement_cache()
 
     def createGlobalTempView(self, name: str) -> None:
         raise NotImplementedError
@@ -91,7 +154,7 @@ class DataFrame:
                 col = col.alias(newName)
             cols.append(col)
         rel = self.relation.select(*cols)
-        return DataFrame(rel, self.session)
+        return self._derive(rel)
 
     def withColumn(self, columnName: str, col: Column) -> "DataFrame":
         if not isinstance(col, Column):
@@ -99,19 +162,79 @@ class DataFrame:
                 error_class="NOT_COLUMN",
                 message_parameters={"arg_name": "col", "arg_type": type(col).__name__},
             )
-        if columnName in self.relation:
-            # We want to replace the existing column with this new expression
-            cols = []
-            for x in self.relation.columns:
-                if x.casefold() == columnName.casefold():
-                    cols.append(col.expr.alias(columnName))
-                else:
-                    cols.append(ColumnExpression(x))
+        return self.withColumns({columnName: col})
+
+    def withColumns(self, *colsMap: Dict[str, Column]) -> "DataFrame":
+        """Returns a new :class:`DataFrame` by adding multiple columns or replacing the
+        existing columns that have the same names.
+
+        The colsMap is a map of column name and column, the column must only refer to attributes
+        supplied by this Dataset. It is an error to add columns that refer to some other Dataset.
+
+        Consecutive calls are collapsed into a single projection where possible.
+
+        Parameters
+        ----------
+        colsMap : dict
+            a dict of column name and :class:`Column`. Currently, only a single map is supported.
+
+        Returns
+        -------
+        :class:`DataFrame`
+            DataFrame with new or replaced columns.
+
+        Examples
+        --------
+        >>> df = spark.createDataFrame([(2, "Alice"), (5, "Bob")], schema=["age", "name"])
+        >>> df.withColumns({'age2': df.age + 2, 'age3': df.age + 3}).show()
+        +---+-----+----+----+
+        |age| name|age2|age3|
+        +---+-----+----+----+
+        |  2|Alice|   4|   5|
+        |  5|  Bob|   7|   8|
+        +---+-----+----+----+
+        """
+        # Below code is to help enable kwargs in future.
+        assert len(colsMap) == 1
+        colsMap = colsMap[0]  # type: ignore[assignment]
+
+        if not isinstance(colsMap, dict):
+            raise PySparkTypeError(
+                error_class="NOT_DICT",
+                message_parameters={"arg_name": "colsMap", "arg_type": type(colsMap).__name__},
+            )
+        for column in colsMap.values():
+            if not isinstance(column, Column):
+                raise PySparkTypeError(
+                    error_class="NOT_COLUMN",
+                    message_parameters={"arg_name": "col", "arg_type": type(column).__name__},
+                )
+
+        # Columns computed by the pending projection can't be referenced from within that same projection
+        expressions = [column.expr for column in colsMap.values()]
+        can_collapse = self._projection_base is not None and not any(
+            _references_any(expr, self._projection_defined) for expr in expressions
+        )
+        if can_collapse:
+            base = self._projection_base
+            projection = list(self._projection)
+            defined = list(self._projection_defined)
         else:
-            cols = [ColumnExpression(x) for x in self.relation.columns]
-            cols.append(col.expr.alias(columnName))
-        rel = self.relation.select(*cols)
-        return DataFrame(rel, self.session)
+            base = self.relation
+            projection = [(x, ColumnExpression(x)) for x in base.columns]
+            defined = []
+
+        for column_name, column in colsMap.items():
+            new_expr = column.expr.alias(column_name)
+            for i, (existing, _) in enumerate(projection):
+                if existing.casefold() == column_name.casefold():
+                    # We want to replace the existing column with this new expression
+                    projection[i] = (column_name, new_expr)
+                    break
+            else:
+                projection.append((column_name, new_expr))
+            defined.append(column_name.casefold())
+        return self._from_projection(base, projection, defined)
 
     def transform(
         self, func: Callable[..., "DataFrame"], *args: Any, **kwargs: Any
@@ -305,7 +428,7 @@ class DataFrame:
        
         columns = [_to_column_expr(c) for c in columns]
         rel = self.relation.sort(*columns)
-        return DataFrame(rel, self.session)
+        return self._derive(rel)
 
     orderBy = sort
 
@@ -381,7 +504,7 @@ class DataFrame:
                 message_parameters={"arg_name": "condition", "arg_type": type(condition).__name__},
             )
         rel = self.relation.filter(cond)
-        return DataFrame(rel, self.session)
+        return self._derive(rel)
 
     where = filter
 
@@ -398,7 +521,7 @@ class DataFrame:
                 cols.expr if isinstance(cols, Column) else ColumnExpression(cols)
             ]
         rel = self.relation.select(*projections)
-        return DataFrame(rel, self.session)
+        return self._derive(rel)
 
     @property
     def columns(self) -> List[str]:
@@ -551,8 +674,159 @@ class DataFrame:
 
             how = map_to_recognized_jointype(how)
             result = self.relation.join(other.relation, on, how)
+        # The hints and partitioning of the inputs don't carry over to the result of the join
         return DataFrame(result, self.session)
 
+    def hint(self, name: str, *parameters: Union[str, int, float, List]) -> "DataFrame":
+        """Specifies some hint on the current :class:`DataFrame`.
+
+        Hints are advisory only: they are kept on the DataFrame (and the DataFrames derived
+        from it), but DuckDB's optimizer picks the join order and the build side of a hash join
+        on its own, so a ``broadcast`` hint does not change the plan.
+
+        Parameters
+        ----------
+        name : str
+            A name of the hint.
+        parameters : str, list, float or int
+            Optional parameters.
+
+        Returns
+        -------
+        :class:`DataFrame`
+            Hinted DataFrame
+
+        Examples
+        --------
+        >>> df = spark.createDataFrame([(2, "Alice"), (5, "Bob")], schema=["age", "name"])
+        >>> df2 = spark.createDataFrame([Row(height=80, name="Tom"), Row(height=85, name="Bob")])
+        >>> df.join(df2, "name").explain()  # doctest: +SKIP
+        == Physical Plan ==
+        ...
+        ... +- BroadcastHashJoin ...
+        ...
+
+        Explicitly trigger the broadcast hashjoin by providing the hint in ``df2``.
+
+        >>> df.join(df2.hint("broadcast"), "name").explain()  # doctest: +SKIP
+        == Physical Plan ==
+        ...
+        ... +- BroadcastHashJoin ...
+        ...
+        """
+        if not isinstance(name, str):
+            raise PySparkTypeError(
+                error_class="NOT_STR",
+                message_parameters={"arg_name": "name", "arg_type": type(name).__name__},
+            )
+
+        allowed_types = (str, list, float, int)
+        for p in parameters:
+            if not isinstance(p, allowed_types):
+                raise PySparkTypeError(
+                    error_class="DISALLOWED_TYPE_FOR_CONTAINER",
+                    message_parameters={
+                        "arg_name": "parameters",
+                        "arg_type": type(parameters).__name__,
+                        "allowed_types": ", ".join(x.__name__ for x in allowed_types),
+                        "item_type": type(p).__name__,
+                    },
+                )
+
+        df = self._copy()
+        df._hints.append(name.lower())
+        return df
+
+    def repartition(self, numPartitions: Union[int, "ColumnOrName"], *cols: "ColumnOrName") -> "DataFrame":
+        """Returns a new :class:`DataFrame` partitioned by the given partitioning expressions.
+
+        The rows are assigned to the partitions by hashing the given columns (all columns when
+        none are given), every non-empty partition is written to its own file. Without a number
+        of partitions, the default of ``spark.sql.shuffle.partitions`` (200) is used.
+
+        Parameters
+        ----------
+        numPartitions : int
+            can be an int to specify the target number of partitions or a Column.
+            If it is a Column, it will be used as the first partitioning column.
+        cols : str or :class:`Column`
+            partitioning columns.
+
+        Returns
+        -------
+        :class:`DataFrame`
+            Repartitioned DataFrame.
+
+        Examples
+        --------
+        >>> df = spark.createDataFrame(
+        ...     [(14, "Tom"), (23, "Alice"), (16, "Bob")], ["age", "name"])
+
+        Repartition the data into 10 partitions.
+
+        >>> df.repartition(10).write.parquet("people")  # doctest: +SKIP
+
+        Repartition the data into 7 partitions by 'age' column, the rows with the same age
+        are written to the same file.
+
+        >>> df.repartition(7, "age").write.parquet("people")  # doctest: +SKIP
+        """
+        if isinstance(numPartitions, int) and not isinstance(numPartitions, bool):
+            if numPartitions <= 0:
+                raise PySparkValueError(
+                    error_class="VALUE_NOT_POSITIVE",
+                    message_parameters={"arg_name": "numPartitions", "arg_value": str(numPartitions)},
+                )
+        elif isinstance(numPartitions, (str, Column)):
+            cols = (numPartitions,) + cols
+            numPartitions = None
+        else:
+            raise PySparkTypeError(
+                error_class="NOT_COLUMN_OR_STR",
+                message_parameters={"arg_name": "numPartitions", "arg_type": type(numPartitions).__name__},
+            )
+
+        df = self._copy()
+        df._num_partitions = numPartitions
+        df._partition_cols = [_column_name(x) for x in cols]
+        return df
+
+    def coalesce(self, numPartitions: int) -> "DataFrame":
+        """Returns a new :class:`DataFrame` that has at most `numPartitions` partitions.
+
+        When the :class:`DataFrame` is written this bounds the number of output files,
+        ``coalesce(1)`` produces a single file.
+
+        Parameters
+        ----------
+        numPartitions : int
+            specify the target number of partitions
+
+        Returns
+        -------
+        :class:`DataFrame`
+
+        Examples
+        --------
+        >>> df = spark.range(10)
+        >>> df.coalesce(1).write.csv("numbers")  # doctest: +SKIP
+        """
+        if not isinstance(numPartitions, int) or isinstance(numPartitions, bool):
+            raise PySparkTypeError(
+                error_class="NOT_INT",
+                message_parameters={"arg_name": "numPartitions", "arg_type": type(numPartitions).__name__},
+            )
+        if numPartitions <= 0:
+            raise PySparkValueError(
+                error_class="VALUE_NOT_POSITIVE",
+                message_parameters={"arg_name": "numPartitions", "arg_value": str(numPartitions)},
+            )
+
+        df = self._copy()
+        if self._num_partitions is None or numPartitions < self._num_partitions:
+            df._num_partitions = numPartitions
+        return df
+
     def alias(self, alias: str) -> "DataFrame":
         """Returns a new :class:`DataFrame` with an alias set.
 
@@ -585,7 +859,7 @@ class DataFrame:
         +-----+-----+---+
         """
         assert isinstance(alias, str), "alias should be a string"
-        return DataFrame(self.relation.set_alias(alias), self.session)
+        return self._derive(self.relation.set_alias(alias))
 
     def drop(self, *cols: "ColumnOrName") -> "DataFrame":  # type: ignore[misc]
         if len(cols) == 1:
@@ -604,7 +878,7 @@ class DataFrame:
         # Filter out the columns that don't exist in the relation
         exclude = [x for x in exclude if x in self.relation.columns]
         expr = StarExpression(exclude=exclude)
-        return DataFrame(self.relation.select(expr), self.session)
+        return self._derive(self.relation.select(expr))
 
     def __repr__(self) -> str:
         return str(self.relation)
@@ -640,13 +914,13 @@ class DataFrame:
         +---+----+
         """
         rel = self.relation.limit(num)
-        return DataFrame(rel, self.session)
+        return self._derive(rel)
 
     def __contains__(self, item: str):
         """
         Check if the :class:`DataFrame` contains a column by the name of `item`
         """
-        return item in self.relation
+        return item in self._projection_columns()
 
     @property
     def schema(self) -> StructType:
@@ -658,6 +932,9 @@ class DataFrame:
         StructType([StructField('age', IntegerType(), True),
                     StructField('name', StringType(), True)])
         """
+        if self._schema is None:
+            relation = self.relation
+            self._schema = duckdb_to_spark_schema(relation.columns, relation.types)
         return self._schema
 
     @overload
@@ -691,7 +968,7 @@ class DataFrame:
         elif isinstance(item, (list, tuple)):
             return self.select(*item)
         elif isinstance(item, int):
-            return col(self._schema[item].name)
+            return col(self.schema[item].name)
         else:
             raise TypeError(f"Unexpected item type: {type(item)}")
 
@@ -703,7 +980,9 @@ class DataFrame:
         >>> df.select(df.age).collect()
         [Row(age=2), Row(age=5)]
         """
-        if name not in self.relation.columns:
+        # Private attributes are never columns, looking them up as a column on an instance that is not
+        # fully initialized (e.g. while unpickling or copying) would recurse into this method
+        if name.startswith("_") or name not in self._projection_columns():
             raise AttributeError(
                 "'%s' object has no attribute '%s'" % (self.__class__.__name__, name)
             )
@@ -961,7 +1240,7 @@ class DataFrame:
             rn_col = f"tmp_col_{uuid.uuid1().hex}"
             subset_str = ', '.join([f'"{c}"' for c in subset])
             window_spec = f"OVER(PARTITION BY {subset_str}) AS {rn_col}"
-            df = DataFrame(self.relation.row_number(window_spec, "*"), self.session)
+            df = self._derive(self.relation.row_number(window_spec, "*"))
             return df.filter(f"{rn_col} = 1").drop(rn_col)
 
         return self.distinct()
@@ -986,7 +1265,7 @@ class DataFrame:
         2
         """
         distinct_rel = self.relation.distinct()
-        return DataFrame(distinct_rel, self.session)
+        return self._derive(distinct_rel)
 
     def count(self) -> int:
         """Returns the number of rows in this :class:`DataFrame`.
@@ -1020,7 +1299,7 @@ class DataFrame:
         ]
         cast_expressions = ", ".join(cast_expressions)
         new_rel = self.relation.project(cast_expressions)
-        return DataFrame(new_rel, self.session)
+        return self._derive(new_rel)
 
     def toDF(self, *cols) -> "DataFrame":
         existing_columns = self.relation.columns
@@ -1035,7 +1314,7 @@ class DataFrame:
             existing.alias(new) for existing, new in zip(existing_columns, cols)
         ]
         new_rel = self.relation.project(*projections)
-        return DataFrame(new_rel, self.session)
+        return self._derive(new_rel)
 
     def collect(self) -> List[Row]:
         columns = self.relation.columns
@@ -1,4 +1,4 @@
-from typing import Any, Callable, Union, overload
+from typing import TYPE_CHECKING, Any, Callable, Union, overload
 
 from duckdb import (
     CaseExpression,
@@ -14,6 +14,9 @@ from ..exception import ContributionsAcceptedError
 from ._typing import ColumnOrName
 from .column import Column, _get_expr
 
+if TYPE_CHECKING:
+    from .dataframe import DataFrame
+
 
 def _invoke_function_over_columns(name: str, *cols: "ColumnOrName") -> Column:
     """
@@ -80,6 +83,39 @@ def struct(*cols: Column) -> Column:
     )
 
 
+def broadcast(df: "DataFrame") -> "DataFrame":
+    """
+    Marks a DataFrame as small enough for use in broadcast joins.
+
+    In DuckDB the hint is advisory only, the optimizer picks the build side of the hash join itself.
+
+    .. versionadded:: 1.6.0
+
+    .. versionchanged:: 3.4.0
+        Supports Spark Connect.
+
+    Returns
+    -------
+    :class:`~pyspark.sql.DataFrame`
+        DataFrame marked as ready for broadcast join.
+
+    Examples
+    --------
+    >>> from pyspark.sql import types
+    >>> df = spark.createDataFrame([1, 2, 3, 3, 4], types.IntegerType())
+    >>> df_small = spark.range(3)
+    >>> df_b = broadcast(df_small)
+    >>> df.join(df_b, df.value == df_small.id).show()
+    +-----+---+
+    |value| id|
+    +-----+---+
+    |    1|  1|
+    |    2|  2|
+    +-----+---+
+    """
+    return df.hint("broadcast")
+
+
 def lit(col: Any) -> Column:
     return col if isinstance(col, Column) else Column(ConstantExpression(col))
 
@@ -1,10 +1,15 @@
-from typing import TYPE_CHECKING, List, Optional, Union, cast
+from typing import TYPE_CHECKING, Callable, List, Optional, Tuple, Union, cast
+import os
+import shutil
+import uuid
+
+from duckdb import ColumnExpression, DuckDBPyRelation
 
 from ..exception import ContributionsAcceptedError
 from .types import StructType
 
 
-from ..errors import PySparkNotImplementedError, PySparkTypeError
+from ..errors import PySparkNotImplementedError, PySparkTypeError, PySparkValueError
 
 PrimitiveType = Union[bool, float, int, str]
 OptionalPrimitiveType = Optional[PrimitiveType]
@@ -14,13 +19,145 @@ if TYPE_CHECKING:
     from duckdb.experimental.spark.sql.session import SparkSession
 
 
+# Hidden column that assigns the rows of a write with a fixed number of partitions to the output files
+_PARTITION_COLUMN = "__pyspark_partition"
+
+# The default of 'spark.sql.shuffle.partitions', used when 'repartition' is only given columns
+_DEFAULT_SHUFFLE_PARTITIONS = 200
+
+
+def _quote_string(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _quote_identifier(value: str) -> str:
+    return '"' + value.replace('"', '""') + '"'
+
+
+def _write_partition_files(
+    relation: DuckDBPyRelation,
+    path: str,
+    num_partitions: int,
+    hash_cols: List[str],
+    hive_cols: List[str],
+    write: Callable[[DuckDBPyRelation, str, List[str]], None],
+) -> None:
+    # The rows are assigned to the partitions by hashing the columns (all of them when none are given that exist in
+    # the relation), this is computed in parallel, unlike a numbering of the rows. 'write' writes the relation
+    # hive-partitioned on the given columns, which are the hive columns followed by the partition column.
+    # The files are then moved from the partition directories into 'path', keeping the hive directories.
+    hash_cols = [x for x in hash_cols if x in relation.columns] or relation.columns
+    hashed = ", ".join(_quote_identifier(x) for x in hash_cols)
+    assignment = f"hash({hashed}) % {int(num_partitions)} AS {_quote_identifier(_PARTITION_COLUMN)}"
+    partitioned = relation.project(f"*, {assignment}")
+    os.makedirs(path, exist_ok=True)
+    staging_dir = os.path.join(path, f".pyspark_staging_{uuid.uuid1().hex}")
+    try:
+        write(partitioned, staging_dir, hive_cols + [_PARTITION_COLUMN])
+        for directory, _, file_names in os.walk(staging_dir):
+            if not file_names:
+                continue
+            *hive_dirs, partition_dir = os.path.relpath(directory, staging_dir).split(os.sep)
+            partition = int(partition_dir.split("=", 1)[1])
+            target_dir = os.path.join(path, *hive_dirs)
+            os.makedirs(target_dir, exist_ok=True)
+            # A partition can consist of multiple files, each of them gets its own name
+            for i, file_name in enumerate(sorted(file_names)):
+                # Keep the extension of the file, including the compression (e.g. '.csv.gz')
+                extension = file_name[file_name.index(".") :] if "." in file_name else ""
+                os.replace(
+                    os.path.join(directory, file_name),
+                    os.path.join(target_dir, f"part-{partition:05d}-{i:03d}{extension}"),
+                )
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+
+def _to_bool(value: PrimitiveType) -> bool:
+    if isinstance(value, str):
+        return value.lower() == "true"
+    return bool(value)
+
+
+def _to_str(value: PrimitiveType) -> str:
+    return str(value)
+
+
+# Maps the (lowercased) Spark reader options to the keyword arguments of DuckDB's readers
+_CSV_OPTIONS = {
+    "header": ("header", _to_bool),
+    "sep": ("sep", _to_str),
+    "delimiter": ("sep", _to_str),
+    "quote": ("quotechar", _to_str),
+    "escape": ("escapechar", _to_str),
+    "nullvalue": ("na_values", _to_str),
+    "encoding": ("encoding", _to_str),
+    "dateformat": ("date_format", _to_str),
+    "timestampformat": ("timestamp_format", _to_str),
+    "compression": ("compression", _to_str),
+}
+
+_READER_OPTIONS = {
+    "csv": _CSV_OPTIONS,
+    "tsv": _CSV_OPTIONS,
+    "json": {
+        "dateformat": ("date_format", _to_str),
+        "timestampformat": ("timestamp_format", _to_str),
+        "compression": ("compression", _to_str),
+    },
+    "parquet": {},
+}
+
+_FORMAT_EXTENSIONS = {
+    "csv": ".csv",
+    "tsv": ".tsv",
+    "json": ".json",
+    "parquet": ".parquet",
+}
+
+
+def _infer_format(path: str) -> str:
+    name = path.lower()
+    for compression in (".gz", ".zst"):
+        if name.endswith(compression):
+            name = name[: -len(compression)]
+    for format, extension in _FORMAT_EXTENSIONS.items():
+        if name.endswith(extension):
+            return format
+    # Same default as 'spark.sql.sources.default'
+    return "parquet"
+
+
+def _is_hive_partitioned(path: str) -> bool:
+    return any("=" in entry.name and entry.is_dir() for entry in os.scandir(path))
+
+
+def _expand_directory(path: str, format: str, recursive: bool) -> str:
+    if not os.path.isdir(path):
+        return path
+    pattern = "*" + _FORMAT_EXTENSIONS[format]
+    # Like Spark, subdirectories are only read when they are hive partitions or the lookup is recursive
+    if recursive or _is_hive_partitioned(path):
+        return os.path.join(path, "**", pattern)
+    return os.path.join(path, pattern)
+
+
 class DataFrameWriter:
     def __init__(self, dataframe: "DataFrame"):
         self.dataframe = dataframe
 
+    def _partitioning(self) -> Tuple[Optional[int], List[str]]:
+        # The number of files (per hive partition) and the columns that assign the rows to them
+        num_partitions = self.dataframe._num_partitions
+        hash_cols = self.dataframe._partition_cols
+        if num_partitions is None and hash_cols:
+            num_partitions = _DEFAULT_SHUFFLE_PARTITIONS
+        return num_partitions, hash_cols
+
     def saveAsTable(self, table_name: str) -> None:
         relation = self.dataframe.relation
         relation.create(table_name)
+        self.dataframe.session._invalidate_statement_cache()
 
     def parquet(
         self,
@@ -32,10 +169,35 @@ class DataFrameWriter:
         relation = self.dataframe.relation
         if mode:
             raise NotImplementedError
-        if partitionBy:
-            raise NotImplementedError
 
-        relation.write_parquet(path, compression=compression)
+        hive_cols = [partitionBy] if isinstance(partitionBy, str) else list(partitionBy or [])
+        num_partitions, hash_cols = self._partitioning()
+        if not hive_cols and num_partitions in (None, 1):
+            relation.write_parquet(path, compression=compression)
+            return
+
+        # 'write_parquet' can't produce multiple files, go through COPY instead
+        options = ["FORMAT PARQUET"]
+        if compression:
+            options.append(f"COMPRESSION {_quote_string(compression)}")
+
+        def copy(rel: DuckDBPyRelation, target: str, partition_cols: List[str]) -> None:
+            partition_list = ", ".join(_quote_identifier(x) for x in partition_cols)
+            self._copy(rel, target, options + [f"PARTITION_BY ({partition_list})"])
+
+        if num_partitions in (None, 1):
+            copy(relation, path, hive_cols)
+        else:
+            _write_partition_files(relation, path, num_partitions, hash_cols, hive_cols, copy)
+
+    def _copy(self, relation: DuckDBPyRelation, path: str, options: List[str]) -> None:
+        conn = self.dataframe.session.conn
+        view_name = f"pyspark_write_{uuid.uuid1().hex}"
+        relation.create_view(view_name)
+        try:
+            conn.execute(f"COPY {_quote_identifier(view_name)} TO {_quote_string(path)} ({', '.join(options)})")
+        finally:
+            conn.execute(f"DROP VIEW IF EXISTS {_quote_identifier(view_name)}")
 
     def csv(
         self,
@@ -73,8 +235,8 @@ class DataFrameWriter:
         if lineSep:
             raise NotImplementedError
         relation = self.dataframe.relation
-        relation.write_csv(
-            path,
+        num_partitions, hash_cols = self._partitioning()
+        options = dict(
             sep=sep,
             na_rep=nullValue,
             quotechar=quote,
@@ -86,6 +248,17 @@ class DataFrameWriter:
             date_format=dateFormat,
             timestamp_format=timestampFormat,
         )
+        if num_partitions in (None, 1):
+            relation.write_csv(path, **options)
+        else:
+            _write_partition_files(
+                relation,
+                path,
+                num_partitions,
+                hash_cols,
+                [],
+                lambda rel, target, partition_cols: rel.write_csv(target, partition_by=partition_cols, **options),
+            )
 
 
 class DataFrameReader:
@@ -99,35 +272,107 @@ class DataFrameReader:
         schema: Optional[Union[StructType, str]] = None,
         **options: OptionalPrimitiveType,
     ) -> "DataFrame":
-        from duckdb.experimental.spark.sql.dataframe import DataFrame
+        """Loads data from a data source and returns it as a :class:`DataFrame`.
 
-        if not isinstance(path, str):
-            raise ImportError
-        if options:
-            raise ContributionsAcceptedError
+        Multiple paths and globs are read by a single (parallel) multi-file scan.
+        Directories are expanded to the files of the given format they contain, including the
+        files in hive partitions. ``recursiveFileLookup`` reads the files in all subdirectories
+        instead, without discovering hive partitions.
 
-        rel = None
-        if format:
-            format = format.lower()
-            if format == "csv" or format == "tsv":
-                rel = self.session.conn.read_csv(path)
-            elif format == "json":
-                rel = self.session.conn.read_json(path)
-            elif format == "parquet":
-                rel = self.session.conn.read_parquet(path)
-            else:
-                raise ContributionsAcceptedError
+        Parameters
+        ----------
+        path : str or list, optional
+            optional string or a list of string for file-system backed data sources.
+        format : str, optional
+            optional string for format of the data source. Default to 'parquet',
+            unless it can be derived from the file extension.
+        schema : :class:`pyspark.sql.types.StructType`, optional
+            optional :class:`pyspark.sql.types.StructType` for the input schema.
+            For CSV and JSON the types are used while reading, no type detection is done.
+        **options : dict
+            all other string options
+
+        Examples
+        --------
+        Load two CSV files with a header, providing the schema up front.
+
+        >>> from pyspark.sql.types import StructType, StructField, LongType, StringType
+        >>> schema = StructType([StructField("age", LongType()), StructField("name", StringType())])
+        >>> df = spark.read.load(
+        ...     ["people1.csv", "people2.csv"], format="csv", schema=schema, header=True)  # doctest: +SKIP
+        >>> df.show()  # doctest: +SKIP
+        +---+-----+
+        |age| name|
+        +---+-----+
+        |100|  Tom|
+        | 23|Alice|
+        +---+-----+
+        """
+        from duckdb.experimental.spark.sql.dataframe import DataFrame
+
+        if path is None:
+            raise ContributionsAcceptedError("Loading a DataFrame without a 'path' is not supported")
+        if isinstance(path, str):
+            path = [path]
+        if not isinstance(path, list) or not path or not all(isinstance(x, str) for x in path):
+            raise PySparkTypeError(
+                error_class="NOT_STR_OR_LIST_OF_RDD",
+                message_parameters={
+                    "arg_name": "path",
+                    "arg_type": type(path).__name__,
+                },
+            )
+        if schema is not None and not isinstance(schema, StructType):
+            raise ContributionsAcceptedError("Only a StructType is supported as 'schema'")
+
+        # Option keys are case insensitive in Spark
+        options = {key.lower(): value for key, value in options.items() if value is not None}
+        format = format.lower() if format else _infer_format(path[0])
+        if format not in _FORMAT_EXTENSIONS:
+            raise ContributionsAcceptedError(f"The '{format}' format is not supported")
+
+        recursive = _to_bool(options.pop("recursivefilelookup", False))
+        merge_schema = _to_bool(options.pop("mergeschema", False))
+        has_directory = any(os.path.isdir(x) for x in path)
+        files = [_expand_directory(x, format, recursive) for x in path]
+
+        kwargs = {}
+        if merge_schema:
+            kwargs["union_by_name"] = True
+        if recursive:
+            kwargs["hive_partitioning"] = False
+        elif has_directory:
+            kwargs["hive_partitioning"] = True
+
+        supported_options = _READER_OPTIONS[format]
+        for key, value in options.items():
+            if key not in supported_options:
+                raise ContributionsAcceptedError(f"The '{key}' option is not supported for the '{format}' format")
+            name, convert = supported_options[key]
+            kwargs[name] = convert(value)
+
+        conn = self.session.conn
+        if format in ("csv", "tsv"):
+            if format == "tsv":
+                kwargs.setdefault("sep", "\t")
+            if schema is not None:
+                # Provide the types up front, this skips the sniffing of the types
+                types, names = schema.extract_types_and_names()
+                kwargs["columns"] = dict(zip(names, types))
+            rel = conn.read_csv(files, **kwargs)
+        elif format == "json":
+            if schema is not None:
+                types, names = schema.extract_types_and_names()
+                kwargs["columns"] = dict(zip(names, types))
+            rel = conn.read_json(files, **kwargs)
         else:
-            rel = self.session.conn.sql(f"select * from {path}")
-        df = DataFrame(rel, self.session)
-        if schema:
-            if not isinstance(schema, StructType):
-                raise ContributionsAcceptedError
-            schema = cast(StructType, schema)
-            types, names = schema.extract_types_and_names()
-            df = df._cast_types(types)
-            df = df.toDF(names)
-        raise NotImplementedError
+            rel = conn.read_parquet(files, **kwargs)
+            if schema is not None:
+                # Parquet files carry their own types, select and cast the requested fields
+                rel = rel.select(
+                    *[ColumnExpression(f.name).cast(f.dataType.duckdb_type).alias(f.name) for f in schema.fields]
+                )
+        return DataFrame(rel, self.session)
 
     def csv(
         self,
@@ -249,17 +494,12 @@ class DataFrameReader:
 
     def parquet(self, *paths: str, **options: "OptionalPrimitiveType") -> "DataFrame":
         input = list(paths)
-        if len(input) != 1:
-            raise NotImplementedError("Only single paths are supported for now")
-        option_amount = len(options.keys())
-        if option_amount != 0:
-            raise ContributionsAcceptedError("Options are not supported")
-        path = input[0]
-        rel = self.session.conn.read_parquet(path)
-        from ..sql.dataframe import DataFrame
-
-        df = DataFrame(rel, self.session)
-        return df
+        if len(input) == 0:
+            raise PySparkValueError(
+                error_class="CANNOT_BE_EMPTY",
+                message_parameters={"item": "paths"},
+            )
+        return self.load(input, format="parquet", **options)
 
     def json(
         self,
@@ -1,4 +1,6 @@
-from typing import Optional, List, Any, Union, Iterable, TYPE_CHECKING
+from collections import OrderedDict
+from typing import Optional, List, Dict, Any, Union, Iterable, Tuple, TYPE_CHECKING
+import re
 import uuid
 
 if TYPE_CHECKING:
@@ -32,6 +34,25 @@ from ..errors.error_classes import *
 # SparkContext can be compared to our Connection class, and SparkConf to our ClientContext class
 
 
+# The maximum number of prepared statements kept by a session for 'sql'
+_STATEMENT_CACHE_SIZE = 128
+
+# String literals and quoted identifiers, runs of whitespace and everything else
+_SQL_TOKENS = re.compile(r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|\s+|[^'\"\s]+|['\"]")
+
+
+def _normalize_sql(query: str) -> str:
+    # Whitespace outside of literals is collapsed, a newline is kept because it ends a '--' comment
+    tokens = _SQL_TOKENS.findall(query.strip().rstrip(";").rstrip())
+    return "".join(("\n" if "\n" in x else " ") if x.isspace() else x for x in tokens)
+
+
+def _parameter_types(args: Union[Dict[str, Any], List]) -> Tuple:
+    if isinstance(args, dict):
+        return tuple(sorted((name, type(value).__name__) for name, value in args.items()))
+    return tuple(type(value).__name__ for value in args)
+
+
 # data is a List of rows
 # every value in each row needs to be turned into a Value
 def _combine_data_and_schema(data: Iterable[Any], schema: StructType):
@@ -49,6 +70,36 @@ class SparkSession:
         self.conn = context.connection
         self._context = context
         self._conf = RuntimeConfig(self.conn)
+        # Prepared statements of 'sql', by normalized query and parameter types, in least recently used order
+        self._statement_cache: "OrderedDict[Tuple[str, Tuple], duckdb.PreparedStatement]" = OrderedDict()
+
+    def _invalidate_statement_cache(self) -> None:
+        # DuckDB rebinds a prepared statement when the catalog changed, dropping them frees the plans early
+        for statement in self._statement_cache.values():
+            statement.close()
+        self._statement_cache.clear()
+
+    def _cached_statement(
+        self, sqlQuery: str, args: Union[Dict[str, Any], List]
+    ) -> Optional["duckdb.PreparedStatement"]:
+        key = (_normalize_sql(sqlQuery), _parameter_types(args))
+        statement = self._statement_cache.get(key)
+        if statement is not None:
+            self._statement_cache.move_to_end(key)
+            return statement
+        try:
+            statement = self.conn.prepare(sqlQuery)
+        except duckdb.Error:
+            # e.g. multiple statements, 'sql' takes care of the (error) handling
+            return None
+        if statement.type != duckdb.StatementType.SELECT:
+            statement.close()
+            return None
+        self._statement_cache[key] = statement
+        if len(self._statement_cache) > _STATEMENT_CACHE_SIZE:
+            _, evicted = self._statement_cache.popitem(last=False)
+            evicted.close()
+        return statement
 
     def _create_dataframe(self, data: Union[Iterable[Any], "PandasDataFrame"]) -> DataFrame:
         try:
@@ -205,10 +256,20 @@ class SparkSession:
 
         return DataFrame(self.conn.table_function("range", parameters=[start, end, step]),self)
 
-    def sql(self, sqlQuery: str, **kwargs: Any) -> DataFrame:
+    def sql(
+        self, sqlQuery: str, args: Optional[Union[Dict[str, Any], List]] = None, **kwargs: Any
+    ) -> DataFrame:
         if kwargs:
             raise NotImplementedError
-        relation = self.conn.sql(sqlQuery)
+        if args is not None:
+            # Queries with parameters are prepared once, every call only binds the values and executes the plan
+            statement = self._cached_statement(sqlQuery, args)
+            if statement is not None:
+                return DataFrame(statement.relation(args), self)
+        relation = self.conn.sql(sqlQuery, params=args)
+        if relation is None:
+            # Not a query, this might have changed the catalog
+            self._invalidate_statement_cache()
         return DataFrame(relation, self)
 
     def stop(self) -> None:
@@ -21,6 +21,7 @@ class UDFRegistration:
         returnType: Optional["DataTypeOrString"] = None,
     ) -> "UserDefinedFunctionLike":
         self.sparkSession.conn.create_function(name, f, return_type=returnType)
+        self.sparkSession._invalidate_statement_cache()
 
     def registerJavaFunction(
         self,
@@ -0,0 +1,152 @@
+import json
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# The metrics of the query profiler, in the order they are presented
+METRICS = [
+    "operator_timing",
+    "cpu_time",
+    "operator_cardinality",
+    "cumulative_cardinality",
+    "operator_rows_scanned",
+    "cumulative_rows_scanned",
+]
+
+
+class ProfileNode:
+    """
+    An operator of a profiled query plan, with the metrics collected by the query profiler.
+    Metrics that were disabled through 'custom_profiling_settings' are None.
+    """
+
+    def __init__(self, name: str, metrics: Dict[str, Any], extra_info: Dict[str, Any], children: List["ProfileNode"]):
+        self.name = name
+        self.metrics = metrics
+        self.extra_info = extra_info
+        self.children = children
+
+    @classmethod
+    def from_dict(cls, node: dict) -> "ProfileNode":
+        metrics = {metric: node.get(metric) for metric in METRICS}
+        children = [cls.from_dict(child) for child in node.get("children", [])]
+        return cls(node.get("name", "").strip(), metrics, node.get("extra_info", {}), children)
+
+    @property
+    def operator_timing(self) -> Optional[float]:
+        return self.metrics["operator_timing"]
+
+    @property
+    def cpu_time(self) -> Optional[float]:
+        return self.metrics["cpu_time"]
+
+    @property
+    def operator_cardinality(self) -> Optional[int]:
+        return self.metrics["operator_cardinality"]
+
+    @property
+    def cumulative_cardinality(self) -> Optional[int]:
+        return self.metrics["cumulative_cardinality"]
+
+    @property
+    def operator_rows_scanned(self) -> Optional[int]:
+        return self.metrics["operator_rows_scanned"]
+
+    @property
+    def cumulative_rows_scanned(self) -> Optional[int]:
+        return self.metrics["cumulative_rows_scanned"]
+
+    def walk(self, depth: int = 0) -> Iterator[Tuple[int, "ProfileNode"]]:
+        """Yields (depth, node) for this node and all of its descendants, in pre-order"""
+        yield depth, self
+        for child in self.children:
+            yield from child.walk(depth + 1)
+
+    def __repr__(self) -> str:
+        return f"ProfileNode({self.name}, timing={self.operator_timing}, cardinality={self.operator_cardinality})"
+
+
+class QueryProfile:
+    """
+    The profile of a single query, as collected by the query profiler.
+
+    'latency' is the wall-clock time of the query, 'phase_timings' the time spent in the phases of the query
+    (planning, optimizing, ...) and 'children' the root operator(s) of the physical plan.
+    """
+
+    def __init__(
+        self,
+        query: str,
+        metrics: Dict[str, Any],
+        phase_timings: Dict[str, float],
+        children: List[ProfileNode],
+    ):
+        self.query = query
+        self.metrics = metrics
+        self.phase_timings = phase_timings
+        self.children = children
+
+    @classmethod
+    def from_json(cls, profile: str) -> "QueryProfile":
+        data = json.loads(profile)
+        if "result" in data:
+            raise ValueError(f"The query profile is not available: {data['result']}")
+        metrics = {metric: data.get(metric) for metric in METRICS}
+        phase_timings = {timing["annotation"]: timing["timing"] for timing in data.get("timings", [])}
+        children = [ProfileNode.from_dict(child) for child in data.get("children", [])]
+        return cls(data.get("query", ""), metrics, phase_timings, children)
+
+    @property
+    def latency(self) -> Optional[float]:
+        return self.metrics["operator_timing"]
+
+    @property
+    def cpu_time(self) -> Optional[float]:
+        return self.metrics["cpu_time"]
+
+    def walk(self) -> Iterator[Tuple[int, ProfileNode]]:
+        """Yields (depth, node) for every operator of the plan, in pre-order"""
+        for child in self.children:
+            yield from child.walk()
+
+    def operators(self) -> List[ProfileNode]:
+        return [node for _, node in self.walk()]
+
+    def to_dict(self) -> Dict[str, list]:
+        """
+        Flattens the operator tree to one row per operator, as a dictionary of columns.
+        'operator_id' numbers the operators in pre-order, 'parent_id' refers to the parent operator.
+        """
+        columns = {"operator_id": [], "parent_id": [], "depth": [], "name": []}
+        for metric in METRICS:
+            columns[metric] = []
+        columns["extra_info"] = []
+
+        parents: List[int] = []
+        for operator_id, (depth, node) in enumerate(self.walk()):
+            del parents[depth:]
+            columns["operator_id"].append(operator_id)
+            columns["parent_id"].append(parents[-1] if parents else None)
+            columns["depth"].append(depth)
+            columns["name"].append(node.name)
+            for metric in METRICS:
+                columns[metric].append(node.metrics[metric])
+            columns["extra_info"].append(json.dumps(node.extra_info))
+            parents.append(operator_id)
+        return columns
+
+    def df(self):
+        """Returns the operators of the plan as a pandas DataFrame, one row per operator"""
+        import pandas
+
+        return pandas.DataFrame(self.to_dict())
+
+    def arrow(self):
+        """Returns the operators of the plan as an Arrow table, one row per operator"""
+        import pyarrow
+
+        return pyarrow.table(self.to_dict())
+
+    def __repr__(self) -> str:
+        return f"QueryProfile(latency={self.latency}, operators={len(self.operators())})"
+
+
+__all__ = ["ProfileNode", "QueryProfile"]
@@ -2,6 +2,8 @@ import json
 import os
 import sys
 import webbrowser
+import hashlib
+import html as html_lib
 from functools import reduce
 import argparse
 
@@ -44,8 +46,36 @@ qgraph_css = """
 	text-align: center;
 	background-color: #fff100;
 }
+
+.slower {
+	color: #c0392b;
+	font-weight: bold;
+}
+
+.faster {
+	color: #1e8449;
+	font-weight: bold;
+}
+
+.added {
+	border: 2px dashed #1e8449 !important;
+}
+
+.removed {
+	border: 2px dashed #c0392b !important;
+	opacity: 0.6;
+}
+
+.replaced {
+	border: 2px dashed #d68910 !important;
+}
 """
 
+# relative change below which a timing or cardinality difference is not highlighted
+DIFF_THRESHOLD = 0.1
+# minimal timing difference in seconds to highlight, fast operators are too noisy
+DIFF_MIN_SECONDS = 0.001
+
 
 class NodeTiming:
 
@@ -148,7 +178,7 @@ def generate_tree_recursive(json_graph: object) -> str:
     node_body = get_node_body(json_graph["name"],
                               json_graph["operator_timing"],
                               json_graph["operator_cardinality"],
-                              json_graph["extra_info"].replace("\n", "<br>"))
+                              format_extra_info(json_graph["extra_info"]))
 
     children_html = ""
     if len(json_graph['children']) >= 1:
@@ -243,6 +273,352 @@ def gather_timing_information(json: str, query_timings: object) -> None:
     get_child_timings(json['children'][0], query_timings)
 
 
+def format_extra_info(extra_info: object) -> str:
+    if isinstance(extra_info, dict):
+        lines = []
+        for key, value in extra_info.items():
+            if isinstance(value, list):
+                value = "<br>".join(html_lib.escape(str(x)) for x in value)
+            else:
+                value = html_lib.escape(str(value))
+            lines.append(f"{html_lib.escape(str(key))}: {value}")
+        return "<br>".join(lines)
+    return str(extra_info or "").replace("\n", "<br>")
+
+
+def align_children(base_children: list, new_children: list) -> list:
+    """
+    Aligns the children of two matched operators on their names, using the longest common subsequence.
+    Returns a list of (base, new) pairs, where either side is None for an operator that only exists in one plan.
+    """
+    base_names = [child['name'] for child in base_children]
+    new_names = [child['name'] for child in new_children]
+    lengths = [[0] * (len(new_names) + 1) for _ in range(len(base_names) + 1)]
+    for i in range(len(base_names) - 1, -1, -1):
+        for j in range(len(new_names) - 1, -1, -1):
+            if base_names[i] == new_names[j]:
+                lengths[i][j] = lengths[i + 1][j + 1] + 1
+            else:
+                lengths[i][j] = max(lengths[i + 1][j], lengths[i][j + 1])
+    pairs = []
+    i = 0
+    j = 0
+    while i < len(base_names) and j < len(new_names):
+        if base_names[i] == new_names[j]:
+            pairs.append((base_children[i], new_children[j]))
+            i += 1
+            j += 1
+        elif lengths[i + 1][j] >= lengths[i][j + 1]:
+            pairs.append((base_children[i], None))
+            i += 1
+        else:
+            pairs.append((None, new_children[j]))
+            j += 1
+    pairs += [(child, None) for child in base_children[i:]]
+    pairs += [(None, child) for child in new_children[j:]]
+    return pairs
+
+
+def align_profiles(base: object, new: object) -> dict:
+    """
+    Aligns the operator trees of two profiles structurally.
+    Every node of the result has the 'base' and 'new' operator (or None) and the aligned 'children'.
+    Two operators in the same position with different names are marked as 'replaced', their children are still
+    compared: a plan change at the root should not hide that the rest of the plan is identical.
+    """
+    if base is None or new is None:
+        node = base if base is not None else new
+        children = [
+            align_profiles(child, None) if base is not None else align_profiles(None, child)
+            for child in node['children']
+        ]
+        return {'base': base, 'new': new, 'replaced': False, 'children': children}
+    children = [align_profiles(b, n) for b, n in align_children(base['children'], new['children'])]
+    return {'base': base, 'new': new, 'replaced': base['name'] != new['name'], 'children': children}
+
+
+def relative_change(base: float, new: float) -> float:
+    if base == 0:
+        return 0.0 if new == 0 else float('inf')
+    return (new - base) / base
+
+
+def format_metric(value: object) -> str:
+    # metrics that are disabled in the profiler settings are missing or null
+    return "n/a" if value is None else str(value)
+
+
+def format_delta(base: float, new: float, is_timing: bool) -> str:
+    if base is None or new is None:
+        return f"{format_metric(base)} &rarr; {format_metric(new)}"
+    change = relative_change(base, new)
+    text = f"{base} &rarr; {new} ({change * 100:+.1f}%)" if change != float('inf') else f"{base} &rarr; {new}"
+    significant = abs(change) > DIFF_THRESHOLD
+    if is_timing:
+        significant = significant and abs(new - base) > DIFF_MIN_SECONDS
+    if not significant:
+        return text
+    css_class = "slower" if new > base else "faster"
+    if not is_timing:
+        # a change in cardinality is neither good nor bad by itself
+        css_class = "slower"
+    return f"<span class=\"{css_class}\">{text}</span>"
+
+
+def get_diff_node_body(node: dict) -> str:
+    base = node['base']
+    new = node['new']
+    operator = new if new is not None else base
+    name = operator['name']
+    node_style = ""
+    stripped_name = name.strip()
+    if stripped_name in color_map:
+        node_style = f"background-color: {color_map[stripped_name]};"
+    css_class = "tf-nc"
+    if base is None:
+        css_class += " added"
+    elif new is None:
+        css_class += " removed"
+    elif node['replaced']:
+        css_class += " replaced"
+
+    body = f"<span class=\"{css_class}\" style=\"{node_style}\">"
+    body += "<div class=\"node-body\">"
+    body += f"<p> <b>{name.replace('_', ' ')}</b></p>"
+    if base is not None and new is not None:
+        if node['replaced']:
+            body += f"<p> <i>replaces {base['name'].replace('_', ' ')}</i> </p>"
+        body += f"<p> time: {format_delta(base.get('operator_timing'), new.get('operator_timing'), True)}s </p>"
+        body += (
+            f"<p> cardinality: "
+            f"{format_delta(base.get('operator_cardinality'), new.get('operator_cardinality'), False)} </p>"
+        )
+    else:
+        label = "only in new profile" if base is None else "only in base profile"
+        body += f"<p> <i>{label}</i> </p>"
+        body += f"<p> time: {format_metric(operator.get('operator_timing'))}s </p>"
+        body += f"<p> cardinality = {format_metric(operator.get('operator_cardinality'))} </p>"
+    extra_info = format_extra_info(operator.get('extra_info'))
+    if extra_info:
+        body += f"<p> {extra_info} </p>"
+    body += "</div>"
+    body += "</span>"
+    return body
+
+
+def generate_diff_tree_recursive(node: dict) -> str:
+    children_html = ""
+    if len(node['children']) >= 1:
+        children_html += "<ul>"
+        for child in node['children']:
+            children_html += generate_diff_tree_recursive(child)
+        children_html += "</ul>"
+    return "<li>" + get_diff_node_body(node) + children_html + "</li>"
+
+
+def collect_diff_summary(node: dict, result: list) -> None:
+    base = node['base']
+    new = node['new']
+    if base is not None and new is not None:
+        name = f"{base['name']} &rarr; {new['name']} (replaced)" if node['replaced'] else new['name']
+        result.append((name, base.get('operator_timing'), new.get('operator_timing'),
+                       base.get('operator_cardinality'), new.get('operator_cardinality')))
+    elif base is not None:
+        result.append((base['name'] + " (removed)", base.get('operator_timing'), 0,
+                       base.get('operator_cardinality'), 0))
+    else:
+        result.append((new['name'] + " (added)", 0, new.get('operator_timing'), 0, new.get('operator_cardinality')))
+    for child in node['children']:
+        collect_diff_summary(child, result)
+
+
+def generate_diff_table_html(base_json: object, new_json: object, summary: list) -> str:
+    base_total = base_json.get('operator_timing')
+    new_total = new_json.get('operator_timing')
+    table = """
+	<table class=\"styled-table\">
+		<thead>
+			<tr>
+				<th>Operator</th>
+				<th>Base time</th>
+				<th>New time</th>
+				<th>Base cardinality</th>
+				<th>New cardinality</th>
+			</tr>
+		</thead>
+		<tbody>"""
+    table += f"""
+		<tr>
+			<td><b>TOTAL TIME</b></td>
+			<td>{format_metric(base_total)}</td>
+			<td>{format_delta(base_total, new_total, True)}</td>
+			<td></td>
+			<td></td>
+		</tr>"""
+    # the operators with the largest absolute timing differences first, the ones without timings last
+    def timing_difference(entry: tuple) -> float:
+        base_time, new_time = entry[1], entry[2]
+        return -1 if base_time is None or new_time is None else abs(new_time - base_time)
+
+    for name, base_time, new_time, base_card, new_card in sorted(summary, key=timing_difference, reverse=True):
+        table += f"""
+		<tr>
+			<td>{name}</td>
+			<td>{format_metric(base_time)}</td>
+			<td>{format_delta(base_time, new_time, True)}</td>
+			<td>{format_metric(base_card)}</td>
+			<td>{format_delta(base_card, new_card, False)}</td>
+		</tr>"""
+    table += "</tbody></table>"
+    return table
+
+
+def translate_json_diff_to_html(base_file: str, new_file: str, output_file: str) -> None:
+    with open_utf8(base_file, 'r') as f:
+        base_json = json.load(f)
+    with open_utf8(new_file, 'r') as f:
+        new_json = json.load(f)
+
+    aligned = align_profiles(base_json['children'][0], new_json['children'][0])
+    summary = []
+    collect_diff_summary(aligned, summary)
+
+    html_output = generate_style_html("", True)
+    timing_table = generate_diff_table_html(base_json, new_json, summary)
+    tree_output = "<div class=\"tf-tree tf-gap-lg\"> \n <ul>" + generate_diff_tree_recursive(aligned) + "</ul> </div>"
+
+    with open_utf8(output_file, "w+") as f:
+        html = """<!DOCTYPE html>
+<html>
+	<head>
+	<meta charset="utf-8">
+	<meta name="viewport" content="width=device-width">
+	<title>Query Profile Comparison</title>
+	${TREEFLEX_CSS}
+	<style>
+		${DUCKDB_CSS}
+	</style>
+</head>
+<body>
+	<div id="meta-info"><p>Base: ${BASE_FILE}<br>New: ${NEW_FILE}</p></div>
+	<div class="chart" id="query-profile">
+		${TIMING_TABLE}
+	</div>
+	${TREE}
+</body>
+</html>
+"""
+        html = html.replace("${TREEFLEX_CSS}", html_output['treeflex_css'])
+        html = html.replace("${DUCKDB_CSS}", html_output['duckdb_css'])
+        html = html.replace("${BASE_FILE}", html_lib.escape(base_file))
+        html = html.replace("${NEW_FILE}", html_lib.escape(new_file))
+        html = html.replace("${TIMING_TABLE}", timing_table)
+        html = html.replace('${TREE}', tree_output)
+        f.write(html)
+
+
+def collect_folded_stacks(node: object, prefix: list, stacks: dict) -> None:
+    # frames are separated by ';' in the folded format
+    stack = prefix + [node['name'].strip().replace(';', ':').replace(' ', '_')]
+    # the operator timing only covers the operator itself, not its children
+    self_time = int(round(float(node['operator_timing']) * 1000000))
+    key = ";".join(stack)
+    stacks[key] = stacks.get(key, 0) + self_time
+    for child in node['children']:
+        collect_folded_stacks(child, stack, stacks)
+
+
+def generate_folded_stacks(graph_json: object) -> str:
+    """
+    Returns the operator tree in the collapsed stack format used by flame graph tools,
+    with the time spent in every operator in microseconds.
+    """
+    stacks = {}
+    for child in graph_json['children']:
+        collect_folded_stacks(child, [], stacks)
+    return "".join(f"{stack} {value}\n" for stack, value in stacks.items() if value > 0)
+
+
+def flame_graph_color(name: str) -> str:
+    # a stable warm color per operator name
+    digest = hashlib.md5(name.encode('utf8')).digest()
+    red = 205 + digest[0] % 50
+    green = digest[1] % 230
+    blue = digest[2] % 55
+    return f"rgb({red},{green},{blue})"
+
+
+def generate_flame_graph_svg(folded: str, title: str) -> str:
+    """Renders collapsed stacks as a self-contained SVG flame graph"""
+    root = {'name': 'all', 'value': 0, 'children': {}}
+    for line in folded.splitlines():
+        stack, value = line.rsplit(' ', 1)
+        value = int(value)
+        root['value'] += value
+        node = root
+        for frame in stack.split(';'):
+            node = node['children'].setdefault(frame, {'name': frame, 'value': 0, 'children': {}})
+            node['value'] += value
+
+    def max_depth(node: dict) -> int:
+        return 1 + max([max_depth(child) for child in node['children'].values()] + [0])
+
+    width = 1200
+    frame_height = 16
+    top_margin = 30
+    depth = max_depth(root)
+    height = top_margin + depth * frame_height + 10
+    total = root['value'] if root['value'] > 0 else 1
+    elements = []
+
+    def render(node: dict, x: float, level: int) -> None:
+        node_width = node['value'] / total * width
+        if node_width < 0.1:
+            return
+        y = height - 10 - (level + 1) * frame_height
+        name = html_lib.escape(node['name'])
+        percentage = node['value'] / total * 100
+        tooltip = f"{name} ({node['value']} us, {percentage:.2f}%)"
+        elements.append(
+            f'<g><title>{tooltip}</title>'
+            f'<rect x="{x:.2f}" y="{y}" width="{node_width:.2f}" height="{frame_height - 1}" '
+            f'fill="{flame_graph_color(node["name"])}" rx="2" ry="2"/>'
+        )
+        # only label frames that are wide enough for some text
+        max_characters = int(node_width / 7)
+        if max_characters >= 3:
+            label = node['name'] if len(node['name']) <= max_characters else node['name'][: max_characters - 2] + '..'
+            elements.append(
+                f'<text x="{x + 3:.2f}" y="{y + frame_height - 4}" font-size="12" '
+                f'font-family="monospace">{html_lib.escape(label)}</text>'
+            )
+        elements.append('</g>')
+        child_x = x
+        for child in node['children'].values():
+            render(child, child_x, level + 1)
+            child_x += child['value'] / total * width
+
+    render(root, 0, 0)
+    svg = f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="0 0 {width} {height}">\n'
+    svg += f'<rect x="0" y="0" width="{width}" height="{height}" fill="#fdfdfd"/>\n'
+    svg += f'<text x="{width / 2}" y="20" text-anchor="middle" font-size="16">{html_lib.escape(title)}</text>\n'
+    svg += "\n".join(elements)
+    svg += "\n</svg>\n"
+    return svg
+
+
+def write_flame_graph(input_file: str, output_file: str) -> None:
+    with open_utf8(input_file, 'r') as f:
+        graph_json = json.load(f)
+    folded = generate_folded_stacks(graph_json)
+    if output_file.endswith(".svg"):
+        output = generate_flame_graph_svg(folded, f"Query profile flame graph: {os.path.basename(input_file)}")
+    else:
+        output = folded
+    with open_utf8(output_file, "w+") as f:
+        f.write(output)
+
+
 def translate_json_to_html(input_file: str, output_file: str) -> None:
     query_timings = AllTimings()
     with open_utf8(input_file, 'r') as f:
@@ -287,17 +663,23 @@ def main() -> None:
         exit(1)
     parser = argparse.ArgumentParser(
         prog='Query Graph Generator',
-        description='Given a json profile output, generate a html file showing the query graph and timings of operators')
-    parser.add_argument('profile_input', help='profile input in json')
+        description='Given a json profile output, generate a html file showing the query graph and timings of operators. '
+        'Given two json profiles of the same query, generate a html file comparing them.')
+    parser.add_argument('profile_input', nargs='+', help='profile input in json, or a base and a new profile to compare')
     parser.add_argument('--out', required=False, default=False)
     parser.add_argument('--open', required=False, action='store_true', default=True)
+    parser.add_argument('--flamegraph', required=False, default=None,
+                        help='write a flame graph of the (last) profile, as .svg or in the folded stack format')
     args = parser.parse_args()
 
-    input = args.profile_input
+    if len(args.profile_input) > 2:
+        print("please provide one profile, or two profiles to compare")
+        exit(1)
+    input = args.profile_input[-1]
     output = args.out
     if not args.out:
         if ".json" in input:
-            output = input.replace(".json", ".html")
+            output = input.replace(".json", "_diff.html" if len(args.profile_input) == 2 else ".html")
         else:
             print("please provide profile output in json")
             exit(1)
@@ -310,7 +692,13 @@ def main() -> None:
 
     open_output = args.open
 
-    translate_json_to_html(input, output)
+    if len(args.profile_input) == 2:
+        translate_json_diff_to_html(args.profile_input[0], input, output)
+    else:
+        translate_json_to_html(input, output)
+
+    if args.flamegraph:
+        write_flame_graph(input, args.flamegraph)
 
     if open_output:
         webbrowser.open('file://' + os.path.abspath(output), new=2)
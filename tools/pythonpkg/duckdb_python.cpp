@@ -7,6 +7,7 @@
 #include "duckdb_python/python_objects.hpp"
 #include "duckdb_python/pyconnection/pyconnection.hpp"
 #include "duckdb_python/pystatement.hpp"
+#include "duckdb_python/pyprepared_statement.hpp"
 #include "duckdb_python/pyrelation.hpp"
 #include "duckdb_python/expression/pyexpression.hpp"
 #include "duckdb_python/pyresult.hpp"
@@ -281,14 +282,86 @@ static void InitializeConnectionMethods(py::module_ &m) {
 	    "Create a duplicate of the current connection", py::kw_only(), py::arg("connection") = py::none());
 	m.def(
 	    "execute",
-	    [](const py::object &query, py::object params = py::list(), shared_ptr<DuckDBPyConnection> conn = nullptr) {
+	    [](const py::object &query, py::object params = py::list(), bool profile = false,
+	       shared_ptr<DuckDBPyConnection> conn = nullptr) {
 		    if (!conn) {
 			    conn = DuckDBPyConnection::DefaultConnection();
 		    }
-		    return conn->Execute(query, params);
+		    return conn->Execute(query, params, profile);
 	    },
 	    "Execute the given SQL query, optionally using prepared statements with parameters set", py::arg("query"),
-	    py::arg("parameters") = py::none(), py::kw_only(), py::arg("connection") = py::none());
+	    py::arg("parameters") = py::none(), py::kw_only(), py::arg("profile") = false,
+	    py::arg("connection") = py::none());
+	m.def(
+	    "get_profile",
+	    [](shared_ptr<DuckDBPyConnection> conn = nullptr) {
+		    if (!conn) {
+			    conn = DuckDBPyConnection::DefaultConnection();
+		    }
+		    return conn->GetProfile();
+	    },
+	    "Get the profile of the last query that was executed with 'profile=True'", py::kw_only(),
+	    py::arg("connection") = py::none());
+	m.def(
+	    "prepare",
+	    [](const py::object &query, shared_ptr<DuckDBPyConnection> conn = nullptr) {
+		    if (!conn) {
+			    conn = DuckDBPyConnection::DefaultConnection();
+		    }
+		    return conn->Prepare(query);
+	    },
+	    "Prepare the given SQL query, returns a prepared statement that can be executed multiple times",
+	    py::arg("query"), py::kw_only(), py::arg("connection") = py::none());
+	m.def(
+	    "set_statement_cache_size",
+	    [](idx_t size, shared_ptr<DuckDBPyConnection> conn = nullptr) {
+		    if (!conn) {
+			    conn = DuckDBPyConnection::DefaultConnection();
+		    }
+		    conn->SetStatementCacheSize(size);
+	    },
+	    "Set the maximum amount of prepared statements cached by execute and sql, 0 disables the cache",
+	    py::arg("size"), py::kw_only(), py::arg("connection") = py::none());
+	m.def(
+	    "statement_cache_info",
+	    [](shared_ptr<DuckDBPyConnection> conn = nullptr) {
+		    if (!conn) {
+			    conn = DuckDBPyConnection::DefaultConnection();
+		    }
+		    return conn->GetStatementCacheInfo();
+	    },
+	    "Get the hits, misses, size and capacity of the statement cache", py::kw_only(),
+	    py::arg("connection") = py::none());
+	m.def(
+	    "set_result_cache_size",
+	    [](idx_t size, shared_ptr<DuckDBPyConnection> conn = nullptr) {
+		    if (!conn) {
+			    conn = DuckDBPyConnection::DefaultConnection();
+		    }
+		    conn->SetResultCacheSize(size);
+	    },
+	    "Set the maximum amount of memory (in bytes) used by the results cached by execute, 0 disables the cache",
+	    py::arg("size"), py::kw_only(), py::arg("connection") = py::none());
+	m.def(
+	    "result_cache_info",
+	    [](shared_ptr<DuckDBPyConnection> conn = nullptr) {
+		    if (!conn) {
+			    conn = DuckDBPyConnection::DefaultConnection();
+		    }
+		    return conn->GetResultCacheInfo();
+	    },
+	    "Get the hits, misses, size, memory usage and capacity of the result cache", py::kw_only(),
+	    py::arg("connection") = py::none());
+	m.def(
+	    "execute_async",
+	    [](const py::object &query, py::object params = py::list(), shared_ptr<DuckDBPyConnection> conn = nullptr) {
+		    if (!conn) {
+			    conn = DuckDBPyConnection::DefaultConnection();
+		    }
+		    return conn->ExecuteAsync(query, params);
+	    },
+	    "Execute the given SQL query on a background thread, returns an awaitable that resolves to the connection",
+	    py::arg("query"), py::arg("parameters") = py::none(), py::kw_only(), py::arg("connection") = py::none());
 	m.def(
 	    "executemany",
 	    [](const py::object &query, py::object params = py::list(), shared_ptr<DuckDBPyConnection> conn = nullptr) {
@@ -427,13 +500,15 @@ static void InitializeConnectionMethods(py::module_ &m) {
 	    py::arg("connection") = py::none());
 	m.def(
 	    "fetch_record_batch",
-	    [](const idx_t rows_per_batch, shared_ptr<DuckDBPyConnection> conn = nullptr) {
+	    [](const idx_t rows_per_batch, idx_t prefetch, shared_ptr<DuckDBPyConnection> conn = nullptr) {
 		    if (!conn) {
 			    conn = DuckDBPyConnection::DefaultConnection();
 		    }
-		    return conn->FetchRecordBatchReader(rows_per_batch);
+		    return conn->FetchRecordBatchReader(rows_per_batch, prefetch);
 	    },
-	    "Fetch an Arrow RecordBatchReader following execute()", py::arg("rows_per_batch") = 1000000, py::kw_only(),
+	    "Fetch an Arrow RecordBatchReader following execute(), with 'prefetch' set up to 'prefetch' batches are "
+	    "produced ahead on a background thread",
+	    py::arg("rows_per_batch") = 1000000, py::kw_only(), py::arg("prefetch") = 0,
 	    py::arg("connection") = py::none());
 	m.def(
 	    "torch",
@@ -1062,6 +1137,7 @@ PYBIND11_MODULE(DUCKDB_PYTHON_LIB_NAME, m) { // NOLINT
 	DuckDBPyFunctional::Initialize(m);
 	DuckDBPyExpression::Initialize(m);
 	DuckDBPyStatement::Initialize(m);
+	DuckDBPyPreparedStatement::Initialize(m);
 	DuckDBPyRelation::Initialize(m);
 	DuckDBPyConnection::Initialize(m);
 	PythonObject::Initialize();
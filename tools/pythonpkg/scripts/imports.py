@@ -80,8 +80,13 @@ polars.LazyFrame
 
 import duckdb
 import duckdb.filesystem
+import duckdb.profiling
+import duckdb.async_query
 
 duckdb.filesystem.ModifiedMemoryFileSystem
+duckdb.profiling.QueryProfile
+duckdb.async_query.AsyncQuery
+duckdb.async_query.AsyncRecordBatchIterator
 duckdb.Value
 
 import pytz
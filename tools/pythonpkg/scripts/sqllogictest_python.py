@@ -1,7 +1,12 @@
 import sys
 import os
 import glob
-from typing import Any, Generator, Optional
+import io
+import json
+import time
+import contextlib
+import multiprocessing
+from typing import Any, Dict, Generator, List, NamedTuple, Optional
 import shutil
 import gc
 
@@ -26,8 +31,9 @@ TEST_DIRECTORY_PATH = os.path.join(script_path, 'duckdb_unittest_tempdir')
 
 # This is pretty much just a VM
 class SQLLogicTestExecutor(SQLLogicRunner):
-    def __init__(self, build_directory: Optional[str] = None):
+    def __init__(self, build_directory: Optional[str] = None, test_directory: str = TEST_DIRECTORY_PATH):
         super().__init__(build_directory)
+        self.test_directory = test_directory
         self.SKIPPED_TESTS = set(
             [
                 'test/sql/types/map/map_empty.test',
@@ -68,7 +74,7 @@ class SQLLogicTestExecutor(SQLLogicRunner):
         self.skip_log = []
 
     def get_test_directory(self) -> str:
-        test_directory = TEST_DIRECTORY_PATH
+        test_directory = self.test_directory
         if not os.path.exists(test_directory):
             os.makedirs(test_directory)
         return test_directory
@@ -127,6 +133,64 @@ class SQLLogicTestExecutor(SQLLogicRunner):
         return res
 
 
+class TestFileResult(NamedTuple):
+    file_path: str
+    result: Optional[ExecuteResult.Type]
+    duration: float
+    output: str
+    skip_log: List[str]
+
+
+def run_test_file(
+    executor: SQLLogicTestExecutor, sql_parser: SQLLogicParser, file_path: str, capture_output: bool
+) -> TestFileResult:
+    start = time.time()
+    # The output of tests running in parallel is captured, so it doesn't get interleaved
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output) if capture_output else contextlib.nullcontext():
+        try:
+            test = sql_parser.parse(file_path)
+        except SQLParserException as e:
+            executor.skip_log.append(str(e.message))
+            result = None
+        else:
+            # This is necessary to clean up databases/connections
+            # So previously created databases are not still cached in the instance_cache
+            gc.collect()
+            result = executor.execute_test(test).type
+    skip_log = list(executor.skip_log)
+    executor.skip_log.clear()
+    return TestFileResult(file_path, result, time.time() - start, output.getvalue(), skip_log)
+
+
+# Every worker process has its own executor, parser and test directory
+worker_state = {}
+
+
+def initialize_worker(build_directory: Optional[str]):
+    test_directory = f'{TEST_DIRECTORY_PATH}_{os.getpid()}'
+    worker_state['executor'] = SQLLogicTestExecutor(build_directory, test_directory)
+    worker_state['parser'] = SQLLogicParser()
+
+
+def run_test_file_in_worker(file_path: str) -> TestFileResult:
+    return run_test_file(worker_state['executor'], worker_state['parser'], file_path, True)
+
+
+def load_durations(path: Optional[str]) -> Dict[str, float]:
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def store_durations(path: Optional[str], durations: Dict[str, float]):
+    if not path:
+        return
+    with open(path, 'w') as f:
+        json.dump(durations, f, indent=1, sort_keys=True)
+
+
 import argparse
 
 
@@ -140,11 +204,21 @@ def main():
     arg_parser.add_argument(
         '--build-dir', type=str, help='Path to the build directory, used for loading extensions', default=None
     )
+    arg_parser.add_argument(
+        '--jobs', '-j', type=int, help='Amount of worker processes to distribute the test files over', default=1
+    )
+    arg_parser.add_argument(
+        '--durations',
+        type=str,
+        help='Path to a JSON file with the recorded durations of the tests, used to schedule the longest tests first',
+        default=None,
+    )
     args = arg_parser.parse_args()
 
     executor = SQLLogicTestExecutor(args.build_dir)
-    if os.path.exists(TEST_DIRECTORY_PATH):
-        shutil.rmtree(TEST_DIRECTORY_PATH)
+    for directory in [TEST_DIRECTORY_PATH] + glob.glob(f'{TEST_DIRECTORY_PATH}_*'):
+        if os.path.exists(directory):
+            shutil.rmtree(directory)
 
     test_directory = None
     if args.file_path:
@@ -163,6 +237,7 @@ def main():
     start_offset = args.start_offset
 
     total_tests = len(file_paths)
+    scheduled = []
     for i, file_path in enumerate(file_paths):
         if file_path in executor.SKIPPED_TESTS:
             continue
@@ -170,30 +245,55 @@ def main():
             continue
         if test_directory:
             file_path = os.path.join(test_directory, file_path)
+        scheduled.append((i, file_path))
 
-        try:
-            test = sql_parser.parse(file_path)
-        except SQLParserException as e:
-            executor.skip_log.append(str(e.message))
-            continue
+    durations = load_durations(args.durations)
+    failed = []
 
-        print(f'[{i}/{total_tests}] {file_path}')
-        # This is necessary to clean up databases/connections
-        # So previously created databases are not still cached in the instance_cache
-        gc.collect()
-        result = executor.execute_test(test)
-        if result.type == ExecuteResult.Type.SUCCESS:
+    def process_result(result: TestFileResult) -> bool:
+        durations[result.file_path] = result.duration
+        executor.skip_log.extend(result.skip_log)
+        sys.stdout.write(result.output)
+        if result.result is None:
+            return True
+        if result.result == ExecuteResult.Type.SUCCESS:
             print("SUCCESS")
-        if result.type == ExecuteResult.Type.SKIPPED:
+        if result.result == ExecuteResult.Type.SKIPPED:
             print("SKIPPED")
-            continue
-        if result.type == ExecuteResult.Type.ERROR:
+        if result.result == ExecuteResult.Type.ERROR:
             print("ERROR")
-            exit(1)
+            failed.append(result.file_path)
+            return False
+        return True
+
+    if args.jobs <= 1:
+        for i, file_path in scheduled:
+            print(f'[{i}/{total_tests}] {file_path}')
+            if not process_result(run_test_file(executor, sql_parser, file_path, False)):
+                break
+    else:
+        # Longest test first, tests without a recorded duration are assumed to be long
+        file_paths = [file_path for _, file_path in scheduled]
+        file_paths.sort(key=lambda path: durations.get(path, float('inf')), reverse=True)
+        with multiprocessing.Pool(args.jobs, initializer=initialize_worker, initargs=(args.build_dir,)) as pool:
+            results = pool.imap_unordered(run_test_file_in_worker, file_paths)
+            for i, result in enumerate(results):
+                print(f'[{i}/{len(file_paths)}] {result.file_path}')
+                process_result(result)
+        for worker_directory in glob.glob(f'{TEST_DIRECTORY_PATH}_*'):
+            shutil.rmtree(worker_directory, ignore_errors=True)
+
+    store_durations(args.durations, durations)
     if len(executor.skip_log) != 0:
         for item in executor.skip_log:
             print(item)
         executor.skip_log.clear()
+    if failed:
+        if args.jobs > 1:
+            print(f'{len(failed)} test(s) failed:')
+            for file_path in failed:
+                print(f'  {file_path}')
+        exit(1)
 
 
 if __name__ == '__main__':
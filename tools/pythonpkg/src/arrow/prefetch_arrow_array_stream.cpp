@@ -0,0 +1,182 @@
+#include "duckdb_python/arrow/prefetch_arrow_array_stream.hpp"
+
+#include "duckdb/common/arrow/arrow_converter.hpp"
+#include "duckdb/common/arrow/arrow_wrapper.hpp"
+#include "duckdb/main/chunk_scan_state/query_result.hpp"
+#include "duckdb/main/query_result.hpp"
+#include "duckdb/main/stream_query_result.hpp"
+#include "duckdb_python/pybind11/pybind_wrapper.hpp"
+#include "duckdb_python/pyconnection/pyconnection.hpp"
+
+namespace duckdb {
+
+PrefetchArrowArrayStreamWrapper::PrefetchArrowArrayStreamWrapper(unique_ptr<QueryResult> result_p, idx_t batch_size_p,
+                                                                 idx_t prefetch_p)
+    : result(std::move(result_p)), scan_state(make_uniq<QueryResultChunkScanState>(*result)), types(result->types),
+      names(result->names), options(result->client_properties), batch_size(batch_size_p), prefetch(prefetch_p),
+      finished(false), stopped(false) {
+	if (batch_size == 0) {
+		throw InvalidInputException("Approximate Batch Size of Record Batch MUST be higher than 0");
+	}
+	if (prefetch == 0) {
+		throw InvalidInputException("The amount of prefetched Record Batches MUST be higher than 0");
+	}
+	if (result->type == QueryResultType::STREAM_RESULT) {
+		// Fetching from a streaming result executes the query, which has to hold the lock of the connection
+		auto &context = result->Cast<StreamQueryResult>().context;
+		if (context) {
+			connection = DuckDBPyConnection::FromContext(*context);
+		}
+	}
+	stream.private_data = this;
+	stream.get_schema = PrefetchArrowArrayStreamWrapper::GetSchema;
+	stream.get_next = PrefetchArrowArrayStreamWrapper::GetNext;
+	stream.release = PrefetchArrowArrayStreamWrapper::Release;
+	stream.get_last_error = PrefetchArrowArrayStreamWrapper::GetLastError;
+	producer = std::thread([this]() { Produce(); });
+}
+
+PrefetchArrowArrayStreamWrapper::~PrefetchArrowArrayStreamWrapper() {
+	Stop();
+	// Release the batches that were never consumed
+	for (auto &batch : batches) {
+		if (batch.release) {
+			batch.release(&batch);
+		}
+	}
+	if (connection) {
+		// The stream can be released without holding the GIL, but the connection is a Python object
+		py::gil_scoped_acquire gil;
+		connection.reset();
+	}
+}
+
+void PrefetchArrowArrayStreamWrapper::Produce() {
+	while (true) {
+		{
+			unique_lock<mutex> guard(lock);
+			space_available.wait(guard, [&]() { return stopped || batches.size() < prefetch; });
+			if (stopped) {
+				return;
+			}
+		}
+		ArrowArray batch;
+		batch.release = nullptr;
+		idx_t count = 0;
+		ErrorData fetch_error;
+		bool success;
+		{
+			// A query that is executed on the connection in the meantime waits for the batch to be fetched (and then
+			// closes the result), instead of running concurrently with the fetch
+			unique_lock<mutex> connection_lock;
+			if (connection) {
+				connection_lock = unique_lock<mutex>(connection->py_connection_lock);
+			}
+			if (result->type == QueryResultType::STREAM_RESULT && !result->Cast<StreamQueryResult>().IsOpen()) {
+				// The result was closed (e.g. because another query was executed on the connection)
+				success = true;
+			} else {
+				try {
+					success = ArrowUtil::TryFetchChunk(*scan_state, options, batch_size, &batch, count, fetch_error);
+				} catch (std::exception &ex) {
+					fetch_error = ErrorData(ex);
+					success = false;
+				}
+			}
+		}
+
+		lock_guard<mutex> guard(lock);
+		if (!success) {
+			error = std::move(fetch_error);
+			finished = true;
+		} else if (count == 0) {
+			finished = true;
+		} else {
+			batches.push_back(batch);
+		}
+		batch_available.notify_one();
+		if (finished) {
+			return;
+		}
+	}
+}
+
+bool PrefetchArrowArrayStreamWrapper::Next(ArrowArray &out) {
+	// The producer might need the GIL (e.g. to scan a DataFrame), so it can not be held while waiting for a batch
+	unique_ptr<py::gil_scoped_release> release;
+	if (py::gil_check()) {
+		release = make_uniq<py::gil_scoped_release>();
+	}
+	unique_lock<mutex> guard(lock);
+	batch_available.wait(guard, [&]() { return finished || !batches.empty(); });
+	if (!batches.empty()) {
+		out = batches.front();
+		batches.pop_front();
+		space_available.notify_one();
+		return true;
+	}
+	if (error.HasError()) {
+		return false;
+	}
+	// Nothing to output
+	out.release = nullptr;
+	return true;
+}
+
+void PrefetchArrowArrayStreamWrapper::Stop() {
+	{
+		lock_guard<mutex> guard(lock);
+		stopped = true;
+	}
+	space_available.notify_one();
+	if (producer.joinable()) {
+		unique_ptr<py::gil_scoped_release> release;
+		if (py::gil_check()) {
+			release = make_uniq<py::gil_scoped_release>();
+		}
+		producer.join();
+	}
+}
+
+int PrefetchArrowArrayStreamWrapper::GetSchema(struct ArrowArrayStream *stream, struct ArrowSchema *out) {
+	if (!stream->release) {
+		return -1;
+	}
+	out->release = nullptr;
+	auto &wrapper = *reinterpret_cast<PrefetchArrowArrayStreamWrapper *>(stream->private_data);
+	try {
+		ArrowConverter::ToArrowSchema(out, wrapper.types, wrapper.names, wrapper.options);
+	} catch (std::exception &ex) {
+		lock_guard<mutex> guard(wrapper.lock);
+		wrapper.error = ErrorData(ex);
+		return -1;
+	}
+	return 0;
+}
+
+int PrefetchArrowArrayStreamWrapper::GetNext(struct ArrowArrayStream *stream, struct ArrowArray *out) {
+	if (!stream->release) {
+		return -1;
+	}
+	auto &wrapper = *reinterpret_cast<PrefetchArrowArrayStreamWrapper *>(stream->private_data);
+	return wrapper.Next(*out) ? 0 : -1;
+}
+
+void PrefetchArrowArrayStreamWrapper::Release(struct ArrowArrayStream *stream) {
+	if (!stream || !stream->release) {
+		return;
+	}
+	stream->release = nullptr;
+	delete reinterpret_cast<PrefetchArrowArrayStreamWrapper *>(stream->private_data);
+}
+
+const char *PrefetchArrowArrayStreamWrapper::GetLastError(struct ArrowArrayStream *stream) {
+	if (!stream->release) {
+		return "stream was released";
+	}
+	auto &wrapper = *reinterpret_cast<PrefetchArrowArrayStreamWrapper *>(stream->private_data);
+	lock_guard<mutex> guard(wrapper.lock);
+	return wrapper.error.Message().c_str();
+}
+
+} // namespace duckdb
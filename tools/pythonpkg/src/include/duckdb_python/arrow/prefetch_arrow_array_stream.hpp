@@ -0,0 +1,76 @@
+//===----------------------------------------------------------------------===//
+//                         DuckDB
+//
+// duckdb_python/arrow/prefetch_arrow_array_stream.hpp
+//
+//
+//===----------------------------------------------------------------------===//
+
+#pragma once
+
+#include "duckdb/common/common.hpp"
+#include "duckdb/common/deque.hpp"
+#include "duckdb/common/mutex.hpp"
+#include "duckdb/common/error_data.hpp"
+#include "duckdb/common/arrow/arrow.hpp"
+#include "duckdb/main/client_properties.hpp"
+
+#include <condition_variable>
+#include <thread>
+
+namespace duckdb {
+class ChunkScanState;
+class QueryResult;
+struct DuckDBPyConnection;
+
+//! An ArrowArrayStream over a query result that produces the record batches on a background thread, so the query
+//! keeps executing while the consumer processes the previous batches. At most 'prefetch' batches are buffered
+//! The producer holds the lock of the connection while it fetches a batch, like the other users of the connection
+class PrefetchArrowArrayStreamWrapper {
+public:
+	PrefetchArrowArrayStreamWrapper(unique_ptr<QueryResult> result, idx_t batch_size, idx_t prefetch);
+	~PrefetchArrowArrayStreamWrapper();
+
+public:
+	ArrowArrayStream stream;
+
+private:
+	//! Runs on the background thread, fetches batches until the result is exhausted or the stream is released
+	void Produce();
+	//! Waits for the next batch, returns false if fetching the batch failed
+	bool Next(ArrowArray &out);
+	//! Stops the background thread, waiting for the batch it is producing to finish
+	void Stop();
+
+	static int GetSchema(struct ArrowArrayStream *stream, struct ArrowSchema *out);
+	static int GetNext(struct ArrowArrayStream *stream, struct ArrowArray *out);
+	static void Release(struct ArrowArrayStream *stream);
+	static const char *GetLastError(struct ArrowArrayStream *stream);
+
+private:
+	unique_ptr<QueryResult> result;
+	//! The connection the result is streamed from (if any), released while holding the GIL
+	shared_ptr<DuckDBPyConnection> connection;
+	unique_ptr<ChunkScanState> scan_state;
+	vector<LogicalType> types;
+	vector<string> names;
+	ClientProperties options;
+	idx_t batch_size;
+	idx_t prefetch;
+
+	mutex lock;
+	//! Signalled by the producer when a batch was added (or the result is exhausted)
+	std::condition_variable batch_available;
+	//! Signalled by the consumer when a batch was taken (or the stream is released)
+	std::condition_variable space_available;
+	//! The batches that were produced but not consumed yet
+	deque<ArrowArray> batches;
+	//! Whether the producer is done, either because the result is exhausted or because of an error
+	bool finished;
+	//! Whether the stream was released
+	bool stopped;
+	ErrorData error;
+	std::thread producer;
+};
+
+} // namespace duckdb
@@ -33,18 +33,62 @@ protected:
 	}
 };
 
+struct DuckdbProfilingCacheItem : public PythonImportCacheItem {
+
+public:
+	static constexpr const char *Name = "duckdb.profiling";
+
+public:
+	DuckdbProfilingCacheItem() : PythonImportCacheItem("duckdb.profiling"), QueryProfile("QueryProfile", this) {
+	}
+	~DuckdbProfilingCacheItem() override {
+	}
+
+	PythonImportCacheItem QueryProfile;
+
+protected:
+	bool IsRequired() const override final {
+		return false;
+	}
+};
+
+struct DuckdbAsyncQueryCacheItem : public PythonImportCacheItem {
+
+public:
+	static constexpr const char *Name = "duckdb.async_query";
+
+public:
+	DuckdbAsyncQueryCacheItem()
+	    : PythonImportCacheItem("duckdb.async_query"), AsyncQuery("AsyncQuery", this),
+	      AsyncRecordBatchIterator("AsyncRecordBatchIterator", this) {
+	}
+	~DuckdbAsyncQueryCacheItem() override {
+	}
+
+	PythonImportCacheItem AsyncQuery;
+	PythonImportCacheItem AsyncRecordBatchIterator;
+
+protected:
+	bool IsRequired() const override final {
+		return false;
+	}
+};
+
 struct DuckdbCacheItem : public PythonImportCacheItem {
 
 public:
 	static constexpr const char *Name = "duckdb";
 
 public:
-	DuckdbCacheItem() : PythonImportCacheItem("duckdb"), filesystem(), Value("Value", this) {
+	DuckdbCacheItem()
+	    : PythonImportCacheItem("duckdb"), filesystem(), profiling(), async_query(), Value("Value", this) {
 	}
 	~DuckdbCacheItem() override {
 	}
 
 	DuckdbFilesystemCacheItem filesystem;
+	DuckdbProfilingCacheItem profiling;
+	DuckdbAsyncQueryCacheItem async_query;
 	PythonImportCacheItem Value;
 };
 
@@ -25,6 +25,8 @@
 #include "duckdb_python/pybind11/conversions/python_udf_type_enum.hpp"
 #include "duckdb_python/pybind11/conversions/python_csv_line_terminator_enum.hpp"
 #include "duckdb/common/shared_ptr.hpp"
+#include "duckdb_python/pyconnection/statement_cache.hpp"
+#include "duckdb_python/pyconnection/result_cache.hpp"
 
 namespace duckdb {
 struct BoundParameterData;
@@ -32,6 +34,7 @@ struct BoundParameterData;
 enum class PythonEnvironmentType { NORMAL, INTERACTIVE, JUPYTER };
 
 struct DuckDBPyRelation;
+struct DuckDBPyPreparedStatement;
 
 class RegisteredArrow : public RegisteredObject {
 
@@ -143,6 +146,12 @@ public:
 	shared_ptr<ModifiedMemoryFileSystem> internal_object_filesystem;
 	case_insensitive_map_t<unique_ptr<ExternalDependency>> registered_functions;
 	case_insensitive_set_t registered_objects;
+	//! The profile of the last query that was executed with 'profile=True'
+	string last_profile;
+	//! The prepared statements cached by 'execute' and 'sql'
+	PythonStatementCache statement_cache;
+	//! The results cached by 'execute'
+	PythonResultCache result_cache;
 
 public:
 	explicit DuckDBPyConnection() {
@@ -161,6 +170,11 @@ public:
 	static bool DetectAndGetEnvironment();
 	static bool IsJupyter();
 	static shared_ptr<DuckDBPyConnection> DefaultConnection();
+	//! The connection that owns the client context, or nullptr if it was closed
+	//! Relations only hold on to the client context, they use this to take the lock of their connection
+	static shared_ptr<DuckDBPyConnection> FromContext(ClientContext &context);
+	//! Links the client context of the connection back to this connection (see FromContext)
+	void RegisterContextState();
 	static PythonImportCache *ImportCache();
 	static bool IsInteractive();
 
@@ -209,9 +223,29 @@ public:
 
 	void ExecuteImmediately(vector<unique_ptr<SQLStatement>> statements);
 	unique_ptr<PreparedStatement> PrepareQuery(unique_ptr<SQLStatement> statement);
-	unique_ptr<QueryResult> ExecuteInternal(PreparedStatement &prep, py::object params = py::list());
-
-	shared_ptr<DuckDBPyConnection> Execute(const py::object &query, py::object params = py::list());
+	//! Returns the cached prepared statement of the query, sets the key under which the statement should be cached
+	shared_ptr<PreparedStatement> GetCachedStatement(const py::object &query, const py::object &params,
+	                                                 string &cache_key);
+	//! Prepares the statement, and adds it to the statement cache if it is cacheable
+	shared_ptr<PreparedStatement> PrepareAndCache(unique_ptr<SQLStatement> statement, const string &cache_key);
+	unique_ptr<QueryResult> ExecuteInternal(PreparedStatement &prep, py::object params = py::list(),
+	                                        bool stream_result = true);
+	unique_ptr<QueryResult> ExecuteInternal(PreparedStatement &prep,
+	                                        case_insensitive_map_t<BoundParameterData> &named_values,
+	                                        bool stream_result = true);
+	//! Executes the prepared statement, serving the result from the result cache if possible
+	unique_ptr<DuckDBPyRelation> ExecuteWithResultCache(const string &query, PreparedStatement &prep,
+	                                                    py::object params);
+
+	shared_ptr<DuckDBPyConnection> Execute(const py::object &query, py::object params = py::list(),
+	                                       bool profile = false);
+	py::object GetProfile();
+	shared_ptr<DuckDBPyPreparedStatement> Prepare(const py::object &query);
+	void SetStatementCacheSize(idx_t size);
+	py::dict GetStatementCacheInfo();
+	void SetResultCacheSize(idx_t size);
+	py::dict GetResultCacheInfo();
+	py::object ExecuteAsync(const py::object &query, py::object params = py::list());
 	shared_ptr<DuckDBPyConnection> ExecuteFromString(const string &query);
 
 	shared_ptr<DuckDBPyConnection> Append(const string &name, const PandasDataFrame &value, bool by_name);
@@ -295,7 +329,7 @@ public:
 
 	py::dict FetchTF();
 
-	duckdb::pyarrow::RecordBatchReader FetchRecordBatchReader(const idx_t rows_per_batch);
+	duckdb::pyarrow::RecordBatchReader FetchRecordBatchReader(const idx_t rows_per_batch, idx_t prefetch = 0);
 
 	static shared_ptr<DuckDBPyConnection> Connect(const py::object &database, bool read_only, const py::dict &config);
 
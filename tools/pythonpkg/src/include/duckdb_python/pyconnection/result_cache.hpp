@@ -0,0 +1,96 @@
+//===----------------------------------------------------------------------===//
+//                         DuckDB
+//
+// duckdb_python/pyconnection/result_cache.hpp
+//
+//
+//===----------------------------------------------------------------------===//
+
+#pragma once
+
+#include "duckdb/common/common.hpp"
+#include "duckdb/common/list.hpp"
+#include "duckdb/common/unordered_map.hpp"
+#include "duckdb/common/case_insensitive_map.hpp"
+#include "duckdb/planner/expression/bound_parameter_data.hpp"
+#include "duckdb_python/pybind11/pybind_wrapper.hpp"
+
+namespace duckdb {
+class ClientContext;
+class ColumnDataCollection;
+class PreparedStatementData;
+
+//! The version of the data of a database a cached result was read from
+struct ResultCacheDataVersion {
+	idx_t database_oid;
+	idx_t data_version;
+
+	bool operator==(const ResultCacheDataVersion &rhs) const {
+		return database_oid == rhs.database_oid && data_version == rhs.data_version;
+	}
+};
+
+struct PythonCachedResult {
+	PythonCachedResult(shared_ptr<ColumnDataCollection> collection, vector<string> names,
+	                   vector<ResultCacheDataVersion> versions);
+
+	shared_ptr<ColumnDataCollection> collection;
+	vector<string> names;
+	//! The versions of the databases the result was read from, the result is stale once any of them changed
+	vector<ResultCacheDataVersion> versions;
+	//! The amount of memory used by the result
+	idx_t size;
+};
+
+//! LRU cache of the materialized results of the queries of a connection, keyed on the query and the values of its
+//! parameters. The amount of memory used by the cached results is bounded by the capacity (in bytes)
+//! Disabled (a capacity of 0) by default
+class PythonResultCache {
+public:
+	PythonResultCache();
+	~PythonResultCache();
+
+public:
+	//! Changes the maximum amount of memory used by the cached results, evicting the least recently used results if
+	//! needed
+	void SetCapacity(idx_t capacity);
+	bool IsEnabled() const {
+		return capacity > 0;
+	}
+	//! Returns the cached result for the key (or nullptr) if it was read from the current versions of the databases,
+	//! and updates the hit/miss counters
+	shared_ptr<PythonCachedResult> Lookup(const string &key, const vector<ResultCacheDataVersion> &versions);
+	//! Whether a result for the key, that was read from the current versions of the databases, is cached
+	bool Contains(const string &key, const vector<ResultCacheDataVersion> &versions) const;
+	void Insert(const string &key, shared_ptr<PythonCachedResult> result);
+	void Clear();
+	py::dict GetInfo() const;
+
+public:
+	//! Creates the key of a query, the values of the parameters are part of the key
+	static string GetKey(const string &query, const case_insensitive_map_t<BoundParameterData> &values);
+	//! Whether the result of the prepared statement can be cached, sets the current versions of the databases the
+	//! statement reads from. Only read-only SELECT statements outside of an explicit transaction, that only scan DuckDB
+	//! tables, are cacheable
+	static bool IsCacheable(ClientContext &context, PreparedStatementData &data,
+	                        vector<ResultCacheDataVersion> &versions);
+	//! Whether the prepared statement only uses functions that always return the same result for the same input,
+	//! binds the statement again to check the functions of the bound plan
+	static bool IsConsistent(ClientContext &context, PreparedStatementData &data,
+	                         const case_insensitive_map_t<BoundParameterData> &values);
+
+private:
+	using entry_t = std::pair<string, shared_ptr<PythonCachedResult>>;
+
+	void Erase(list<entry_t>::iterator entry);
+
+	idx_t capacity;
+	idx_t memory_usage;
+	idx_t hits;
+	idx_t misses;
+	//! The cached results, the most recently used result is at the front
+	list<entry_t> entries;
+	unordered_map<string, list<entry_t>::iterator> lookup;
+};
+
+} // namespace duckdb
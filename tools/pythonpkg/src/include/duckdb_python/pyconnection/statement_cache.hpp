@@ -0,0 +1,67 @@
+//===----------------------------------------------------------------------===//
+//                         DuckDB
+//
+// duckdb_python/pyconnection/statement_cache.hpp
+//
+//
+//===----------------------------------------------------------------------===//
+
+#pragma once
+
+#include "duckdb/common/common.hpp"
+#include "duckdb/common/list.hpp"
+#include "duckdb/common/unordered_map.hpp"
+#include "duckdb/common/enums/statement_type.hpp"
+#include "duckdb_python/pybind11/pybind_wrapper.hpp"
+
+namespace duckdb {
+class PhysicalOperator;
+class PreparedStatement;
+class PreparedStatementData;
+
+//! LRU cache of the prepared statements of a connection, keyed on the query and the types of its parameters
+//! Disabled (a capacity of 0) by default
+class PythonStatementCache {
+public:
+	PythonStatementCache();
+	~PythonStatementCache();
+
+public:
+	//! Changes the maximum amount of cached statements, evicting the least recently used statements if needed
+	void SetCapacity(idx_t capacity);
+	bool IsEnabled() const {
+		return capacity > 0;
+	}
+	//! Returns the cached statement for the key (or nullptr), and updates the hit/miss counters
+	shared_ptr<PreparedStatement> Lookup(const string &key);
+	void Insert(const string &key, shared_ptr<PreparedStatement> prepared);
+	void Clear();
+	py::dict GetInfo() const;
+
+public:
+	//! Creates the key of a query, the types of the parameters are part of the key because a prepared statement has
+	//! to be rebound when it is executed with parameters of a different type
+	static string GetKey(const string &query, const py::object &params);
+	//! Whether the prepared statement of this type of statement can be cached
+	static bool IsCacheable(StatementType type);
+	//! Whether the prepared statement can be cached, only statements that do not scan anything but DuckDB tables are
+	//! cached
+	static bool IsCacheable(const PreparedStatementData &data);
+	//! Whether the only table functions in the plan are scans of DuckDB tables
+	static bool OnlyScansTables(const PhysicalOperator &op);
+	//! Whether executing this type of statement invalidates the cached statements
+	//! (e.g. because it changes the catalog or the settings the statements were planned with)
+	static bool InvalidatesCache(StatementType type);
+
+private:
+	using entry_t = std::pair<string, shared_ptr<PreparedStatement>>;
+
+	idx_t capacity;
+	idx_t hits;
+	idx_t misses;
+	//! The cached statements, the most recently used statement is at the front
+	list<entry_t> entries;
+	unordered_map<string, list<entry_t>::iterator> lookup;
+};
+
+} // namespace duckdb
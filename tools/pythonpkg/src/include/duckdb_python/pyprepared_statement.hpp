@@ -0,0 +1,67 @@
+//===----------------------------------------------------------------------===//
+//                         DuckDB
+//
+// duckdb_python/pyprepared_statement.hpp
+//
+//
+//===----------------------------------------------------------------------===//
+
+#pragma once
+
+#include "duckdb_python/pybind11/pybind_wrapper.hpp"
+#include "duckdb_python/pybind11/dataframe.hpp"
+#include "duckdb_python/arrow/arrow_array_stream.hpp"
+#include "duckdb_python/python_objects.hpp"
+#include "duckdb_python/pytype.hpp"
+#include "duckdb.hpp"
+
+namespace duckdb {
+struct DuckDBPyConnection;
+struct DuckDBPyRelation;
+
+//! A statement that is prepared once by 'DuckDBPyConnection::Prepare' and can be executed any number of times, every
+//! execution reuses the plan of the prepared statement
+struct DuckDBPyPreparedStatement : public enable_shared_from_this<DuckDBPyPreparedStatement> {
+public:
+	DuckDBPyPreparedStatement(shared_ptr<DuckDBPyConnection> connection, unique_ptr<PreparedStatement> prepared);
+	~DuckDBPyPreparedStatement();
+
+public:
+	static void Initialize(py::handle &m);
+
+public:
+	shared_ptr<DuckDBPyPreparedStatement> Execute(py::object params = py::list());
+	shared_ptr<DuckDBPyPreparedStatement> ExecuteMany(py::object params = py::list());
+	unique_ptr<DuckDBPyRelation> ToRelation(py::object params = py::list(), string alias = "");
+
+	Optional<py::tuple> FetchOne();
+	py::list FetchMany(idx_t size);
+	py::list FetchAll();
+	py::dict FetchNumpy();
+	PandasDataFrame FetchDF(bool date_as_object);
+	duckdb::pyarrow::Table FetchArrow(idx_t rows_per_batch);
+	PolarsDataFrame FetchPolars(idx_t rows_per_batch);
+	duckdb::pyarrow::RecordBatchReader FetchRecordBatchReader(idx_t rows_per_batch, idx_t prefetch = 0);
+
+	void Close();
+
+	string Query() const;
+	StatementType Type() const;
+	py::list ParameterNames() const;
+	py::list ParameterTypes() const;
+	py::list Columns() const;
+	py::list ColumnTypes() const;
+	py::list Description() const;
+
+private:
+	PreparedStatement &GetPrepared() const;
+	DuckDBPyRelation &GetResult();
+
+private:
+	shared_ptr<DuckDBPyConnection> connection;
+	unique_ptr<PreparedStatement> prepared;
+	//! The result of the last execution
+	unique_ptr<DuckDBPyRelation> result;
+};
+
+} // namespace duckdb
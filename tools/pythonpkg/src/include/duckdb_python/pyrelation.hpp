@@ -134,8 +134,6 @@ public:
 
 	string ToSQL();
 
-	duckdb::pyarrow::RecordBatchReader FetchRecordBatchReader(idx_t rows_per_batch);
-
 	idx_t Length();
 
 	py::tuple Shape();
@@ -196,7 +194,11 @@ public:
 
 	py::object ToArrowCapsule();
 
-	duckdb::pyarrow::RecordBatchReader ToRecordBatch(idx_t batch_size);
+	duckdb::pyarrow::RecordBatchReader ToRecordBatch(idx_t batch_size, idx_t prefetch = 0);
+
+	py::object ToArrowTableAsync(idx_t batch_size);
+
+	py::object RecordBatchesAsync(idx_t batch_size);
 
 	unique_ptr<DuckDBPyRelation> Union(DuckDBPyRelation *other);
 
@@ -246,6 +248,8 @@ public:
 
 	string Explain(ExplainType type);
 
+	py::object Profile();
+
 	static bool IsRelation(const py::object &object);
 
 	bool CanBeRegisteredBy(Connection &con);
@@ -13,6 +13,7 @@
 #include "duckdb_python/pybind11/pybind_wrapper.hpp"
 #include "duckdb_python/python_objects.hpp"
 #include "duckdb_python/pybind11/dataframe.hpp"
+#include "duckdb_python/python_signal_check.hpp"
 
 namespace duckdb {
 
@@ -43,8 +44,9 @@ public:
 
 	py::dict FetchTF();
 
-	ArrowArrayStream FetchArrowArrayStream(idx_t rows_per_batch = 1000000);
-	duckdb::pyarrow::RecordBatchReader FetchRecordBatchReader(idx_t rows_per_batch = 1000000);
+	//! With 'prefetch' set, up to 'prefetch' batches are produced ahead of the consumer on a background thread
+	ArrowArrayStream FetchArrowArrayStream(idx_t rows_per_batch = 1000000, idx_t prefetch = 0);
+	duckdb::pyarrow::RecordBatchReader FetchRecordBatchReader(idx_t rows_per_batch = 1000000, idx_t prefetch = 0);
 	py::object FetchArrowCapsule(idx_t rows_per_batch = 1000000);
 
 	static py::list GetDescription(const vector<string> &names, const vector<LogicalType> &types);
@@ -83,6 +85,8 @@ private:
 	// Holds the categorical type of Categorical/ENUM types
 	unordered_map<idx_t, py::object> categories_type;
 	bool result_closed = false;
+	//! Kept across the calls to FetchNext, so the signals are also checked when every chunk is produced quickly
+	PythonSignalCheck signal_check;
 };
 
 } // namespace duckdb
@@ -0,0 +1,86 @@
+//===----------------------------------------------------------------------===//
+//                         DuckDB
+//
+// duckdb_python/python_async.hpp
+//
+//
+//===----------------------------------------------------------------------===//
+
+#pragma once
+
+#include "duckdb/common/common.hpp"
+#include "duckdb/common/atomic.hpp"
+#include "duckdb/common/error_data.hpp"
+#include "duckdb/common/arrow/arrow.hpp"
+#include "duckdb/main/client_properties.hpp"
+#include "duckdb_python/pybind11/pybind_wrapper.hpp"
+
+#include <functional>
+
+namespace duckdb {
+class ChunkScanState;
+class PendingQueryResult;
+class QueryResult;
+
+//! Runs a piece of work on a background thread and resolves an awaitable ('duckdb.async_query.AsyncQuery') once the
+//! work is done, so queries can be awaited without blocking the event loop
+class PythonAsyncTask {
+public:
+	//! Runs on the background thread, without holding the GIL
+	using work_function_t = std::function<void()>;
+	//! Runs on the event loop (holding the GIL) after the work is done, produces the result of the awaitable
+	using finish_function_t = std::function<py::object()>;
+	//! Called when the awaitable is cancelled while the work is running
+	using interrupt_function_t = std::function<void()>;
+
+public:
+	PythonAsyncTask(work_function_t work, finish_function_t finish, interrupt_function_t interrupt);
+
+public:
+	//! Starts the work on a background thread, returns the awaitable
+	//! Has to be called from within a running event loop
+	static py::object Start(work_function_t work, finish_function_t finish, interrupt_function_t interrupt);
+	//! Executes the pending query until the result is ready
+	//! Unlike DuckDBPyConnection::CompletePendingQuery this does not check for signals, as they are only delivered to
+	//! the main thread; cancelling the awaitable interrupts the query instead
+	static unique_ptr<QueryResult> CompletePendingQuery(PendingQueryResult &pending_query);
+
+private:
+	void Run();
+	py::object Finish();
+
+private:
+	work_function_t work;
+	finish_function_t finish;
+	interrupt_function_t interrupt;
+	//! The error thrown by the work (if any), rethrown when the awaitable is resolved
+	ErrorData error;
+	//! The awaitable, released by the background thread once it has been notified
+	py::object awaitable;
+};
+
+//! Arrow arrays fetched from a query result without holding the GIL, converted to pyarrow record batches later on
+struct PythonAsyncArrowChunks {
+public:
+	~PythonAsyncArrowChunks();
+
+public:
+	//! Fetches up to 'max_chunks' arrays of 'rows_per_batch' rows, returns false once the result is exhausted
+	//! Throws an InterruptException if the fetch is interrupted
+	bool Fetch(ChunkScanState &scan_state, const ClientProperties &options, idx_t rows_per_batch,
+	           idx_t max_chunks = DConstants::INVALID_INDEX);
+	//! Converts the fetched arrays into a list of pyarrow record batches, has to hold the GIL
+	py::list ToRecordBatches(const vector<LogicalType> &types, const vector<string> &names,
+	                         const ClientProperties &options);
+
+	//! Stops a running fetch, for when the awaitable is cancelled after the query finished
+	void Interrupt();
+
+public:
+	vector<ArrowArray> arrays;
+
+private:
+	atomic<bool> interrupted {false};
+};
+
+} // namespace duckdb
@@ -49,5 +49,9 @@ bool TryTransformPythonNumeric(Value &res, py::handle ele, const LogicalType &ta
 bool DictionaryHasMapFormat(const PyDictionary &dict);
 Value TransformPythonValue(py::handle ele, const LogicalType &target_type = LogicalType::UNKNOWN,
                            bool nan_as_null = true);
+//! Converts a parameter of a prepared statement, the most common types of parameters (int, float, str, bytes, bool,
+//! None, datetime and date) are detected by their exact type instead of going through GetPythonObjectType.
+//! If it is lossless the value is created with the 'expected_type' of the parameter, so the statement is not rebound
+Value TransformPythonParameter(py::handle ele, const LogicalType &expected_type = LogicalType::UNKNOWN);
 
 } // namespace duckdb
@@ -0,0 +1,38 @@
+//===----------------------------------------------------------------------===//
+//                         DuckDB
+//
+// duckdb_python/python_profiling.hpp
+//
+//
+//===----------------------------------------------------------------------===//
+
+#pragma once
+
+#include "duckdb/common/common.hpp"
+#include "duckdb/common/enums/profiler_format.hpp"
+#include "duckdb_python/pybind11/pybind_wrapper.hpp"
+
+namespace duckdb {
+class ClientContext;
+
+//! Enables the query profiler of a client for the lifetime of the scope, without printing or writing the profile
+class PythonProfilingScope {
+public:
+	explicit PythonProfilingScope(ClientContext &context);
+	~PythonProfilingScope();
+
+public:
+	//! The profile of the last query that finished within the scope, in the JSON format of the query profiler
+	string GetProfile() const;
+
+private:
+	ClientContext &context;
+	bool enable_profiler;
+	bool emit_profiler_output;
+	ProfilerPrintFormat profiler_print_format;
+};
+
+//! Creates a 'duckdb.profiling.QueryProfile' from the JSON created by the query profiler
+py::object CreatePythonProfile(const string &profile);
+
+} // namespace duckdb
@@ -0,0 +1,35 @@
+//===----------------------------------------------------------------------===//
+//                         DuckDB
+//
+// duckdb_python/python_signal_check.hpp
+//
+//
+//===----------------------------------------------------------------------===//
+
+#pragma once
+
+#include "duckdb/common/common.hpp"
+#include "duckdb/common/chrono.hpp"
+
+namespace duckdb {
+
+//! Checks for pending Python signals (e.g. a KeyboardInterrupt) while a query is executed without holding the GIL
+//! Checking for signals requires the GIL, acquiring it after every executed task makes a long running query contend
+//! for the GIL with every other Python thread, so the signals are checked at most once per interval instead
+class PythonSignalCheck {
+public:
+	static constexpr const int64_t DEFAULT_INTERVAL_MS = 50;
+
+public:
+	explicit PythonSignalCheck(int64_t interval_ms = DEFAULT_INTERVAL_MS);
+
+public:
+	//! Throws if a signal was raised since the last check, the GIL is only acquired if the interval has passed
+	void Check();
+
+private:
+	std::chrono::steady_clock::duration interval;
+	std::chrono::steady_clock::time_point next_check;
+};
+
+} // namespace duckdb
@@ -497,6 +497,97 @@ PythonObjectType GetPythonObjectType(py::handle &ele) {
 	}
 }
 
+template <class T>
+static Value TransformNumpyArrayValues(py::array &array, const LogicalType &child_type) {
+	auto count = idx_t(array.shape(0));
+	auto stride = array.strides(0);
+	auto data = const_data_ptr_cast(array.data());
+
+	vector<Value> values;
+	values.reserve(count);
+	for (idx_t i = 0; i < count; i++) {
+		// The stride can be negative, e.g. for a reversed view of an array
+		auto value = Load<T>(data + py::ssize_t(i) * stride);
+		if (std::is_floating_point<T>::value && Value::IsNan<T>(value)) {
+			// Like the elements of a list, a NaN is converted to NULL
+			values.emplace_back(child_type);
+			continue;
+		}
+		values.push_back(Value::CreateValue<T>(value));
+	}
+	return Value::LIST(child_type, std::move(values));
+}
+
+//! Converts a one dimensional NumPy array of a primitive dtype to a LIST by reading its buffer directly, instead of
+//! converting it to a Python list first and transforming every Python object of that list
+static bool TryTransformNumpyArray(py::handle ele, Value &result) {
+	auto &import_cache = *DuckDBPyConnection::ImportCache();
+	if (Py_TYPE(ele.ptr()) != reinterpret_cast<PyTypeObject *>(import_cache.numpy.ndarray().ptr())) {
+		// Subclasses (e.g. masked arrays) are converted through 'tolist'
+		return false;
+	}
+	auto array = py::reinterpret_borrow<py::array>(ele);
+	if (array.ndim() != 1) {
+		return false;
+	}
+	auto dtype = array.dtype();
+	if (!py::cast<bool>(dtype.attr("isnative"))) {
+		return false;
+	}
+	switch (dtype.kind()) {
+	case 'b':
+		result = TransformNumpyArrayValues<bool>(array, LogicalType::BOOLEAN);
+		return true;
+	case 'i':
+		switch (dtype.itemsize()) {
+		case 1:
+			result = TransformNumpyArrayValues<int8_t>(array, LogicalType::TINYINT);
+			return true;
+		case 2:
+			result = TransformNumpyArrayValues<int16_t>(array, LogicalType::SMALLINT);
+			return true;
+		case 4:
+			result = TransformNumpyArrayValues<int32_t>(array, LogicalType::INTEGER);
+			return true;
+		case 8:
+			result = TransformNumpyArrayValues<int64_t>(array, LogicalType::BIGINT);
+			return true;
+		default:
+			return false;
+		}
+	case 'u':
+		switch (dtype.itemsize()) {
+		case 1:
+			result = TransformNumpyArrayValues<uint8_t>(array, LogicalType::UTINYINT);
+			return true;
+		case 2:
+			result = TransformNumpyArrayValues<uint16_t>(array, LogicalType::USMALLINT);
+			return true;
+		case 4:
+			result = TransformNumpyArrayValues<uint32_t>(array, LogicalType::UINTEGER);
+			return true;
+		case 8:
+			result = TransformNumpyArrayValues<uint64_t>(array, LogicalType::UBIGINT);
+			return true;
+		default:
+			return false;
+		}
+	case 'f':
+		switch (dtype.itemsize()) {
+		case 4:
+			result = TransformNumpyArrayValues<float>(array, LogicalType::FLOAT);
+			return true;
+		case 8:
+			result = TransformNumpyArrayValues<double>(array, LogicalType::DOUBLE);
+			return true;
+		default:
+			return false;
+		}
+	default:
+		return false;
+	}
+}
+
 Value TransformPythonValue(py::handle ele, const LogicalType &target_type, bool nan_as_null) {
 	auto object_type = GetPythonObjectType(ele);
 
@@ -625,7 +716,13 @@ Value TransformPythonValue(py::handle ele, const LogicalType &target_type, bool
 			throw InvalidInputException("Can't convert tuple to a Value of type %s", target_type.ToString());
 		}
 	}
-	case PythonObjectType::NdArray:
+	case PythonObjectType::NdArray: {
+		Value array_value;
+		if (target_type.id() == LogicalTypeId::UNKNOWN && TryTransformNumpyArray(ele, array_value)) {
+			return array_value;
+		}
+		return TransformPythonValue(ele.attr("tolist")(), target_type, nan_as_null);
+	}
 	case PythonObjectType::NdDatetime:
 		return TransformPythonValue(ele.attr("tolist")(), target_type, nan_as_null);
 	case PythonObjectType::Value: {
@@ -647,4 +744,102 @@ Value TransformPythonValue(py::handle ele, const LogicalType &target_type, bool
 	}
 }
 
+static bool HasExpectedType(const LogicalType &expected_type) {
+	switch (expected_type.id()) {
+	case LogicalTypeId::INVALID:
+	case LogicalTypeId::UNKNOWN:
+	case LogicalTypeId::ANY:
+	case LogicalTypeId::SQLNULL:
+		return false;
+	default:
+		return true;
+	}
+}
+
+static bool TryTransformPythonIntegerParameter(py::handle ele, const LogicalType &expected_type, Value &result) {
+	int overflow;
+	int64_t value = PyLong_AsLongLongAndOverflow(ele.ptr(), &overflow);
+	if (overflow != 0 || (value == -1 && PyErr_Occurred())) {
+		// Leave the integers that don't fit in an int64_t to the generic conversion
+		PyErr_Clear();
+		return false;
+	}
+	if (expected_type.IsIntegral()) {
+		// The (strict) cast fails if the value does not fit in the expected type
+		auto integer = Value::BIGINT(value);
+		if (integer.DefaultTryCastAs(expected_type, true)) {
+			result = std::move(integer);
+			return true;
+		}
+	} else if (expected_type.id() == LogicalTypeId::DOUBLE) {
+		// Integers up to 2^53 can be represented exactly by a double
+		static constexpr int64_t MAX_EXACT_DOUBLE = int64_t(1) << 53;
+		if (value >= -MAX_EXACT_DOUBLE && value <= MAX_EXACT_DOUBLE) {
+			result = Value::DOUBLE(double(value));
+			return true;
+		}
+	}
+	return TrySniffPythonNumeric(result, value);
+}
+
+static bool TryTransformPythonParameter(py::handle ele, const LogicalType &expected_type, Value &result) {
+	auto object = ele.ptr();
+	if (object == Py_None) {
+		// A NULL of the expected type does not require the statement to be rebound
+		result = HasExpectedType(expected_type) ? Value(expected_type) : Value();
+		return true;
+	}
+	auto type = Py_TYPE(object);
+	if (type == &PyBool_Type) {
+		result = Value::BOOLEAN(object == Py_True);
+		return true;
+	}
+	if (type == &PyLong_Type) {
+		return TryTransformPythonIntegerParameter(ele, expected_type, result);
+	}
+	if (type == &PyFloat_Type) {
+		result = Value::DOUBLE(PyFloat_AS_DOUBLE(object));
+		return true;
+	}
+	if (type == &PyUnicode_Type) {
+		Py_ssize_t size;
+		auto data = PyUnicode_AsUTF8AndSize(object, &size);
+		if (!data) {
+			// Let the generic conversion produce the error
+			PyErr_Clear();
+			return false;
+		}
+		result = Value(string(data, idx_t(size)));
+		return true;
+	}
+	if (type == &PyBytes_Type) {
+		result = Value::BLOB(const_data_ptr_cast(PyBytes_AS_STRING(object)), idx_t(PyBytes_GET_SIZE(object)));
+		return true;
+	}
+	auto &import_cache = *DuckDBPyConnection::ImportCache();
+	if (type == reinterpret_cast<PyTypeObject *>(import_cache.datetime.datetime().ptr())) {
+		auto datetime = PyDateTime(ele);
+		if (!datetime.tzone_obj.is_none()) {
+			// The UTC offset of the timezone has to be looked up
+			return false;
+		}
+		result = datetime.ToDuckValue(LogicalType::UNKNOWN);
+		return true;
+	}
+	if (type == reinterpret_cast<PyTypeObject *>(import_cache.datetime.date().ptr())) {
+		auto date = PyDate(ele);
+		result = date.ToDuckValue();
+		return true;
+	}
+	return false;
+}
+
+Value TransformPythonParameter(py::handle ele, const LogicalType &expected_type) {
+	Value result;
+	if (TryTransformPythonParameter(ele, expected_type, result)) {
+		return result;
+	}
+	return TransformPythonValue(ele, LogicalType::UNKNOWN, false);
+}
+
 } // namespace duckdb
@@ -8,11 +8,117 @@
 #include "duckdb/main/client_context.hpp"
 #include "duckdb_python/pandas/column/pandas_numpy_column.hpp"
 #include "duckdb/parser/tableref/table_function_ref.hpp"
+#include "duckdb/planner/table_filter.hpp"
+#include "duckdb/storage/statistics/numeric_stats.hpp"
+#include "duckdb/storage/table/column_segment.hpp"
 
 #include "duckdb/common/atomic.hpp"
 
 namespace duckdb {
 
+//! The min/max of every vector of a column, used to skip the vectors that can not satisfy the pushed down filters
+struct PandasColumnZoneMap {
+	//! Empty if the column does not have a zone map
+	vector<BaseStatistics> vector_stats;
+};
+
+template <class T>
+static bool IsNanValue(T value) {
+	return false;
+}
+
+template <>
+bool IsNanValue(float value) {
+	return Value::IsNan(value);
+}
+
+template <>
+bool IsNanValue(double value) {
+	return Value::IsNan(value);
+}
+
+template <class T>
+static void ComputeZoneMap(const PandasNumpyColumn &column, const LogicalType &type, idx_t row_count,
+                           PandasColumnZoneMap &zone_map) {
+	if (!type.IsNumeric() || type.InternalType() != GetTypeId<T>()) {
+		return;
+	}
+	auto src_ptr = reinterpret_cast<const T *>(column.array.data());
+	auto stride = column.stride / sizeof(T);
+	for (idx_t start = 0; start < row_count; start += STANDARD_VECTOR_SIZE) {
+		auto end = MinValue<idx_t>(start + STANDARD_VECTOR_SIZE, row_count);
+		auto stats = NumericStats::CreateUnknown(type);
+		bool has_value = false;
+		T min_value = T();
+		T max_value = T();
+		for (idx_t i = start; i < end; i++) {
+			auto value = src_ptr[i * stride];
+			if (IsNanValue(value)) {
+				// NaN values are converted to NULL
+				continue;
+			}
+			// Masked (NULL) values are included as well, that can only make the range wider
+			if (!has_value || value < min_value) {
+				min_value = value;
+			}
+			if (!has_value || value > max_value) {
+				max_value = value;
+			}
+			has_value = true;
+		}
+		if (has_value) {
+			NumericStats::SetMin(stats, Value::CreateValue<T>(min_value));
+			NumericStats::SetMax(stats, Value::CreateValue<T>(max_value));
+		}
+		zone_map.vector_stats.push_back(std::move(stats));
+	}
+}
+
+static unique_ptr<PandasColumnZoneMap> CreateZoneMap(const PandasColumnBindData &bind_data, const LogicalType &type,
+                                                     idx_t row_count) {
+	auto result = make_uniq<PandasColumnZoneMap>();
+	if (bind_data.pandas_col->Backend() != PandasColumnBackend::NUMPY) {
+		return result;
+	}
+	auto &column = reinterpret_cast<const PandasNumpyColumn &>(*bind_data.pandas_col);
+	// Only the numeric columns that are scanned without changing the values have a zone map
+	switch (bind_data.numpy_type.type) {
+	case NumpyNullableType::UINT_8:
+		ComputeZoneMap<uint8_t>(column, type, row_count, *result);
+		break;
+	case NumpyNullableType::UINT_16:
+		ComputeZoneMap<uint16_t>(column, type, row_count, *result);
+		break;
+	case NumpyNullableType::UINT_32:
+		ComputeZoneMap<uint32_t>(column, type, row_count, *result);
+		break;
+	case NumpyNullableType::UINT_64:
+		ComputeZoneMap<uint64_t>(column, type, row_count, *result);
+		break;
+	case NumpyNullableType::INT_8:
+		ComputeZoneMap<int8_t>(column, type, row_count, *result);
+		break;
+	case NumpyNullableType::INT_16:
+		ComputeZoneMap<int16_t>(column, type, row_count, *result);
+		break;
+	case NumpyNullableType::INT_32:
+		ComputeZoneMap<int32_t>(column, type, row_count, *result);
+		break;
+	case NumpyNullableType::INT_64:
+		ComputeZoneMap<int64_t>(column, type, row_count, *result);
+		break;
+	case NumpyNullableType::FLOAT_32:
+		ComputeZoneMap<float>(column, type, row_count, *result);
+		break;
+	case NumpyNullableType::FLOAT_64:
+		ComputeZoneMap<double>(column, type, row_count, *result);
+		break;
+	default:
+		break;
+	}
+	return result;
+}
+
 struct PandasScanFunctionData : public TableFunctionData {
 	PandasScanFunctionData(py::handle df, idx_t row_count, vector<PandasColumnBindData> pandas_bind_data,
 	                       vector<LogicalType> sql_types, shared_ptr<DependencyItem> dependency)
@@ -35,6 +141,18 @@ struct PandasScanFunctionData : public TableFunctionData {
 	}
 };
 
+struct PandasScanFilter {
+	PandasScanFilter(idx_t scan_idx, TableFilter &filter, optional_ptr<PandasColumnZoneMap> zone_map)
+	    : scan_idx(scan_idx), filter(filter), zone_map(zone_map) {
+	}
+
+	//! The index of the filtered column in the column_ids
+	idx_t scan_idx;
+	TableFilter &filter;
+	//! The zone map of the filtered column (if any)
+	optional_ptr<PandasColumnZoneMap> zone_map;
+};
+
 struct PandasScanLocalState : public LocalTableFunctionState {
 	PandasScanLocalState(idx_t start, idx_t end) : start(start), end(end), batch_index(0) {
 	}
@@ -43,16 +161,35 @@ struct PandasScanLocalState : public LocalTableFunctionState {
 	idx_t end;
 	idx_t batch_index;
 	vector<column_t> column_ids;
+	vector<PandasScanFilter> filters;
+	//! Whether the column (in the column_ids) is filtered
+	vector<bool> filtered_columns;
 };
 
 struct PandasScanGlobalState : public GlobalTableFunctionState {
-	explicit PandasScanGlobalState(idx_t max_threads) : position(0), batch_index(0), max_threads(max_threads) {
+	PandasScanGlobalState(idx_t max_threads, idx_t column_count)
+	    : position(0), batch_index(0), max_threads(max_threads) {
+		zone_maps.resize(column_count);
 	}
 
 	std::mutex lock;
 	idx_t position;
 	idx_t batch_index;
 	idx_t max_threads;
+	mutex zone_map_lock;
+	//! The zone maps of the columns, computed the first time a filter is pushed down on the column.
+	//! They are kept per execution rather than on the bind data: a prepared statement reuses the bind data, and
+	//! the values of the DataFrame can be changed in place between executions
+	vector<unique_ptr<PandasColumnZoneMap>> zone_maps;
+
+	PandasColumnZoneMap &GetZoneMap(const PandasScanFunctionData &bind_data, idx_t col_idx) {
+		lock_guard<mutex> guard(zone_map_lock);
+		if (!zone_maps[col_idx]) {
+			zone_maps[col_idx] =
+			    CreateZoneMap(bind_data.pandas_bind_data[col_idx], bind_data.sql_types[col_idx], bind_data.row_count);
+		}
+		return *zone_maps[col_idx];
+	}
 
 	idx_t MaxThreads() const override {
 		return max_threads;
@@ -67,6 +204,7 @@ PandasScanFunction::PandasScanFunction()
 	table_scan_progress = PandasProgress;
 	serialize = PandasSerialize;
 	projection_pushdown = true;
+	filter_pushdown = true;
 }
 
 idx_t PandasScanFunction::PandasScanGetBatchIndex(ClientContext &context, const FunctionData *bind_data_p,
@@ -113,7 +251,9 @@ unique_ptr<GlobalTableFunctionState> PandasScanFunction::PandasScanInitGlobal(Cl
 	if (PyGILState_Check()) {
 		throw InvalidInputException("PandasScan called but GIL was already held!");
 	}
-	return make_uniq<PandasScanGlobalState>(PandasScanMaxThreads(context, input.bind_data.get()));
+	auto &bind_data = input.bind_data->Cast<PandasScanFunctionData>();
+	return make_uniq<PandasScanGlobalState>(PandasScanMaxThreads(context, input.bind_data.get()),
+	                                        bind_data.pandas_bind_data.size());
 }
 
 unique_ptr<LocalTableFunctionState> PandasScanFunction::PandasScanInitLocal(ExecutionContext &context,
@@ -121,6 +261,24 @@ unique_ptr<LocalTableFunctionState> PandasScanFunction::PandasScanInitLocal(Exec
                                                                             GlobalTableFunctionState *gstate) {
 	auto result = make_uniq<PandasScanLocalState>(0, 0);
 	result->column_ids = input.column_ids;
+	if (input.filters) {
+		auto &bind_data = input.bind_data->Cast<PandasScanFunctionData>();
+		auto &global_state = gstate->Cast<PandasScanGlobalState>();
+		result->filtered_columns.resize(input.column_ids.size(), false);
+		for (auto &entry : input.filters->filters) {
+			auto scan_idx = entry.first;
+			auto col_idx = input.column_ids[scan_idx];
+			optional_ptr<PandasColumnZoneMap> zone_map;
+			if (col_idx != COLUMN_IDENTIFIER_ROW_ID) {
+				auto &column_zone_map = global_state.GetZoneMap(bind_data, col_idx);
+				if (!column_zone_map.vector_stats.empty()) {
+					zone_map = &column_zone_map;
+				}
+			}
+			result->filters.emplace_back(scan_idx, *entry.second, zone_map);
+			result->filtered_columns[scan_idx] = true;
+		}
+	}
 	PandasScanParallelStateNext(context.client, input.bind_data.get(), result.get(), gstate);
 	return std::move(result);
 }
@@ -178,30 +336,82 @@ void PandasScanFunction::PandasBackendScanSwitch(PandasColumnBindData &bind_data
 	}
 }
 
+static void PandasScanColumn(PandasScanFunctionData &data, column_t col_idx, idx_t count, idx_t offset, Vector &out) {
+	if (col_idx == COLUMN_IDENTIFIER_ROW_ID) {
+		out.Sequence(offset, 1, count);
+	} else {
+		PandasScanFunction::PandasBackendScanSwitch(data.pandas_bind_data[col_idx], count, offset, out);
+	}
+}
+
+//! Scans the rows [offset, offset + count) into the output, returns false if none of the rows satisfy the filters
+static bool PandasScanVector(PandasScanFunctionData &data, PandasScanLocalState &state, idx_t count, idx_t offset,
+                             DataChunk &output) {
+	if (state.filters.empty()) {
+		output.SetCardinality(count);
+		for (idx_t idx = 0; idx < state.column_ids.size(); idx++) {
+			PandasScanColumn(data, state.column_ids[idx], count, offset, output.data[idx]);
+		}
+		return true;
+	}
+	// Skip the vector if the min/max of a filtered column show that none of the rows can satisfy the filter
+	D_ASSERT(offset % STANDARD_VECTOR_SIZE == 0);
+	auto vector_idx = offset / STANDARD_VECTOR_SIZE;
+	for (auto &filter : state.filters) {
+		if (filter.zone_map && filter.filter.CheckStatistics(filter.zone_map->vector_stats[vector_idx]) ==
+		                           FilterPropagateResult::FILTER_ALWAYS_FALSE) {
+			return false;
+		}
+	}
+	// The filtered columns are scanned first, the other columns are only scanned if any of the rows are selected
+	SelectionVector sel;
+	sel.Initialize(nullptr);
+	idx_t approved_count = count;
+	for (auto &filter : state.filters) {
+		auto &vector = output.data[filter.scan_idx];
+		PandasScanColumn(data, state.column_ids[filter.scan_idx], count, offset, vector);
+		UnifiedVectorFormat vdata;
+		vector.ToUnifiedFormat(count, vdata);
+		ColumnSegment::FilterSelection(sel, vector, vdata, filter.filter, count, approved_count);
+		if (approved_count == 0) {
+			return false;
+		}
+	}
+	for (idx_t idx = 0; idx < state.column_ids.size(); idx++) {
+		if (!state.filtered_columns[idx]) {
+			PandasScanColumn(data, state.column_ids[idx], count, offset, output.data[idx]);
+		}
+	}
+	output.SetCardinality(count);
+	if (approved_count < count) {
+		output.Slice(sel, approved_count);
+	}
+	return true;
+}
+
 //! The main pandas scan function: note that this can be called in parallel without the GIL
 //! hence this needs to be GIL-safe, i.e. no methods that create Python objects are allowed
 void PandasScanFunction::PandasScanFunc(ClientContext &context, TableFunctionInput &data_p, DataChunk &output) {
 	auto &data = data_p.bind_data->CastNoConst<PandasScanFunctionData>();
 	auto &state = data_p.local_state->Cast<PandasScanLocalState>();
 
-	if (state.start >= state.end) {
-		if (!PandasScanParallelStateNext(context, data_p.bind_data.get(), data_p.local_state.get(),
-		                                 data_p.global_state.get())) {
-			return;
+	while (true) {
+		if (state.start >= state.end) {
+			if (!PandasScanParallelStateNext(context, data_p.bind_data.get(), data_p.local_state.get(),
+			                                 data_p.global_state.get())) {
+				return;
+			}
 		}
-	}
-	idx_t this_count = std::min((idx_t)STANDARD_VECTOR_SIZE, state.end - state.start);
-	output.SetCardinality(this_count);
-	for (idx_t idx = 0; idx < state.column_ids.size(); idx++) {
-		auto col_idx = state.column_ids[idx];
-		if (col_idx == COLUMN_IDENTIFIER_ROW_ID) {
-			output.data[idx].Sequence(state.start, 1, this_count);
-		} else {
-			PandasBackendScanSwitch(data.pandas_bind_data[col_idx], this_count, state.start, output.data[idx]);
+		idx_t this_count = std::min((idx_t)STANDARD_VECTOR_SIZE, state.end - state.start);
+		idx_t offset = state.start;
+		state.start += this_count;
+		data.lines_read += this_count;
+		if (PandasScanVector(data, state, this_count, offset, output)) {
+			return;
 		}
+		// None of the rows satisfy the filters, move on to the next vector
+		output.Reset();
 	}
-	state.start += this_count;
-	data.lines_read += this_count;
 }
 
 unique_ptr<NodeStatistics> PandasScanFunction::PandasScanCardinality(ClientContext &context,
@@ -13,14 +13,21 @@
 #include "duckdb/main/db_instance_cache.hpp"
 #include "duckdb/main/extension_helper.hpp"
 #include "duckdb/main/prepared_statement.hpp"
+#include "duckdb/main/prepared_statement_data.hpp"
 #include "duckdb/main/relation/read_csv_relation.hpp"
 #include "duckdb/main/relation/read_json_relation.hpp"
 #include "duckdb/main/relation/value_relation.hpp"
 #include "duckdb/main/relation/view_relation.hpp"
 #include "duckdb/parser/expression/constant_expression.hpp"
 #include "duckdb/parser/expression/function_expression.hpp"
+#include "duckdb/parser/expression/parameter_expression.hpp"
+#include "duckdb/parser/expression/subquery_expression.hpp"
+#include "duckdb/parser/parsed_expression_iterator.hpp"
 #include "duckdb/parser/parsed_data/create_table_function_info.hpp"
 #include "duckdb/parser/parser.hpp"
+#include "duckdb/parser/query_node/cte_node.hpp"
+#include "duckdb/parser/query_node/select_node.hpp"
+#include "duckdb/parser/query_node/set_operation_node.hpp"
 #include "duckdb/parser/statement/select_statement.hpp"
 #include "duckdb/parser/tableref/subqueryref.hpp"
 #include "duckdb/parser/tableref/table_function_ref.hpp"
@@ -41,6 +48,10 @@
 #include "duckdb/catalog/default/default_types.hpp"
 #include "duckdb/main/relation/value_relation.hpp"
 #include "duckdb_python/filesystem_object.hpp"
+#include "duckdb_python/python_profiling.hpp"
+#include "duckdb_python/python_async.hpp"
+#include "duckdb_python/python_signal_check.hpp"
+#include "duckdb_python/pyprepared_statement.hpp"
 #include "duckdb/parser/parsed_data/create_scalar_function_info.hpp"
 #include "duckdb/function/scalar_function.hpp"
 #include "duckdb_python/pandas/pandas_scan.hpp"
@@ -48,6 +59,7 @@
 #include "duckdb/function/function.hpp"
 #include "duckdb_python/pybind11/conversions/exception_handling_enum.hpp"
 #include "duckdb/parser/parsed_data/drop_info.hpp"
+#include "duckdb/main/client_context_state.hpp"
 #include "duckdb/catalog/catalog_entry/scalar_function_catalog_entry.hpp"
 #include "duckdb/main/pending_query_result.hpp"
 #include "duckdb/parser/keyword_helper.hpp"
@@ -70,10 +82,22 @@ DBInstanceCache instance_cache;
 shared_ptr<PythonImportCache> DuckDBPyConnection::import_cache = nullptr;              // NOLINT: allow global
 PythonEnvironmentType DuckDBPyConnection::environment = PythonEnvironmentType::NORMAL; // NOLINT: allow global
 
+//! Stored in the client context of a connection, refers back to the DuckDBPyConnection that owns it
+struct PythonConnectionState : public ClientContextState {
+	static constexpr const char *NAME = "python_connection";
+
+	explicit PythonConnectionState(weak_ptr<DuckDBPyConnection> connection_p) : connection(std::move(connection_p)) {
+	}
+
+	weak_ptr<DuckDBPyConnection> connection;
+};
+
 DuckDBPyConnection::~DuckDBPyConnection() {
 	try {
 		py::gil_scoped_release gil;
 		// Release any structures that do not need to hold the GIL here
+		statement_cache.Clear();
+		result_cache.Clear();
 		con.SetDatabase(nullptr);
 		con.SetConnection(nullptr);
 	} catch (...) { // NOLINT
@@ -166,7 +190,25 @@ static void InitializeConnectionMethods(py::class_<DuckDBPyConnection, shared_pt
 	m.def("duplicate", &DuckDBPyConnection::Cursor, "Create a duplicate of the current connection");
 	m.def("execute", &DuckDBPyConnection::Execute,
 	      "Execute the given SQL query, optionally using prepared statements with parameters set", py::arg("query"),
-	      py::arg("parameters") = py::none());
+	      py::arg("parameters") = py::none(), py::kw_only(), py::arg("profile") = false);
+	m.def("get_profile", &DuckDBPyConnection::GetProfile,
+	      "Get the profile of the last query that was executed with 'profile=True'");
+	m.def("prepare", &DuckDBPyConnection::Prepare,
+	      "Prepare the given SQL query, returns a prepared statement that can be executed multiple times",
+	      py::arg("query"));
+	m.def("set_statement_cache_size", &DuckDBPyConnection::SetStatementCacheSize,
+	      "Set the maximum amount of prepared statements cached by execute and sql, 0 disables the cache",
+	      py::arg("size"));
+	m.def("statement_cache_info", &DuckDBPyConnection::GetStatementCacheInfo,
+	      "Get the hits, misses, size and capacity of the statement cache");
+	m.def("set_result_cache_size", &DuckDBPyConnection::SetResultCacheSize,
+	      "Set the maximum amount of memory (in bytes) used by the results cached by execute, 0 disables the cache",
+	      py::arg("size"));
+	m.def("result_cache_info", &DuckDBPyConnection::GetResultCacheInfo,
+	      "Get the hits, misses, size, memory usage and capacity of the result cache");
+	m.def("execute_async", &DuckDBPyConnection::ExecuteAsync,
+	      "Execute the given SQL query on a background thread, returns an awaitable that resolves to the connection",
+	      py::arg("query"), py::arg("parameters") = py::none());
 	m.def("executemany", &DuckDBPyConnection::ExecuteMany,
 	      "Execute the given prepared statement multiple times using the list of parameter sets in parameters",
 	      py::arg("query"), py::arg("parameters") = py::none());
@@ -193,7 +235,9 @@ static void InitializeConnectionMethods(py::class_<DuckDBPyConnection, shared_pt
 	m.def("arrow", &DuckDBPyConnection::FetchArrow, "Fetch a result as Arrow table following execute()",
 	      py::arg("rows_per_batch") = 1000000);
 	m.def("fetch_record_batch", &DuckDBPyConnection::FetchRecordBatchReader,
-	      "Fetch an Arrow RecordBatchReader following execute()", py::arg("rows_per_batch") = 1000000);
+	      "Fetch an Arrow RecordBatchReader following execute(), with 'prefetch' set up to 'prefetch' batches are "
+	      "produced ahead on a background thread",
+	      py::arg("rows_per_batch") = 1000000, py::kw_only(), py::arg("prefetch") = 0);
 	m.def("torch", &DuckDBPyConnection::FetchPyTorch, "Fetch a result as dict of PyTorch Tensors following execute()");
 	m.def("tf", &DuckDBPyConnection::FetchTF, "Fetch a result as dict of TensorFlow Tensors following execute()");
 	m.def("begin", &DuckDBPyConnection::Begin, "Start a new transaction");
@@ -458,13 +502,9 @@ shared_ptr<DuckDBPyConnection> DuckDBPyConnection::ExecuteMany(const py::object
 
 unique_ptr<QueryResult> DuckDBPyConnection::CompletePendingQuery(PendingQueryResult &pending_query) {
 	PendingExecutionResult execution_result;
+	PythonSignalCheck signal_check;
 	while (!PendingQueryResult::IsResultReady(execution_result = pending_query.ExecuteTask())) {
-		{
-			py::gil_scoped_acquire gil;
-			if (PyErr_CheckSignals() != 0) {
-				throw std::runtime_error("Query interrupted");
-			}
-		}
+		signal_check.Check();
 		if (execution_result == PendingExecutionResult::BLOCKED) {
 			pending_query.WaitForTask();
 		}
@@ -508,27 +548,43 @@ py::list TransformNamedParameters(const case_insensitive_map_t<idx_t> &named_par
 	return new_params;
 }
 
-case_insensitive_map_t<BoundParameterData> TransformPreparedParameters(PreparedStatement &prep,
-                                                                       const py::object &params) {
+//! The type of the parameter the statement was bound with, a value of a different type requires a rebind
+static LogicalType GetExpectedParameterType(optional_ptr<PreparedStatementData> data, const string &identifier) {
+	if (!data) {
+		return LogicalType::UNKNOWN;
+	}
+	auto entry = data->value_map.find(identifier);
+	if (entry == data->value_map.end() || !entry->second) {
+		return LogicalType::UNKNOWN;
+	}
+	return entry->second->return_type;
+}
+
+case_insensitive_map_t<BoundParameterData>
+TransformPreparedParameters(const case_insensitive_map_t<idx_t> &named_param_map, const py::object &params,
+                            optional_ptr<PreparedStatementData> data = nullptr) {
 	case_insensitive_map_t<BoundParameterData> named_values;
 	if (py::is_list_like(params)) {
-		if (prep.named_param_map.size() != py::len(params)) {
+		if (named_param_map.size() != py::len(params)) {
 			if (py::len(params) == 0) {
-				throw InvalidInputException("Expected %d parameters, but none were supplied",
-				                            prep.named_param_map.size());
+				throw InvalidInputException("Expected %d parameters, but none were supplied", named_param_map.size());
 			}
-			throw InvalidInputException("Prepared statement needs %d parameters, %d given", prep.named_param_map.size(),
+			throw InvalidInputException("Prepared statement needs %d parameters, %d given", named_param_map.size(),
 			                            py::len(params));
 		}
-		auto unnamed_values = DuckDBPyConnection::TransformPythonParamList(params);
-		for (idx_t i = 0; i < unnamed_values.size(); i++) {
-			auto &value = unnamed_values[i];
-			auto identifier = std::to_string(i + 1);
+		idx_t i = 0;
+		for (auto param : params) {
+			auto identifier = std::to_string(++i);
+			auto value = TransformPythonParameter(param, GetExpectedParameterType(data, identifier));
 			named_values[identifier] = BoundParameterData(std::move(value));
 		}
 	} else if (py::is_dict_like(params)) {
 		auto dict = py::cast<py::dict>(params);
-		named_values = DuckDBPyConnection::TransformPythonParamDict(dict);
+		for (auto pair : dict) {
+			auto identifier = std::string(py::str(pair.first));
+			auto value = TransformPythonParameter(pair.second, GetExpectedParameterType(data, identifier));
+			named_values[identifier] = BoundParameterData(std::move(value));
+		}
 	} else {
 		throw InvalidInputException("Prepared parameters can only be passed as a list or a dictionary");
 	}
@@ -550,19 +606,26 @@ unique_ptr<PreparedStatement> DuckDBPyConnection::PrepareQuery(unique_ptr<SQLSta
 	return prep;
 }
 
-unique_ptr<QueryResult> DuckDBPyConnection::ExecuteInternal(PreparedStatement &prep, py::object params) {
+unique_ptr<QueryResult> DuckDBPyConnection::ExecuteInternal(PreparedStatement &prep, py::object params,
+                                                            bool stream_result) {
 	if (params.is_none()) {
 		params = py::list();
 	}
 
 	// Execute the prepared statement with the prepared parameters
-	auto named_values = TransformPreparedParameters(prep, params);
+	auto named_values = TransformPreparedParameters(prep.named_param_map, params, prep.data.get());
+	return ExecuteInternal(prep, named_values, stream_result);
+}
+
+unique_ptr<QueryResult> DuckDBPyConnection::ExecuteInternal(PreparedStatement &prep,
+                                                            case_insensitive_map_t<BoundParameterData> &named_values,
+                                                            bool stream_result) {
 	unique_ptr<QueryResult> res;
 	{
 		py::gil_scoped_release release;
 		unique_lock<std::mutex> lock(py_connection_lock);
 
-		auto pending_query = prep.PendingQuery(named_values);
+		auto pending_query = prep.PendingQuery(named_values, stream_result);
 		if (pending_query->HasError()) {
 			pending_query->ThrowError();
 		}
@@ -586,32 +649,150 @@ vector<unique_ptr<SQLStatement>> DuckDBPyConnection::GetStatements(const py::obj
 	}
 	if (py::isinstance<py::str>(query)) {
 		auto sql_query = std::string(py::str(query));
-		return connection.ExtractStatements(sql_query);
+		result = connection.ExtractStatements(sql_query);
+	} else {
+		throw InvalidInputException("Please provide either a DuckDBPyStatement or a string representing the query");
+	}
+	if (statement_cache.IsEnabled() || result_cache.IsEnabled()) {
+		for (auto &statement : result) {
+			if (PythonStatementCache::InvalidatesCache(statement->type)) {
+				statement_cache.Clear();
+				result_cache.Clear();
+				break;
+			}
+		}
 	}
-	throw InvalidInputException("Please provide either a DuckDBPyStatement or a string representing the query");
+	return result;
+}
+
+shared_ptr<PreparedStatement> DuckDBPyConnection::GetCachedStatement(const py::object &query, const py::object &params,
+                                                                     string &cache_key) {
+	if (!statement_cache.IsEnabled() || !py::isinstance<py::str>(query)) {
+		return nullptr;
+	}
+	cache_key = PythonStatementCache::GetKey(std::string(py::str(query)), params);
+	return statement_cache.Lookup(cache_key);
+}
+
+shared_ptr<PreparedStatement> DuckDBPyConnection::PrepareAndCache(unique_ptr<SQLStatement> statement,
+                                                                  const string &cache_key) {
+	bool cacheable = !cache_key.empty() && PythonStatementCache::IsCacheable(statement->type);
+	shared_ptr<PreparedStatement> prep = PrepareQuery(std::move(statement));
+	if (cacheable && PythonStatementCache::IsCacheable(*prep->data)) {
+		statement_cache.Insert(cache_key, prep);
+	}
+	return prep;
+}
+
+void DuckDBPyConnection::SetStatementCacheSize(idx_t size) {
+	statement_cache.SetCapacity(size);
+}
+
+py::dict DuckDBPyConnection::GetStatementCacheInfo() {
+	return statement_cache.GetInfo();
+}
+
+unique_ptr<DuckDBPyRelation> DuckDBPyConnection::ExecuteWithResultCache(const string &query, PreparedStatement &prep,
+                                                                        py::object params) {
+	if (params.is_none()) {
+		params = py::list();
+	}
+	auto named_values = TransformPreparedParameters(prep.named_param_map, params, prep.data.get());
+	auto &connection = con.GetConnection();
+
+	vector<ResultCacheDataVersion> versions;
+	bool cacheable;
+	{
+		py::gil_scoped_release release;
+		unique_lock<std::mutex> lock(py_connection_lock);
+		cacheable = PythonResultCache::IsCacheable(*connection.context, *prep.data, versions);
+	}
+	auto cache_key = cacheable ? PythonResultCache::GetKey(query, named_values) : string();
+	if (cacheable && !result_cache.Contains(cache_key, versions)) {
+		// The result is only cached if the functions of the statement are consistent, a cached result for the key has
+		// already passed this check
+		py::gil_scoped_release release;
+		unique_lock<std::mutex> lock(py_connection_lock);
+		cacheable = PythonResultCache::IsConsistent(*connection.context, *prep.data, named_values);
+	}
+	if (!cacheable) {
+		auto res = ExecuteInternal(prep, named_values);
+		return make_uniq<DuckDBPyRelation>(make_uniq<DuckDBPyResult>(std::move(res)));
+	}
+
+	auto cached_result = result_cache.Lookup(cache_key, versions);
+	if (!cached_result) {
+		// The versions were obtained before the query is executed, a change that is committed in the meantime makes
+		// the cached result stale instead of going unnoticed
+		auto data = prep.data;
+		auto res = ExecuteInternal(prep, named_values, false);
+		auto &materialized = res->Cast<MaterializedQueryResult>();
+		cached_result =
+		    make_shared_ptr<PythonCachedResult>(materialized.TakeCollection(), res->names, std::move(versions));
+		if (prep.data == data) {
+			// The statement was not rebound while it was executed
+			result_cache.Insert(cache_key, cached_result);
+		}
+	}
+	auto relation =
+	    make_shared_ptr<MaterializedRelation>(connection.context, cached_result->collection, cached_result->names);
+	return make_uniq<DuckDBPyRelation>(std::move(relation));
+}
+
+void DuckDBPyConnection::SetResultCacheSize(idx_t size) {
+	result_cache.SetCapacity(size);
+}
+
+py::dict DuckDBPyConnection::GetResultCacheInfo() {
+	return result_cache.GetInfo();
 }
 
 shared_ptr<DuckDBPyConnection> DuckDBPyConnection::ExecuteFromString(const string &query) {
 	return Execute(py::str(query));
 }
 
-shared_ptr<DuckDBPyConnection> DuckDBPyConnection::Execute(const py::object &query, py::object params) {
+shared_ptr<DuckDBPyConnection> DuckDBPyConnection::Execute(const py::object &query, py::object params, bool profile) {
 	con.SetResult(nullptr);
 
-	auto statements = GetStatements(query);
-	if (statements.empty()) {
-		// TODO: should we throw?
-		return nullptr;
-	}
+	unique_ptr<QueryResult> res;
+	string cache_key;
+	auto prep = profile ? nullptr : GetCachedStatement(query, params, cache_key);
+	bool single_statement = true;
+	if (!prep) {
+		auto statements = GetStatements(query);
+		if (statements.empty()) {
+			// TODO: should we throw?
+			return nullptr;
+		}
 
-	auto last_statement = std::move(statements.back());
-	statements.pop_back();
-	// First immediately execute any preceding statements (if any)
-	// FIXME: SQLites implementation says to not accept an 'execute' call with multiple statements
-	ExecuteImmediately(std::move(statements));
+		auto last_statement = std::move(statements.back());
+		statements.pop_back();
+		if (!statements.empty()) {
+			// Only a single statement can be cached
+			cache_key.clear();
+			single_statement = false;
+		}
+		// First immediately execute any preceding statements (if any)
+		// FIXME: SQLites implementation says to not accept an 'execute' call with multiple statements
+		ExecuteImmediately(std::move(statements));
 
-	auto prep = PrepareQuery(std::move(last_statement));
-	auto res = ExecuteInternal(*prep, std::move(params));
+		if (profile) {
+			// The profile is only complete once the query has finished, so the result is materialized
+			PythonProfilingScope profiling(*con.GetConnection().context);
+			auto profiled_prep = PrepareQuery(std::move(last_statement));
+			res = ExecuteInternal(*profiled_prep, std::move(params), false);
+			last_profile = profiling.GetProfile();
+		} else {
+			prep = PrepareAndCache(std::move(last_statement), cache_key);
+		}
+	}
+	if (prep) {
+		if (single_statement && result_cache.IsEnabled() && py::isinstance<py::str>(query)) {
+			con.SetResult(ExecuteWithResultCache(std::string(py::str(query)), *prep, std::move(params)));
+			return shared_from_this();
+		}
+		res = ExecuteInternal(*prep, std::move(params));
+	}
 
 	// Set the internal 'result' object
 	if (res) {
@@ -621,6 +802,72 @@ shared_ptr<DuckDBPyConnection> DuckDBPyConnection::Execute(const py::object &que
 	return shared_from_this();
 }
 
+py::object DuckDBPyConnection::GetProfile() {
+	if (last_profile.empty()) {
+		throw InvalidInputException("No query has been profiled yet, use 'execute' with 'profile=True' first");
+	}
+	return CreatePythonProfile(last_profile);
+}
+
+shared_ptr<DuckDBPyPreparedStatement> DuckDBPyConnection::Prepare(const py::object &query) {
+	auto statements = GetStatements(query);
+	if (statements.size() != 1) {
+		throw InvalidInputException("Please provide exactly one statement to prepare, %d statements were provided",
+		                            statements.size());
+	}
+	auto prep = PrepareQuery(std::move(statements[0]));
+	return make_shared_ptr<DuckDBPyPreparedStatement>(shared_from_this(), std::move(prep));
+}
+
+py::object DuckDBPyConnection::ExecuteAsync(const py::object &query, py::object params) {
+	con.SetResult(nullptr);
+	if (params.is_none()) {
+		params = py::list();
+	}
+
+	auto statements = GetStatements(query);
+	if (statements.empty()) {
+		throw InvalidInputException("Please provide a query to execute");
+	}
+
+	auto last_statement = std::move(statements.back());
+	statements.pop_back();
+	// The preceding statements and the preparation of the last statement are not run asynchronously
+	ExecuteImmediately(std::move(statements));
+
+	struct AsyncExecuteState {
+		unique_ptr<PreparedStatement> prep;
+		case_insensitive_map_t<BoundParameterData> named_values;
+		unique_ptr<QueryResult> result;
+	};
+	auto state = make_shared_ptr<AsyncExecuteState>();
+	state->prep = PrepareQuery(std::move(last_statement));
+	state->named_values = TransformPreparedParameters(state->prep->named_param_map, params, state->prep->data.get());
+
+	auto connection = shared_from_this();
+	auto work = [connection, state]() {
+		unique_lock<std::mutex> lock(connection->py_connection_lock);
+		// The result is materialized, fetching from it does not block the event loop
+		auto pending_query = state->prep->PendingQuery(state->named_values, false);
+		if (pending_query->HasError()) {
+			pending_query->ThrowError();
+		}
+		state->result = PythonAsyncTask::CompletePendingQuery(*pending_query);
+		if (state->result->HasError()) {
+			state->result->ThrowError();
+		}
+	};
+	auto finish = [connection, state]() -> py::object {
+		auto py_result = make_uniq<DuckDBPyResult>(std::move(state->result));
+		connection->con.SetResult(make_uniq<DuckDBPyRelation>(std::move(py_result)));
+		return py::cast(connection);
+	};
+	auto interrupt = [connection]() {
+		connection->Interrupt();
+	};
+	return PythonAsyncTask::Start(std::move(work), std::move(finish), std::move(interrupt));
+}
+
 shared_ptr<DuckDBPyConnection> DuckDBPyConnection::Append(const string &name, const PandasDataFrame &value,
                                                           bool by_name) {
 	RegisterPythonObject("__append_df", value);
@@ -1294,6 +1541,86 @@ void DuckDBPyConnection::ExecuteImmediately(vector<unique_ptr<SQLStatement>> sta
 	}
 }
 
+namespace {
+
+//! Replaces the parameters of a statement with the values they are bound to
+struct ParameterValueReplacer {
+	explicit ParameterValueReplacer(const case_insensitive_map_t<BoundParameterData> &values) : values(values) {
+	}
+
+	const case_insensitive_map_t<BoundParameterData> &values;
+	//! The identifiers of the parameters that were replaced
+	case_insensitive_set_t replaced;
+	//! Whether a parameter was found that has no value
+	bool missing_value = false;
+
+	void ReplaceExpression(unique_ptr<ParsedExpression> &expr) {
+		if (expr->GetExpressionClass() == ExpressionClass::PARAMETER) {
+			auto &parameter = expr->Cast<ParameterExpression>();
+			auto entry = values.find(parameter.identifier);
+			if (entry == values.end()) {
+				missing_value = true;
+				return;
+			}
+			replaced.insert(parameter.identifier);
+			auto constant = make_uniq<ConstantExpression>(entry->second.GetValue());
+			constant->alias = parameter.alias;
+			expr = std::move(constant);
+			return;
+		}
+		if (expr->GetExpressionClass() == ExpressionClass::SUBQUERY) {
+			ReplaceQueryNode(*expr->Cast<SubqueryExpression>().subquery->node);
+		}
+		ParsedExpressionIterator::EnumerateChildren(
+		    *expr, [&](unique_ptr<ParsedExpression> &child) { ReplaceExpression(child); });
+	}
+
+	void ReplaceQueryNode(QueryNode &node) {
+		ParsedExpressionIterator::EnumerateQueryNodeChildren(
+		    node, [&](unique_ptr<ParsedExpression> &child) { ReplaceExpression(child); });
+	}
+};
+
+//! The names of the result columns are derived from the expressions, keep the names the columns would have
+//! when the query is executed as a prepared statement (e.g. '$1' instead of the value of the parameter)
+void KeepParameterColumnNames(QueryNode &node) {
+	switch (node.type) {
+	case QueryNodeType::SELECT_NODE: {
+		for (auto &expr : node.Cast<SelectNode>().select_list) {
+			if (expr->alias.empty() && expr->GetExpressionClass() != ExpressionClass::STAR && expr->HasParameter()) {
+				expr->alias = expr->ToString();
+			}
+		}
+		break;
+	}
+	case QueryNodeType::SET_OPERATION_NODE:
+		KeepParameterColumnNames(*node.Cast<SetOperationNode>().left);
+		break;
+	case QueryNodeType::CTE_NODE:
+		KeepParameterColumnNames(*node.Cast<CTENode>().child);
+		break;
+	default:
+		break;
+	}
+}
+
+//! Returns a copy of the statement in which the parameters are replaced with their values (or nullptr)
+unique_ptr<SelectStatement> BindParameterValues(const SelectStatement &statement, const py::object &params) {
+	auto values = TransformPreparedParameters(statement.named_param_map, params);
+	auto result = unique_ptr_cast<SQLStatement, SelectStatement>(statement.Copy());
+	KeepParameterColumnNames(*result->node);
+
+	ParameterValueReplacer replacer(values);
+	replacer.ReplaceQueryNode(*result->node);
+	if (replacer.missing_value || replacer.replaced.size() != values.size()) {
+		// Not every parameter has a value (or vice versa), the error is thrown when the statement is executed
+		return nullptr;
+	}
+	return result;
+}
+
+} // namespace
+
 unique_ptr<DuckDBPyRelation> DuckDBPyConnection::RunQuery(const py::object &query, string alias, py::object params) {
 	auto &connection = con.GetConnection();
 	if (alias.empty()) {
@@ -1308,28 +1635,36 @@ unique_ptr<DuckDBPyRelation> DuckDBPyConnection::RunQuery(const py::object &quer
 
 	auto last_statement = std::move(statements.back());
 	statements.pop_back();
+	// Only a single statement can be cached
+	bool cacheable = statements.empty();
 	// First immediately execute any preceding statements (if any)
 	ExecuteImmediately(std::move(statements));
 
 	// Attempt to create a Relation for lazy execution if possible
 	shared_ptr<Relation> relation;
-	if (py::none().is(params)) {
-		// FIXME: currently we can't create relations with prepared parameters
-		auto statement_type = last_statement->type;
-		switch (statement_type) {
-		case StatementType::SELECT_STATEMENT: {
+	if (last_statement->type == StatementType::SELECT_STATEMENT) {
+		if (py::none().is(params)) {
 			auto select_statement = unique_ptr_cast<SQLStatement, SelectStatement>(std::move(last_statement));
 			relation = connection.RelationFromQuery(std::move(select_statement), alias);
-			break;
-		}
-		default:
-			break;
+		} else {
+			// The values of the parameters are substituted into the query, so the relation stays lazy
+			auto select_statement = BindParameterValues(last_statement->Cast<SelectStatement>(), params);
+			if (select_statement) {
+				relation = connection.RelationFromQuery(std::move(select_statement), alias);
+			}
 		}
 	}
 
 	if (!relation) {
 		// Could not create a relation, resort to direct execution
-		auto prep = PrepareQuery(std::move(last_statement));
+		string cache_key;
+		shared_ptr<PreparedStatement> prep;
+		if (cacheable && !py::none().is(params)) {
+			prep = GetCachedStatement(query, params, cache_key);
+		}
+		if (!prep) {
+			prep = PrepareAndCache(std::move(last_statement), cache_key);
+		}
 		auto res = ExecuteInternal(*prep, std::move(params));
 		if (!res) {
 			return nullptr;
@@ -1560,6 +1895,8 @@ int DuckDBPyConnection::GetRowcount() {
 
 void DuckDBPyConnection::Close() {
 	con.SetResult(nullptr);
+	statement_cache.Clear();
+	result_cache.Clear();
 	con.SetConnection(nullptr);
 	con.SetDatabase(nullptr);
 	// https://peps.python.org/pep-0249/#Connection.close
@@ -1622,6 +1959,7 @@ shared_ptr<DuckDBPyConnection> DuckDBPyConnection::Cursor() {
 	auto res = make_shared_ptr<DuckDBPyConnection>();
 	res->con.SetDatabase(con);
 	res->con.SetConnection(make_uniq<Connection>(res->con.GetDatabase()));
+	res->RegisterContextState();
 	cursors.AddCursor(res);
 	return res;
 }
@@ -1704,12 +2042,13 @@ PolarsDataFrame DuckDBPyConnection::FetchPolars(idx_t rows_per_batch) {
 	return py::cast<PolarsDataFrame>(py::module::import("polars").attr("DataFrame")(arrow));
 }
 
-duckdb::pyarrow::RecordBatchReader DuckDBPyConnection::FetchRecordBatchReader(const idx_t rows_per_batch) {
+duckdb::pyarrow::RecordBatchReader DuckDBPyConnection::FetchRecordBatchReader(const idx_t rows_per_batch,
+                                                                              idx_t prefetch) {
 	if (!con.HasResult()) {
 		throw InvalidInputException("No open result set");
 	}
 	auto &result = con.GetResult();
-	return result.FetchRecordBatchReader(rows_per_batch);
+	return result.ToRecordBatch(rows_per_batch, prefetch);
 }
 
 case_insensitive_map_t<Value> TransformPyConfigDict(const py::dict &py_config_dict) {
@@ -1774,6 +2113,7 @@ static shared_ptr<DuckDBPyConnection> FetchOrCreateInstance(const string &databa
 		    instance_cache.GetOrCreateInstance(database_path, config, cache_instance, InstantiateNewInstance);
 		res->con.SetDatabase(std::move(database));
 		res->con.SetConnection(make_uniq<Connection>(res->con.GetDatabase()));
+		res->RegisterContextState();
 	}
 	return res;
 }
@@ -1833,7 +2173,7 @@ vector<Value> DuckDBPyConnection::TransformPythonParamList(const py::handle &par
 	args.reserve(py::len(params));
 
 	for (auto param : params) {
-		args.emplace_back(TransformPythonValue(param, LogicalType::UNKNOWN, false));
+		args.emplace_back(TransformPythonParameter(param));
 	}
 	return args;
 }
@@ -1844,7 +2184,7 @@ case_insensitive_map_t<BoundParameterData> DuckDBPyConnection::TransformPythonPa
 	for (auto pair : params) {
 		auto &key = pair.first;
 		auto &value = pair.second;
-		args[std::string(py::str(key))] = BoundParameterData(TransformPythonValue(value, LogicalType::UNKNOWN, false));
+		args[std::string(py::str(key))] = BoundParameterData(TransformPythonParameter(value));
 	}
 	return args;
 }
@@ -2019,6 +2359,20 @@ bool DuckDBPyConnection::IsAcceptedArrowObject(const py::object &object) {
 	return DuckDBPyConnection::GetArrowType(object) != PyArrowObjectType::Invalid;
 }
 
+void DuckDBPyConnection::RegisterContextState() {
+	auto &context = *con.GetConnection().context;
+	context.registered_state->Insert(PythonConnectionState::NAME,
+	                                 make_shared_ptr<PythonConnectionState>(shared_from_this()));
+}
+
+shared_ptr<DuckDBPyConnection> DuckDBPyConnection::FromContext(ClientContext &context) {
+	auto state = context.registered_state->Get<PythonConnectionState>(PythonConnectionState::NAME);
+	if (!state) {
+		return nullptr;
+	}
+	return state->connection.lock();
+}
+
 unique_lock<std::mutex> DuckDBPyConnection::AcquireConnectionLock() {
 	// we first release the gil and then acquire the connection lock
 	unique_lock<std::mutex> lock(py_connection_lock, std::defer_lock);
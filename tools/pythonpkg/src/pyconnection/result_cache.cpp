@@ -0,0 +1,239 @@
+#include "duckdb_python/pyconnection/result_cache.hpp"
+#include "duckdb_python/pyconnection/statement_cache.hpp"
+#include "duckdb/common/types/column/column_data_collection.hpp"
+#include "duckdb/execution/physical_operator.hpp"
+#include "duckdb/main/attached_database.hpp"
+#include "duckdb/main/client_context.hpp"
+#include "duckdb/main/database_manager.hpp"
+#include "duckdb/main/prepared_statement_data.hpp"
+#include "duckdb/planner/expression/bound_aggregate_expression.hpp"
+#include "duckdb/planner/expression/bound_function_expression.hpp"
+#include "duckdb/planner/expression/bound_window_expression.hpp"
+#include "duckdb/planner/expression_iterator.hpp"
+#include "duckdb/planner/logical_operator_visitor.hpp"
+#include "duckdb/planner/planner.hpp"
+#include "duckdb/transaction/duck_transaction_manager.hpp"
+
+namespace duckdb {
+
+PythonCachedResult::PythonCachedResult(shared_ptr<ColumnDataCollection> collection_p, vector<string> names_p,
+                                       vector<ResultCacheDataVersion> versions_p)
+    : collection(std::move(collection_p)), names(std::move(names_p)), versions(std::move(versions_p)),
+      size(collection->AllocationSize()) {
+}
+
+PythonResultCache::PythonResultCache() : capacity(0), memory_usage(0), hits(0), misses(0) {
+}
+
+PythonResultCache::~PythonResultCache() {
+}
+
+void PythonResultCache::SetCapacity(idx_t capacity_p) {
+	capacity = capacity_p;
+	while (memory_usage > capacity) {
+		Erase(--entries.end());
+	}
+}
+
+void PythonResultCache::Erase(list<entry_t>::iterator entry) {
+	memory_usage -= entry->second->size;
+	lookup.erase(entry->first);
+	entries.erase(entry);
+}
+
+shared_ptr<PythonCachedResult> PythonResultCache::Lookup(const string &key,
+                                                         const vector<ResultCacheDataVersion> &versions) {
+	auto entry = lookup.find(key);
+	if (entry == lookup.end()) {
+		misses++;
+		return nullptr;
+	}
+	if (entry->second->second->versions != versions) {
+		// The data was changed since the result was cached
+		Erase(entry->second);
+		misses++;
+		return nullptr;
+	}
+	hits++;
+	// Move the result to the front, it is now the most recently used result
+	entries.splice(entries.begin(), entries, entry->second);
+	return entry->second->second;
+}
+
+bool PythonResultCache::Contains(const string &key, const vector<ResultCacheDataVersion> &versions) const {
+	auto entry = lookup.find(key);
+	return entry != lookup.end() && entry->second->second->versions == versions;
+}
+
+void PythonResultCache::Insert(const string &key, shared_ptr<PythonCachedResult> result) {
+	if (result->size > capacity) {
+		// The result does not fit in the cache (or the cache is disabled)
+		return;
+	}
+	auto entry = lookup.find(key);
+	if (entry != lookup.end()) {
+		Erase(entry->second);
+	}
+	memory_usage += result->size;
+	entries.emplace_front(key, std::move(result));
+	lookup[key] = entries.begin();
+	SetCapacity(capacity);
+}
+
+void PythonResultCache::Clear() {
+	entries.clear();
+	lookup.clear();
+	memory_usage = 0;
+}
+
+py::dict PythonResultCache::GetInfo() const {
+	py::dict info;
+	info["hits"] = hits;
+	info["misses"] = misses;
+	info["size"] = entries.size();
+	info["memory_usage"] = memory_usage;
+	info["capacity"] = capacity;
+	return info;
+}
+
+static void AddKeyPart(string &key, const string &part) {
+	// The length is added so the parts of the key can not run into each other
+	key += '\0';
+	key += std::to_string(part.size());
+	key += ':';
+	key += part;
+}
+
+string PythonResultCache::GetKey(const string &query, const case_insensitive_map_t<BoundParameterData> &values) {
+	string key = query;
+	// The parameters are added in a fixed order
+	vector<reference<const case_insensitive_map_t<BoundParameterData>::value_type>> parameters;
+	for (auto &entry : values) {
+		parameters.push_back(entry);
+	}
+	std::sort(parameters.begin(), parameters.end(),
+	          [](const case_insensitive_map_t<BoundParameterData>::value_type &a,
+	             const case_insensitive_map_t<BoundParameterData>::value_type &b) { return a.first < b.first; });
+	for (auto &entry : parameters) {
+		auto &value = entry.get().second.GetValue();
+		AddKeyPart(key, entry.get().first);
+		AddKeyPart(key, value.type().ToString());
+		AddKeyPart(key, value.IsNull() ? string() : value.ToString());
+		key += value.IsNull() ? 'N' : 'V';
+	}
+	return key;
+}
+
+static bool ExpressionIsConsistent(const Expression &expr) {
+	switch (expr.GetExpressionClass()) {
+	case ExpressionClass::BOUND_FUNCTION:
+		if (expr.Cast<BoundFunctionExpression>().function.stability != FunctionStability::CONSISTENT) {
+			return false;
+		}
+		break;
+	case ExpressionClass::BOUND_AGGREGATE:
+		if (expr.Cast<BoundAggregateExpression>().function.stability != FunctionStability::CONSISTENT) {
+			return false;
+		}
+		break;
+	case ExpressionClass::BOUND_WINDOW: {
+		auto &window = expr.Cast<BoundWindowExpression>();
+		if (window.aggregate && window.aggregate->stability != FunctionStability::CONSISTENT) {
+			return false;
+		}
+		break;
+	}
+	case ExpressionClass::BOUND_SUBQUERY:
+		// The plan of the subquery is not inspected
+		return false;
+	default:
+		break;
+	}
+	bool consistent = true;
+	ExpressionIterator::EnumerateChildren(expr, [&](const Expression &child) {
+		if (consistent && !ExpressionIsConsistent(child)) {
+			consistent = false;
+		}
+	});
+	return consistent;
+}
+
+static bool PlanIsConsistent(LogicalOperator &op) {
+	bool consistent = true;
+	LogicalOperatorVisitor::EnumerateExpressions(op, [&](unique_ptr<Expression> *expr) {
+		if (consistent && !ExpressionIsConsistent(**expr)) {
+			consistent = false;
+		}
+	});
+	if (!consistent) {
+		return false;
+	}
+	for (auto &child : op.children) {
+		if (!PlanIsConsistent(*child)) {
+			return false;
+		}
+	}
+	return true;
+}
+
+bool PythonResultCache::IsCacheable(ClientContext &context, PreparedStatementData &data,
+                                    vector<ResultCacheDataVersion> &versions) {
+	if (data.statement_type != StatementType::SELECT_STATEMENT || !data.properties.IsReadOnly() || !data.plan ||
+	    !data.unbound_statement || data.unbound_statement->type != StatementType::SELECT_STATEMENT) {
+		return false;
+	}
+	if (!context.transaction.IsAutoCommit()) {
+		// The result could depend on the uncommitted changes of the transaction
+		return false;
+	}
+	if (!PythonStatementCache::OnlyScansTables(*data.plan)) {
+		// Only scans of DuckDB tables are tracked by the data version, other table functions (e.g. reading files or
+		// scanning Python objects) can return a different result at any time
+		return false;
+	}
+
+	bool cacheable = true;
+	versions.clear();
+	context.RunFunctionInTransaction([&]() {
+		auto &db_manager = DatabaseManager::Get(context);
+		for (auto &entry : data.properties.read_databases) {
+			auto db = db_manager.GetDatabase(context, entry.first);
+			if (!db || !db->GetTransactionManager().IsDuckTransactionManager()) {
+				cacheable = false;
+				return;
+			}
+			auto &transaction_manager = DuckTransactionManager::Get(*db);
+			versions.push_back(ResultCacheDataVersion {db->oid, transaction_manager.GetDataVersion()});
+		}
+	});
+	std::sort(versions.begin(), versions.end(), [](const ResultCacheDataVersion &a, const ResultCacheDataVersion &b) {
+		return a.database_oid < b.database_oid;
+	});
+	return cacheable;
+}
+
+bool PythonResultCache::IsConsistent(ClientContext &context, PreparedStatementData &data,
+                                     const case_insensitive_map_t<BoundParameterData> &values) {
+	if (data.properties.always_require_rebind) {
+		// The statement uses functions that return a different result for every query (e.g. now())
+		return false;
+	}
+	bool consistent = false;
+	context.RunFunctionInTransaction([&]() {
+		try {
+			// The functions are checked on the bound plan, that includes the functions used by views and macros
+			Planner planner(context);
+			for (auto &value : values) {
+				planner.parameter_data.emplace(value.first, BoundParameterData(value.second));
+			}
+			planner.CreatePlan(data.unbound_statement->Copy());
+			consistent = planner.plan && PlanIsConsistent(*planner.plan);
+		} catch (std::exception &) {
+			// The statement could not be analyzed, it is executed without the cache
+			consistent = false;
+		}
+	});
+	return consistent;
+}
+
+} // namespace duckdb
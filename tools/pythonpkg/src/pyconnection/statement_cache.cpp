@@ -0,0 +1,148 @@
+#include "duckdb_python/pyconnection/statement_cache.hpp"
+#include "duckdb/execution/operator/scan/physical_table_scan.hpp"
+#include "duckdb/main/prepared_statement.hpp"
+#include "duckdb/main/prepared_statement_data.hpp"
+
+namespace duckdb {
+
+PythonStatementCache::PythonStatementCache() : capacity(0), hits(0), misses(0) {
+}
+
+PythonStatementCache::~PythonStatementCache() {
+}
+
+void PythonStatementCache::SetCapacity(idx_t capacity_p) {
+	capacity = capacity_p;
+	while (entries.size() > capacity) {
+		lookup.erase(entries.back().first);
+		entries.pop_back();
+	}
+}
+
+shared_ptr<PreparedStatement> PythonStatementCache::Lookup(const string &key) {
+	auto entry = lookup.find(key);
+	if (entry == lookup.end()) {
+		misses++;
+		return nullptr;
+	}
+	hits++;
+	// Move the statement to the front, it is now the most recently used statement
+	entries.splice(entries.begin(), entries, entry->second);
+	return entry->second->second;
+}
+
+void PythonStatementCache::Insert(const string &key, shared_ptr<PreparedStatement> prepared) {
+	if (!IsEnabled()) {
+		return;
+	}
+	auto entry = lookup.find(key);
+	if (entry != lookup.end()) {
+		entries.erase(entry->second);
+		lookup.erase(entry);
+	}
+	entries.emplace_front(key, std::move(prepared));
+	lookup[key] = entries.begin();
+	SetCapacity(capacity);
+}
+
+void PythonStatementCache::Clear() {
+	entries.clear();
+	lookup.clear();
+}
+
+py::dict PythonStatementCache::GetInfo() const {
+	py::dict info;
+	info["hits"] = hits;
+	info["misses"] = misses;
+	info["size"] = entries.size();
+	info["capacity"] = capacity;
+	return info;
+}
+
+static void AddParameterType(string &key, const py::handle &param) {
+	key += '\0';
+	key += Py_TYPE(param.ptr())->tp_name;
+}
+
+string PythonStatementCache::GetKey(const string &query, const py::object &params) {
+	string key = query;
+	if (params.is_none()) {
+		return key;
+	}
+	if (py::is_dict_like(params)) {
+		// The parameters are added in a fixed order, the order of the dict does not matter for the statement
+		vector<std::pair<string, py::handle>> named_params;
+		for (auto &item : py::cast<py::dict>(params)) {
+			named_params.emplace_back(std::string(py::str(item.first)), item.second);
+		}
+		std::sort(named_params.begin(), named_params.end(),
+		          [](const std::pair<string, py::handle> &a, const std::pair<string, py::handle> &b) {
+			          return a.first < b.first;
+		          });
+		for (auto &param : named_params) {
+			key += '\0';
+			key += param.first;
+			AddParameterType(key, param.second);
+		}
+	} else if (py::is_list_like(params)) {
+		for (auto &param : params) {
+			AddParameterType(key, param);
+		}
+	} else {
+		AddParameterType(key, params);
+	}
+	return key;
+}
+
+bool PythonStatementCache::IsCacheable(StatementType type) {
+	switch (type) {
+	case StatementType::SELECT_STATEMENT:
+	case StatementType::INSERT_STATEMENT:
+	case StatementType::UPDATE_STATEMENT:
+	case StatementType::DELETE_STATEMENT:
+		return true;
+	default:
+		return false;
+	}
+}
+
+bool PythonStatementCache::OnlyScansTables(const PhysicalOperator &op) {
+	if (op.type == PhysicalOperatorType::TABLE_SCAN) {
+		auto &name = op.Cast<PhysicalTableScan>().function.name;
+		if (name != "seq_scan" && name != "index_scan") {
+			return false;
+		}
+	}
+	for (auto &child : op.GetChildren()) {
+		if (!OnlyScansTables(child.get())) {
+			return false;
+		}
+	}
+	return true;
+}
+
+bool PythonStatementCache::IsCacheable(const PreparedStatementData &data) {
+	// Other table functions are bound to their input, e.g. a replacement scan keeps scanning the Python object it
+	// found when the statement was prepared, even after the variable was reassigned
+	return data.plan && OnlyScansTables(*data.plan);
+}
+
+bool PythonStatementCache::InvalidatesCache(StatementType type) {
+	if (IsCacheable(type)) {
+		return false;
+	}
+	switch (type) {
+	case StatementType::TRANSACTION_STATEMENT:
+	case StatementType::EXPLAIN_STATEMENT:
+	case StatementType::COPY_STATEMENT:
+	case StatementType::CALL_STATEMENT:
+	case StatementType::PREPARE_STATEMENT:
+	case StatementType::EXECUTE_STATEMENT:
+		return false;
+	default:
+		// Anything that might change the catalog or the settings
+		return true;
+	}
+}
+
+} // namespace duckdb
@@ -0,0 +1,250 @@
+#include "duckdb_python/pyprepared_statement.hpp"
+#include "duckdb_python/pyconnection/pyconnection.hpp"
+#include "duckdb_python/pyrelation.hpp"
+#include "duckdb_python/pyresult.hpp"
+#include "duckdb/main/prepared_statement.hpp"
+#include "duckdb/main/relation/materialized_relation.hpp"
+
+namespace duckdb {
+
+static void
+InitializeReadOnlyProperties(py::class_<DuckDBPyPreparedStatement, shared_ptr<DuckDBPyPreparedStatement>> &m) {
+	m.def_property_readonly("query", &DuckDBPyPreparedStatement::Query, "Get the query of the prepared statement.")
+	    .def_property_readonly("type", &DuckDBPyPreparedStatement::Type, "Get the type of the prepared statement.")
+	    .def_property_readonly("parameter_names", &DuckDBPyPreparedStatement::ParameterNames,
+	                           "Get the names of the parameters, in the order in which they are bound.")
+	    .def_property_readonly("parameter_types", &DuckDBPyPreparedStatement::ParameterTypes,
+	                           "Get the types the parameters are expected to have, in the order in which they are "
+	                           "bound.")
+	    .def_property_readonly("columns", &DuckDBPyPreparedStatement::Columns,
+	                           "Get the names of the columns produced by the prepared statement.")
+	    .def_property_readonly("types", &DuckDBPyPreparedStatement::ColumnTypes,
+	                           "Get the types of the columns produced by the prepared statement.")
+	    .def_property_readonly("description", &DuckDBPyPreparedStatement::Description,
+	                           "Get the result set attributes of the prepared statement, mainly column names.");
+}
+
+void DuckDBPyPreparedStatement::Initialize(py::handle &m) {
+	auto statement_module = py::class_<DuckDBPyPreparedStatement, shared_ptr<DuckDBPyPreparedStatement>>(
+	    m, "PreparedStatement", py::module_local());
+	InitializeReadOnlyProperties(statement_module);
+
+	statement_module.def("execute", &DuckDBPyPreparedStatement::Execute,
+	                     "Execute the prepared statement with the given parameters",
+	                     py::arg("parameters") = py::none());
+	statement_module.def("executemany", &DuckDBPyPreparedStatement::ExecuteMany,
+	                     "Execute the prepared statement multiple times using the list of parameter sets in parameters",
+	                     py::arg("parameters") = py::none());
+	statement_module.def("relation", &DuckDBPyPreparedStatement::ToRelation,
+	                     "Execute the prepared statement with the given parameters and return the result as a "
+	                     "materialized relation",
+	                     py::arg("parameters") = py::none(), py::kw_only(), py::arg("alias") = "");
+	statement_module.def("fetchone", &DuckDBPyPreparedStatement::FetchOne,
+	                     "Fetch a single row from a result following execute");
+	statement_module.def("fetchmany", &DuckDBPyPreparedStatement::FetchMany,
+	                     "Fetch the next set of rows from a result following execute", py::arg("size") = 1);
+	statement_module.def("fetchall", &DuckDBPyPreparedStatement::FetchAll,
+	                     "Fetch all rows from a result following execute");
+	statement_module.def("fetchnumpy", &DuckDBPyPreparedStatement::FetchNumpy,
+	                     "Fetch a result as list of NumPy arrays following execute");
+	statement_module.def("fetchdf", &DuckDBPyPreparedStatement::FetchDF,
+	                     "Fetch a result as DataFrame following execute()", py::kw_only(),
+	                     py::arg("date_as_object") = false);
+	statement_module.def("df", &DuckDBPyPreparedStatement::FetchDF, "Fetch a result as DataFrame following execute()",
+	                     py::kw_only(), py::arg("date_as_object") = false);
+	statement_module.def("fetch_arrow_table", &DuckDBPyPreparedStatement::FetchArrow,
+	                     "Fetch a result as Arrow table following execute()", py::arg("rows_per_batch") = 1000000);
+	statement_module.def("arrow", &DuckDBPyPreparedStatement::FetchArrow,
+	                     "Fetch a result as Arrow table following execute()", py::arg("rows_per_batch") = 1000000);
+	statement_module.def("pl", &DuckDBPyPreparedStatement::FetchPolars,
+	                     "Fetch a result as Polars DataFrame following execute()", py::arg("rows_per_batch") = 1000000);
+	statement_module.def("fetch_record_batch", &DuckDBPyPreparedStatement::FetchRecordBatchReader,
+	                     "Fetch an Arrow RecordBatchReader following execute(), with 'prefetch' set up to 'prefetch' "
+	                     "batches are produced ahead on a background thread",
+	                     py::arg("rows_per_batch") = 1000000, py::kw_only(), py::arg("prefetch") = 0);
+	statement_module.def("close", &DuckDBPyPreparedStatement::Close, "Close the prepared statement");
+}
+
+DuckDBPyPreparedStatement::DuckDBPyPreparedStatement(shared_ptr<DuckDBPyConnection> connection_p,
+                                                     unique_ptr<PreparedStatement> prepared_p)
+    : connection(std::move(connection_p)), prepared(std::move(prepared_p)) {
+}
+
+DuckDBPyPreparedStatement::~DuckDBPyPreparedStatement() {
+	try {
+		py::gil_scoped_release gil;
+		result.reset();
+		prepared.reset();
+	} catch (...) { // NOLINT
+	}
+}
+
+PreparedStatement &DuckDBPyPreparedStatement::GetPrepared() const {
+	if (!prepared) {
+		throw InvalidInputException("Prepared statement already closed!");
+	}
+	return *prepared;
+}
+
+DuckDBPyRelation &DuckDBPyPreparedStatement::GetResult() {
+	if (!result) {
+		throw InvalidInputException("No open result set");
+	}
+	return *result;
+}
+
+shared_ptr<DuckDBPyPreparedStatement> DuckDBPyPreparedStatement::Execute(py::object params) {
+	result = nullptr;
+	auto &prep = GetPrepared();
+	// Throws if the connection was closed in the meantime
+	connection->con.GetConnection();
+
+	auto query_result = connection->ExecuteInternal(prep, std::move(params));
+	if (query_result) {
+		auto py_result = make_uniq<DuckDBPyResult>(std::move(query_result));
+		result = make_uniq<DuckDBPyRelation>(std::move(py_result));
+	}
+	return shared_from_this();
+}
+
+shared_ptr<DuckDBPyPreparedStatement> DuckDBPyPreparedStatement::ExecuteMany(py::object params_p) {
+	result = nullptr;
+	auto &prep = GetPrepared();
+	connection->con.GetConnection();
+
+	if (params_p.is_none() || !py::is_list_like(params_p)) {
+		throw InvalidInputException("executemany requires a list of parameter sets to be provided");
+	}
+	auto outer_list = py::list(params_p);
+	if (outer_list.empty()) {
+		throw InvalidInputException("executemany requires a non-empty list of parameter sets to be provided");
+	}
+
+	unique_ptr<QueryResult> query_result;
+	// Execute once for every set of parameters that are provided
+	for (auto &parameters : outer_list) {
+		auto params = py::reinterpret_borrow<py::object>(parameters);
+		query_result = connection->ExecuteInternal(prep, std::move(params));
+	}
+	if (query_result) {
+		auto py_result = make_uniq<DuckDBPyResult>(std::move(query_result));
+		result = make_uniq<DuckDBPyRelation>(std::move(py_result));
+	}
+	return shared_from_this();
+}
+
+unique_ptr<DuckDBPyRelation> DuckDBPyPreparedStatement::ToRelation(py::object params, string alias) {
+	auto &prep = GetPrepared();
+	auto &con_ref = connection->con.GetConnection();
+	if (prep.GetStatementType() != StatementType::SELECT_STATEMENT) {
+		throw InvalidInputException("Only a SELECT statement can be turned into a relation");
+	}
+	if (alias.empty()) {
+		alias = "unnamed_relation_" + StringUtil::GenerateRandomName(16);
+	}
+
+	auto query_result = connection->ExecuteInternal(prep, std::move(params));
+	if (!query_result) {
+		return nullptr;
+	}
+	if (query_result->type == QueryResultType::STREAM_RESULT) {
+		auto &stream_result = query_result->Cast<StreamQueryResult>();
+		query_result = stream_result.Materialize();
+	}
+	auto &materialized_result = query_result->Cast<MaterializedQueryResult>();
+	auto relation = make_shared_ptr<MaterializedRelation>(con_ref.context, materialized_result.TakeCollection(),
+	                                                      query_result->names, alias);
+	return make_uniq<DuckDBPyRelation>(std::move(relation));
+}
+
+Optional<py::tuple> DuckDBPyPreparedStatement::FetchOne() {
+	return GetResult().FetchOne();
+}
+
+py::list DuckDBPyPreparedStatement::FetchMany(idx_t size) {
+	return GetResult().FetchMany(size);
+}
+
+py::list DuckDBPyPreparedStatement::FetchAll() {
+	return GetResult().FetchAll();
+}
+
+py::dict DuckDBPyPreparedStatement::FetchNumpy() {
+	return GetResult().FetchNumpyInternal();
+}
+
+PandasDataFrame DuckDBPyPreparedStatement::FetchDF(bool date_as_object) {
+	return GetResult().FetchDF(date_as_object);
+}
+
+duckdb::pyarrow::Table DuckDBPyPreparedStatement::FetchArrow(idx_t rows_per_batch) {
+	return GetResult().ToArrowTable(rows_per_batch);
+}
+
+PolarsDataFrame DuckDBPyPreparedStatement::FetchPolars(idx_t rows_per_batch) {
+	auto arrow = FetchArrow(rows_per_batch);
+	return py::cast<PolarsDataFrame>(py::module::import("polars").attr("DataFrame")(arrow));
+}
+
+duckdb::pyarrow::RecordBatchReader DuckDBPyPreparedStatement::FetchRecordBatchReader(idx_t rows_per_batch,
+                                                                                     idx_t prefetch) {
+	return GetResult().ToRecordBatch(rows_per_batch, prefetch);
+}
+
+void DuckDBPyPreparedStatement::Close() {
+	result = nullptr;
+	prepared = nullptr;
+}
+
+string DuckDBPyPreparedStatement::Query() const {
+	return GetPrepared().query;
+}
+
+StatementType DuckDBPyPreparedStatement::Type() const {
+	return GetPrepared().GetStatementType();
+}
+
+py::list DuckDBPyPreparedStatement::ParameterNames() const {
+	auto &prep = GetPrepared();
+	py::list names(prep.named_param_map.size());
+	for (auto &entry : prep.named_param_map) {
+		names[entry.second - 1] = py::str(entry.first);
+	}
+	return names;
+}
+
+py::list DuckDBPyPreparedStatement::ParameterTypes() const {
+	auto &prep = GetPrepared();
+	auto expected_types = prep.GetExpectedParameterTypes();
+	py::list types(prep.named_param_map.size());
+	for (auto &entry : prep.named_param_map) {
+		auto type = expected_types.find(entry.first);
+		// The type of a parameter can not always be determined while preparing
+		auto expected_type = type == expected_types.end() ? LogicalType(LogicalType::UNKNOWN) : type->second;
+		types[entry.second - 1] = make_shared_ptr<DuckDBPyType>(expected_type);
+	}
+	return types;
+}
+
+py::list DuckDBPyPreparedStatement::Columns() const {
+	py::list columns;
+	for (auto &name : GetPrepared().GetNames()) {
+		columns.append(py::str(name));
+	}
+	return columns;
+}
+
+py::list DuckDBPyPreparedStatement::ColumnTypes() const {
+	py::list types;
+	for (auto &type : GetPrepared().GetTypes()) {
+		types.append(make_shared_ptr<DuckDBPyType>(type));
+	}
+	return types;
+}
+
+py::list DuckDBPyPreparedStatement::Description() const {
+	auto &prep = GetPrepared();
+	return DuckDBPyResult::GetDescription(prep.GetNames(), prep.GetTypes());
+}
+
+} // namespace duckdb
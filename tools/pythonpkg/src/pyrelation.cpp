@@ -3,6 +3,10 @@
 #include "duckdb_python/pyconnection/pyconnection.hpp"
 #include "duckdb_python/pytype.hpp"
 #include "duckdb_python/pyresult.hpp"
+#include "duckdb_python/python_profiling.hpp"
+#include "duckdb_python/python_async.hpp"
+#include "duckdb_python/arrow/arrow_export_utils.hpp"
+#include "duckdb/main/chunk_scan_state/query_result.hpp"
 #include "duckdb/parser/qualified_name.hpp"
 #include "duckdb/main/client_context.hpp"
 #include "duckdb_python/numpy/numpy_type.hpp"
@@ -770,11 +774,6 @@ unique_ptr<DuckDBPyRelation> DuckDBPyRelation::Distinct() {
 	return make_uniq<DuckDBPyRelation>(rel->Distinct());
 }
 
-duckdb::pyarrow::RecordBatchReader DuckDBPyRelation::FetchRecordBatchReader(idx_t rows_per_batch) {
-	AssertResult();
-	return result->FetchRecordBatchReader(rows_per_batch);
-}
-
 static unique_ptr<QueryResult> PyExecuteRelation(const shared_ptr<Relation> &rel, bool stream_result = false) {
 	if (!rel) {
 		return nullptr;
@@ -962,7 +961,7 @@ PolarsDataFrame DuckDBPyRelation::ToPolars(idx_t batch_size) {
 	return py::cast<PolarsDataFrame>(pybind11::module_::import("polars").attr("DataFrame")(arrow));
 }
 
-duckdb::pyarrow::RecordBatchReader DuckDBPyRelation::ToRecordBatch(idx_t batch_size) {
+duckdb::pyarrow::RecordBatchReader DuckDBPyRelation::ToRecordBatch(idx_t batch_size, idx_t prefetch) {
 	if (!result) {
 		if (!rel) {
 			return py::none();
@@ -970,7 +969,113 @@ duckdb::pyarrow::RecordBatchReader DuckDBPyRelation::ToRecordBatch(idx_t batch_s
 		ExecuteOrThrow(true);
 	}
 	AssertResultOpen();
-	return result->FetchRecordBatchReader(batch_size);
+	return result->FetchRecordBatchReader(batch_size, prefetch);
+}
+
+//! Takes the lock of the connection on the background thread, like execute_async, so the asynchronous query is not
+//! interleaved with the queries that are run on the connection in the meantime
+static unique_lock<mutex> LockConnection(const shared_ptr<DuckDBPyConnection> &connection) {
+	if (!connection) {
+		return unique_lock<mutex>();
+	}
+	return unique_lock<mutex>(connection->py_connection_lock);
+}
+
+py::object DuckDBPyRelation::ToArrowTableAsync(idx_t batch_size) {
+	AssertRelation();
+	struct AsyncArrowTableState {
+		shared_ptr<Relation> rel;
+		shared_ptr<DuckDBPyConnection> connection;
+		unique_ptr<QueryResult> result;
+		PythonAsyncArrowChunks chunks;
+	};
+	auto state = make_shared_ptr<AsyncArrowTableState>();
+	state->rel = rel;
+	state->connection = DuckDBPyConnection::FromContext(*rel->context.GetContext());
+
+	// Both the execution and the conversion to Arrow arrays run on the background thread
+	auto work = [state, batch_size]() {
+		auto lock = LockConnection(state->connection);
+		auto context = state->rel->context.GetContext();
+		auto pending_query = context->PendingQuery(state->rel, false);
+		state->result = PythonAsyncTask::CompletePendingQuery(*pending_query);
+		if (state->result->HasError()) {
+			state->result->ThrowError();
+		}
+		QueryResultChunkScanState scan_state(*state->result);
+		state->chunks.Fetch(scan_state, state->result->client_properties, batch_size);
+	};
+	auto finish = [state]() -> py::object {
+		auto &query_result = *state->result;
+		auto batches =
+		    state->chunks.ToRecordBatches(query_result.types, query_result.names, query_result.client_properties);
+		return pyarrow::ToArrowTable(query_result.types, query_result.names, batches, query_result.client_properties);
+	};
+	auto interrupt = [state]() {
+		state->chunks.Interrupt();
+		state->rel->context.GetContext()->Interrupt();
+	};
+	return PythonAsyncTask::Start(std::move(work), std::move(finish), std::move(interrupt));
+}
+
+py::object DuckDBPyRelation::RecordBatchesAsync(idx_t batch_size) {
+	AssertRelation();
+	struct AsyncRecordBatchState {
+		shared_ptr<Relation> rel;
+		shared_ptr<DuckDBPyConnection> connection;
+		unique_ptr<QueryResult> result;
+		unique_ptr<QueryResultChunkScanState> scan_state;
+		//! Serializes the fetches, in case the next batch is requested before the previous one was produced
+		mutex lock;
+		//! Set when a fetch is cancelled, the iteration can not be resumed afterwards
+		atomic<bool> cancelled {false};
+	};
+	auto state = make_shared_ptr<AsyncRecordBatchState>();
+	state->rel = rel;
+	state->connection = DuckDBPyConnection::FromContext(*rel->context.GetContext());
+
+	auto fetch_next = [state, batch_size]() -> py::object {
+		auto chunks = make_shared_ptr<PythonAsyncArrowChunks>();
+		auto work = [state, chunks, batch_size]() {
+			lock_guard<mutex> guard(state->lock);
+			auto lock = LockConnection(state->connection);
+			if (state->cancelled) {
+				// A cancelled fetch might have stopped halfway through a chunk, close the result instead
+				state->scan_state.reset();
+				state->result.reset();
+				throw InvalidInputException("The iteration over the record batches was cancelled");
+			}
+			if (!state->result) {
+				// The query is started by the first fetch, the result is streamed from then on
+				auto context = state->rel->context.GetContext();
+				auto pending_query = context->PendingQuery(state->rel, true);
+				state->result = PythonAsyncTask::CompletePendingQuery(*pending_query);
+				if (state->result->HasError()) {
+					state->result->ThrowError();
+				}
+				state->scan_state = make_uniq<QueryResultChunkScanState>(*state->result);
+			}
+			chunks->Fetch(*state->scan_state, state->result->client_properties, batch_size, 1);
+		};
+		auto finish = [state, chunks]() -> py::object {
+			if (chunks->arrays.empty()) {
+				return py::none();
+			}
+			auto &query_result = *state->result;
+			auto batches =
+			    chunks->ToRecordBatches(query_result.types, query_result.names, query_result.client_properties);
+			return batches[0];
+		};
+		auto interrupt = [state, chunks]() {
+			state->cancelled = true;
+			chunks->Interrupt();
+			state->rel->context.GetContext()->Interrupt();
+		};
+		return PythonAsyncTask::Start(std::move(work), std::move(finish), std::move(interrupt));
+	};
+	auto &import_cache = *DuckDBPyConnection::ImportCache();
+	auto iterator = import_cache.duckdb.async_query.AsyncRecordBatchIterator();
+	return iterator(py::cpp_function(std::move(fetch_next)));
 }
 
 void DuckDBPyRelation::Close() {
@@ -1498,6 +1603,20 @@ static void DisplayHTML(const string &html) {
 	display_attr(html_object);
 }
 
+py::object DuckDBPyRelation::Profile() {
+	AssertRelation();
+	string profile;
+	{
+		PythonProfilingScope profiling(*rel->context.GetContext());
+		auto res = PyExecuteRelation(rel);
+		if (res->HasError()) {
+			res->ThrowError();
+		}
+		profile = profiling.GetProfile();
+	}
+	return CreatePythonProfile(profile);
+}
+
 string DuckDBPyRelation::Explain(ExplainType type) {
 	AssertRelation();
 	py::gil_scoped_release release;
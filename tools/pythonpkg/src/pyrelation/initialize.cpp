@@ -75,9 +75,19 @@ static void InitializeConsumers(py::class_<DuckDBPyRelation> &m) {
 		)";
 	m.def("__arrow_c_stream__", &DuckDBPyRelation::ToArrowCapsule, capsule_docs);
 	m.def("record_batch", &DuckDBPyRelation::ToRecordBatch,
-	      "Execute and return an Arrow Record Batch Reader that yields all rows", py::arg("batch_size") = 1000000)
+	      "Execute and return an Arrow Record Batch Reader that yields all rows, with 'prefetch' set up to 'prefetch' "
+	      "batches are produced ahead on a background thread",
+	      py::arg("batch_size") = 1000000, py::kw_only(), py::arg("prefetch") = 0)
 	    .def("fetch_arrow_reader", &DuckDBPyRelation::ToRecordBatch,
-	         "Execute and return an Arrow Record Batch Reader that yields all rows", py::arg("batch_size") = 1000000);
+	         "Execute and return an Arrow Record Batch Reader that yields all rows, with 'prefetch' set up to "
+	         "'prefetch' batches are produced ahead on a background thread",
+	         py::arg("batch_size") = 1000000, py::kw_only(), py::arg("prefetch") = 0);
+	m.def("fetch_arrow_async", &DuckDBPyRelation::ToArrowTableAsync,
+	      "Execute on a background thread, returns an awaitable that resolves to an Arrow Table of all rows",
+	      py::arg("batch_size") = 1000000)
+	    .def("record_batches_async", &DuckDBPyRelation::RecordBatchesAsync,
+	         "Execute on a background thread, returns an asynchronous iterator over the Arrow Record Batches",
+	         py::arg("batch_size") = 1000000);
 }
 
 static void InitializeAggregates(py::class_<DuckDBPyRelation> &m) {
@@ -217,7 +227,9 @@ static void InitializeSetOperators(py::class_<DuckDBPyRelation> &m) {
 static void InitializeMetaQueries(py::class_<DuckDBPyRelation> &m) {
 	m.def("describe", &DuckDBPyRelation::Describe,
 	      "Gives basic statistics (e.g., min,max) and if null exists for each column of the relation.")
-	    .def("explain", &DuckDBPyRelation::Explain, py::arg("type") = "standard");
+	    .def("explain", &DuckDBPyRelation::Explain, py::arg("type") = "standard")
+	    .def("profile", &DuckDBPyRelation::Profile,
+	         "Execute the relation and return the profile of the query, the result is discarded");
 }
 
 void DuckDBPyRelation::Initialize(py::handle &m) {
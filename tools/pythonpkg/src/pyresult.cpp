@@ -4,6 +4,7 @@
 #include "duckdb_python/python_objects.hpp"
 
 #include "duckdb_python/arrow/arrow_array_stream.hpp"
+#include "duckdb_python/arrow/prefetch_arrow_array_stream.hpp"
 #include "duckdb/common/arrow/arrow.hpp"
 #include "duckdb/common/arrow/arrow_converter.hpp"
 #include "duckdb/common/arrow/arrow_wrapper.hpp"
@@ -68,12 +69,7 @@ unique_ptr<DataChunk> DuckDBPyResult::FetchNext(QueryResult &query_result) {
 		auto &stream_result = query_result.Cast<StreamQueryResult>();
 		StreamExecutionResult execution_result;
 		while (!StreamQueryResult::IsChunkReady(execution_result = stream_result.ExecuteTask())) {
-			{
-				py::gil_scoped_acquire gil;
-				if (PyErr_CheckSignals() != 0) {
-					throw std::runtime_error("Query interrupted");
-				}
-			}
+			signal_check.Check();
 			if (execution_result == StreamExecutionResult::BLOCKED) {
 				stream_result.WaitForTask();
 			}
@@ -379,24 +375,29 @@ duckdb::pyarrow::Table DuckDBPyResult::FetchArrowTable(idx_t rows_per_batch, boo
 	                             result->client_properties);
 }
 
-ArrowArrayStream DuckDBPyResult::FetchArrowArrayStream(idx_t rows_per_batch) {
+ArrowArrayStream DuckDBPyResult::FetchArrowArrayStream(idx_t rows_per_batch, idx_t prefetch) {
 	if (!result) {
 		throw InvalidInputException("There is no query result");
 	}
+	if (prefetch > 0) {
+		auto prefetch_stream = new PrefetchArrowArrayStreamWrapper(std::move(result), rows_per_batch, prefetch);
+		// Like below, the lifetime of the 'prefetch_stream' is bound to that of the ArrowArrayStream
+		return prefetch_stream->stream;
+	}
 	ResultArrowArrayStreamWrapper *result_stream = new ResultArrowArrayStreamWrapper(std::move(result), rows_per_batch);
 	// The 'result_stream' is part of the 'private_data' of the ArrowArrayStream and its lifetime is bound to that of
 	// the ArrowArrayStream.
 	return result_stream->stream;
 }
 
-duckdb::pyarrow::RecordBatchReader DuckDBPyResult::FetchRecordBatchReader(idx_t rows_per_batch) {
+duckdb::pyarrow::RecordBatchReader DuckDBPyResult::FetchRecordBatchReader(idx_t rows_per_batch, idx_t prefetch) {
 	if (!result) {
 		throw InvalidInputException("There is no query result");
 	}
 	py::gil_scoped_acquire acquire;
 	auto pyarrow_lib_module = py::module::import("pyarrow").attr("lib");
 	auto record_batch_reader_func = pyarrow_lib_module.attr("RecordBatchReader").attr("_import_from_c");
-	auto stream = FetchArrowArrayStream(rows_per_batch);
+	auto stream = FetchArrowArrayStream(rows_per_batch, prefetch);
 	py::object record_batch_reader = record_batch_reader_func((uint64_t)&stream); // NOLINT
 	return py::cast<duckdb::pyarrow::RecordBatchReader>(record_batch_reader);
 }
@@ -0,0 +1,120 @@
+#include "duckdb_python/python_async.hpp"
+#include "duckdb_python/pyconnection/pyconnection.hpp"
+#include "duckdb_python/arrow/arrow_array_stream.hpp"
+#include "duckdb/common/arrow/arrow_converter.hpp"
+#include "duckdb/common/arrow/arrow_wrapper.hpp"
+#include "duckdb/main/chunk_scan_state.hpp"
+#include "duckdb/main/pending_query_result.hpp"
+
+#include <thread>
+
+namespace duckdb {
+
+PythonAsyncTask::PythonAsyncTask(work_function_t work_p, finish_function_t finish_p, interrupt_function_t interrupt_p)
+    : work(std::move(work_p)), finish(std::move(finish_p)), interrupt(std::move(interrupt_p)) {
+}
+
+py::object PythonAsyncTask::Start(work_function_t work, finish_function_t finish, interrupt_function_t interrupt) {
+	auto task = make_shared_ptr<PythonAsyncTask>(std::move(work), std::move(finish), std::move(interrupt));
+
+	// The awaitable is created first, so we fail early (without starting any work) if there is no running event loop
+	auto &import_cache = *DuckDBPyConnection::ImportCache();
+	auto async_query = import_cache.duckdb.async_query.AsyncQuery();
+	task->awaitable = async_query(py::cpp_function([task]() { return task->Finish(); }),
+	                              py::cpp_function([task]() { task->interrupt(); }));
+	auto result = task->awaitable;
+
+	std::thread thread([task]() mutable {
+		task->Run();
+		// The task holds Python objects, so the last reference can only be released while holding the GIL
+		py::gil_scoped_acquire gil;
+		task.reset();
+	});
+	thread.detach();
+	return result;
+}
+
+unique_ptr<QueryResult> PythonAsyncTask::CompletePendingQuery(PendingQueryResult &pending_query) {
+	PendingExecutionResult execution_result;
+	while (!PendingQueryResult::IsResultReady(execution_result = pending_query.ExecuteTask())) {
+		if (execution_result == PendingExecutionResult::BLOCKED) {
+			pending_query.WaitForTask();
+		}
+	}
+	if (execution_result == PendingExecutionResult::EXECUTION_ERROR) {
+		pending_query.ThrowError();
+	}
+	return pending_query.Execute();
+}
+
+void PythonAsyncTask::Run() {
+	try {
+		work();
+	} catch (std::exception &ex) {
+		error = ErrorData(ex);
+	} catch (...) { // NOLINT
+		error = ErrorData(ExceptionType::UNKNOWN_TYPE, "Unknown exception in asynchronous query");
+	}
+
+	py::gil_scoped_acquire gil;
+	try {
+		// Schedules 'Finish' on the event loop
+		awaitable.attr("notify")();
+	} catch (py::error_already_set &) { // NOLINT
+		// The event loop was closed before the work finished, there is nobody left to notify
+	}
+	// Break the reference cycle between the task and the awaitable
+	awaitable = py::none();
+}
+
+py::object PythonAsyncTask::Finish() {
+	if (error.HasError()) {
+		error.Throw();
+	}
+	return finish();
+}
+
+PythonAsyncArrowChunks::~PythonAsyncArrowChunks() {
+	// Release the arrays that were never converted into record batches
+	for (auto &array : arrays) {
+		if (array.release) {
+			array.release(&array);
+		}
+	}
+}
+
+bool PythonAsyncArrowChunks::Fetch(ChunkScanState &scan_state, const ClientProperties &options, idx_t rows_per_batch,
+                                   idx_t max_chunks) {
+	for (idx_t i = 0; max_chunks == DConstants::INVALID_INDEX || i < max_chunks; i++) {
+		// Interrupting the client context only stops the execution of the query, not the fetching of its result
+		if (interrupted) {
+			throw InterruptException();
+		}
+		ArrowArray data;
+		auto count = ArrowUtil::FetchChunk(scan_state, options, rows_per_batch, &data);
+		if (count == 0) {
+			return false;
+		}
+		arrays.push_back(data);
+	}
+	return true;
+}
+
+void PythonAsyncArrowChunks::Interrupt() {
+	interrupted = true;
+}
+
+py::list PythonAsyncArrowChunks::ToRecordBatches(const vector<LogicalType> &types, const vector<string> &names,
+                                                 const ClientProperties &options) {
+	py::list batches;
+	for (auto &array : arrays) {
+		ArrowSchema arrow_schema;
+		ArrowConverter::ToArrowSchema(&arrow_schema, types, names, options);
+		// The record batch takes ownership of the array
+		TransformDuckToArrowChunk(arrow_schema, array, batches);
+	}
+	arrays.clear();
+	return batches;
+}
+
+} // namespace duckdb
@@ -0,0 +1,37 @@
+#include "duckdb_python/python_profiling.hpp"
+#include "duckdb_python/pyconnection/pyconnection.hpp"
+#include "duckdb/main/client_config.hpp"
+#include "duckdb/main/client_context.hpp"
+#include "duckdb/main/query_profiler.hpp"
+
+namespace duckdb {
+
+PythonProfilingScope::PythonProfilingScope(ClientContext &context) : context(context) {
+	auto &config = ClientConfig::GetConfig(context);
+	enable_profiler = config.enable_profiler;
+	emit_profiler_output = config.emit_profiler_output;
+	profiler_print_format = config.profiler_print_format;
+
+	config.enable_profiler = true;
+	config.emit_profiler_output = false;
+	config.profiler_print_format = ProfilerPrintFormat::NO_OUTPUT;
+}
+
+PythonProfilingScope::~PythonProfilingScope() {
+	auto &config = ClientConfig::GetConfig(context);
+	config.enable_profiler = enable_profiler;
+	config.emit_profiler_output = emit_profiler_output;
+	config.profiler_print_format = profiler_print_format;
+}
+
+string PythonProfilingScope::GetProfile() const {
+	return QueryProfiler::Get(context).ToJSON();
+}
+
+py::object CreatePythonProfile(const string &profile) {
+	auto &import_cache = *DuckDBPyConnection::ImportCache();
+	auto query_profile = import_cache.duckdb.profiling.QueryProfile();
+	return query_profile.attr("from_json")(py::str(profile));
+}
+
+} // namespace duckdb
@@ -0,0 +1,22 @@
+#include "duckdb_python/python_signal_check.hpp"
+#include "duckdb_python/pybind11/pybind_wrapper.hpp"
+
+namespace duckdb {
+
+PythonSignalCheck::PythonSignalCheck(int64_t interval_ms)
+    : interval(milliseconds(interval_ms)), next_check(std::chrono::steady_clock::now() + interval) {
+}
+
+void PythonSignalCheck::Check() {
+	auto now = std::chrono::steady_clock::now();
+	if (now < next_check) {
+		return;
+	}
+	next_check = now + interval;
+	py::gil_scoped_acquire gil;
+	if (PyErr_CheckSignals() != 0) {
+		throw std::runtime_error("Query interrupted");
+	}
+}
+
+} // namespace duckdb
@@ -0,0 +1,154 @@
+import asyncio
+import pytest
+import duckdb
+
+
+class TestAsync(object):
+    def test_execute_async(self, duckdb_cursor):
+        async def run():
+            con = await duckdb_cursor.execute_async('select sum(i) from range(1000000) t(i)')
+            return con.fetchall()
+
+        assert asyncio.run(run()) == [(499999500000,)]
+
+    def test_execute_async_parameters(self, duckdb_cursor):
+        async def run():
+            await duckdb_cursor.execute_async('select ?::INTEGER + 1', [41])
+            return duckdb_cursor.fetchall()
+
+        assert asyncio.run(run()) == [(42,)]
+
+        async def run_named():
+            await duckdb_cursor.execute_async('select $a::INTEGER + $b', {'a': 41, 'b': 1})
+            return duckdb_cursor.fetchall()
+
+        assert asyncio.run(run_named()) == [(42,)]
+
+    def test_execute_async_concurrent(self):
+        con = duckdb.connect()
+
+        async def run_query(cursor, i):
+            await cursor.execute_async('select ?::INTEGER * 2', [i])
+            return cursor.fetchone()[0]
+
+        async def run():
+            cursors = [con.cursor() for _ in range(4)]
+            return await asyncio.gather(*[run_query(cursor, i) for i, cursor in enumerate(cursors)])
+
+        assert asyncio.run(run()) == [0, 2, 4, 6]
+
+    def test_execute_async_multiple_statements(self, duckdb_cursor):
+        async def run():
+            await duckdb_cursor.execute_async('create table tbl as select 42 i; select * from tbl')
+            return duckdb_cursor.fetchall()
+
+        assert asyncio.run(run()) == [(42,)]
+
+    def test_execute_async_error(self, duckdb_cursor):
+        async def run():
+            await duckdb_cursor.execute_async("select error('boom')")
+
+        with pytest.raises(duckdb.InvalidInputException, match='boom'):
+            asyncio.run(run())
+
+        # errors while binding are thrown before the query is started
+        with pytest.raises(duckdb.CatalogException):
+            duckdb_cursor.execute_async('select * from non_existent_table')
+
+    def test_execute_async_no_event_loop(self, duckdb_cursor):
+        with pytest.raises(RuntimeError):
+            duckdb_cursor.execute_async('select 42')
+
+    def test_execute_async_cancel(self, duckdb_cursor):
+        async def run():
+            task = asyncio.ensure_future(
+                duckdb_cursor.execute_async('select count(*) from range(10000000000) t1, range(1000000) t2')
+            )
+            await asyncio.sleep(0.5)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run())
+        # the query was interrupted, the connection can be used again
+        assert duckdb_cursor.execute('select 42').fetchall() == [(42,)]
+
+    def test_fetch_arrow_async(self, duckdb_cursor):
+        pa = pytest.importorskip("pyarrow")
+
+        async def run():
+            return await duckdb_cursor.sql('select i from range(10000) t(i)').fetch_arrow_async(batch_size=1000)
+
+        table = asyncio.run(run())
+        assert isinstance(table, pa.Table)
+        assert table.column('i').to_pylist() == list(range(10000))
+
+    def test_record_batches_async(self, duckdb_cursor):
+        pa = pytest.importorskip("pyarrow")
+
+        async def run():
+            rel = duckdb_cursor.sql('select i from range(10000) t(i)')
+            return [batch async for batch in rel.record_batches_async(batch_size=1000)]
+
+        batches = asyncio.run(run())
+        assert all(isinstance(batch, pa.RecordBatch) for batch in batches)
+        assert sum(batch.num_rows for batch in batches) == 10000
+
+    def test_record_batches_async_empty(self, duckdb_cursor):
+        pytest.importorskip("pyarrow")
+
+        async def run():
+            rel = duckdb_cursor.sql('select i from range(10) t(i) where i > 100')
+            return [batch async for batch in rel.record_batches_async()]
+
+        assert asyncio.run(run()) == []
+
+    def test_fetch_arrow_async_cancel(self, duckdb_cursor):
+        pytest.importorskip("pyarrow")
+
+        async def run():
+            rel = duckdb_cursor.sql('select i, i::VARCHAR s from range(100000000) t(i)')
+            task = asyncio.ensure_future(rel.fetch_arrow_async(batch_size=1000))
+            await asyncio.sleep(0.5)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run())
+        # the query and the fetch were interrupted, the connection can be used again
+        assert duckdb_cursor.execute('select 42').fetchall() == [(42,)]
+
+    def test_record_batches_async_cancel(self, duckdb_cursor):
+        pytest.importorskip("pyarrow")
+
+        async def run():
+            rel = duckdb_cursor.sql('select i from range(100000000) t(i)')
+            iterator = rel.record_batches_async(batch_size=1000)
+            first = await iterator.__anext__()
+            assert first.num_rows == 1000
+            task = asyncio.ensure_future(iterator.__anext__())
+            # let the task start the fetch before cancelling it
+            await asyncio.sleep(0)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            # the iteration can not be resumed after a cancelled fetch
+            with pytest.raises(duckdb.InvalidInputException, match='cancelled'):
+                await iterator.__anext__()
+
+        asyncio.run(run())
+        assert duckdb_cursor.execute('select 42').fetchall() == [(42,)]
+
+    def test_fetch_arrow_async_connection_lock(self, duckdb_cursor):
+        pytest.importorskip("pyarrow")
+
+        async def run():
+            rel = duckdb_cursor.sql('select count(*) c from range(100000000) t(i)')
+            task = asyncio.ensure_future(rel.fetch_arrow_async())
+            await asyncio.sleep(0.1)
+            # the asynchronous query holds the connection lock, this query waits for it instead of interrupting it
+            assert duckdb_cursor.execute('select 42').fetchall() == [(42,)]
+            return await task
+
+        table = asyncio.run(run())
+        assert table.column('c').to_pylist() == [100000000]
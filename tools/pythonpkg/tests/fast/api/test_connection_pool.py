@@ -0,0 +1,133 @@
+import threading
+import time
+
+import pytest
+import duckdb
+from duckdb import ConnectionPool
+
+
+class TestConnectionPool(object):
+    def test_checkout_checkin(self):
+        with ConnectionPool(size=2) as pool:
+            con = pool.checkout()
+            assert con.execute('select 42').fetchall() == [(42,)]
+            assert pool.checked_out == 1
+            pool.checkin(con)
+            assert pool.checked_out == 0
+            assert pool.idle == 1
+
+    def test_shared_database(self):
+        with ConnectionPool(size=2) as pool:
+            with pool.connection() as con:
+                con.execute('create table tbl as select 42 i')
+            with pool.connection() as con1, pool.connection() as con2:
+                assert con1.execute('select * from tbl').fetchall() == [(42,)]
+                assert con2.execute('select * from tbl').fetchall() == [(42,)]
+
+    def test_connections_are_created_lazily(self):
+        with ConnectionPool(size=4) as pool:
+            with pool.connection():
+                pass
+            assert pool.idle == 1
+
+    def test_timeout(self):
+        with ConnectionPool(size=1, timeout=0.1) as pool:
+            con = pool.checkout()
+            with pytest.raises(duckdb.ConnectionException, match='Timed out waiting for a connection'):
+                pool.checkout()
+            pool.checkin(con)
+            pool.checkin(pool.checkout())
+
+    def test_bounded_wait(self):
+        with ConnectionPool(size=1) as pool:
+            con = pool.checkout()
+
+            def release():
+                time.sleep(0.2)
+                pool.checkin(con)
+
+            thread = threading.Thread(target=release)
+            thread.start()
+            # waits until the connection is checked in by the other thread
+            with pool.connection(timeout=10) as other:
+                assert other.execute('select 1').fetchall() == [(1,)]
+            thread.join()
+
+    def test_concurrent_queries(self):
+        with ConnectionPool(size=4) as pool:
+            with pool.connection() as con:
+                con.execute('create table tbl as select i from range(100000) t(i)')
+            results = []
+
+            def run_query():
+                with pool.connection(timeout=10) as con:
+                    results.append(con.execute('select sum(i) from tbl').fetchone()[0])
+
+            threads = [threading.Thread(target=run_query) for _ in range(16)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            assert results == [4999950000] * 16
+            assert pool.checked_out == 0
+            assert pool.idle <= 4
+
+    def test_reset(self):
+        with ConnectionPool(size=1) as pool:
+            with pool.connection() as con:
+                con.execute("set threads=1")
+                con.execute("create temp table tmp as select 42 i")
+                con.execute('begin')
+            with pool.connection() as con:
+                with pytest.raises(duckdb.CatalogException):
+                    con.execute('select * from tmp')
+                # no transaction was left open
+                con.execute('begin')
+                con.execute('commit')
+
+    def test_no_reset(self):
+        with ConnectionPool(size=1, reset=False) as pool:
+            with pool.connection() as con:
+                con.execute("create temp table tmp as select 42 i")
+                con.execute('begin')
+                con.execute('insert into tmp values (43)')
+            with pool.connection() as con:
+                # the connection is reused, but the open transaction was rolled back
+                assert con.execute('select * from tmp').fetchall() == [(42,)]
+                con.execute('begin')
+                con.execute('commit')
+
+    def test_health_check(self):
+        with ConnectionPool(size=1, reset=False) as pool:
+            con = pool.checkout()
+            pool.checkin(con)
+            # a closed connection is replaced when it is checked out
+            con.close()
+            with pool.connection() as con:
+                assert con.execute('select 42').fetchall() == [(42,)]
+
+    def test_checkin_unknown_connection(self):
+        with ConnectionPool(size=1) as pool:
+            with pytest.raises(duckdb.InvalidInputException, match='not checked out from this pool'):
+                pool.checkin(duckdb.connect())
+
+    def test_closed_pool(self):
+        pool = ConnectionPool(size=1)
+        con = pool.checkout()
+        pool.close()
+        with pytest.raises(duckdb.ConnectionException, match='Connection pool already closed'):
+            pool.checkout()
+        # checking in after the pool was closed is allowed
+        pool.checkin(con)
+
+    def test_invalid_size(self):
+        with pytest.raises(duckdb.InvalidInputException):
+            ConnectionPool(size=0)
+
+    def test_file_database(self, tmp_path):
+        database = str(tmp_path / 'pool.db')
+        with ConnectionPool(database, size=2) as pool:
+            with pool.connection() as con:
+                con.execute('create table tbl as select 42 i')
+        with duckdb.connect(database) as con:
+            assert con.execute('select * from tbl').fetchall() == [(42,)]
@@ -0,0 +1,106 @@
+import pytest
+import duckdb
+
+
+class TestPreparedStatement(object):
+    def test_prepare_execute(self, duckdb_cursor):
+        duckdb_cursor.execute('create table tbl as select i, i::VARCHAR s from range(100) t(i)')
+        stmt = duckdb_cursor.prepare('select s from tbl where i = ?')
+        assert isinstance(stmt, duckdb.PreparedStatement)
+        for i in range(10):
+            assert stmt.execute([i]).fetchall() == [(str(i),)]
+        # the statement returns itself, like 'execute' on the connection
+        assert stmt.execute([42]).fetchone() == ('42',)
+        assert stmt.fetchone() is None
+
+    def test_prepare_named_parameters(self, duckdb_cursor):
+        stmt = duckdb_cursor.prepare('select $a::INTEGER + $b::INTEGER')
+        assert stmt.parameter_names == ['a', 'b']
+        assert stmt.execute({'a': 1, 'b': 2}).fetchall() == [(3,)]
+        assert stmt.execute({'b': 40, 'a': 2}).fetchall() == [(42,)]
+
+    def test_prepare_metadata(self, duckdb_cursor):
+        stmt = duckdb_cursor.prepare('select ?::INTEGER AS a, ?::VARCHAR AS b')
+        assert stmt.query == 'select ?::INTEGER AS a, ?::VARCHAR AS b'
+        assert stmt.type == duckdb.StatementType.SELECT
+        assert stmt.parameter_names == ['1', '2']
+        assert stmt.parameter_types == [duckdb.typing.INTEGER, duckdb.typing.VARCHAR]
+        assert stmt.columns == ['a', 'b']
+        assert stmt.types == [duckdb.typing.INTEGER, duckdb.typing.VARCHAR]
+        assert [column[0] for column in stmt.description] == ['a', 'b']
+
+    def test_prepare_executemany(self, duckdb_cursor):
+        duckdb_cursor.execute('create table tbl (i INTEGER, s VARCHAR)')
+        stmt = duckdb_cursor.prepare('insert into tbl values (?, ?)')
+        stmt.executemany([[1, 'a'], [2, 'b'], [3, 'c']])
+        assert duckdb_cursor.execute('select * from tbl order by i').fetchall() == [(1, 'a'), (2, 'b'), (3, 'c')]
+        with pytest.raises(duckdb.InvalidInputException, match='non-empty list'):
+            stmt.executemany([])
+
+    def test_prepare_wrong_parameters(self, duckdb_cursor):
+        stmt = duckdb_cursor.prepare('select ?::INTEGER')
+        with pytest.raises(duckdb.InvalidInputException, match='Prepared statement needs 1 parameters, 2 given'):
+            stmt.execute([1, 2])
+        # the statement can still be used after an error
+        assert stmt.execute([1]).fetchall() == [(1,)]
+
+    def test_prepare_multiple_statements(self, duckdb_cursor):
+        with pytest.raises(duckdb.InvalidInputException, match='exactly one statement'):
+            duckdb_cursor.prepare('select 42; select 43')
+
+    def test_prepare_schema_change(self, duckdb_cursor):
+        duckdb_cursor.execute('create table tbl as select 42 i')
+        stmt = duckdb_cursor.prepare('select * from tbl')
+        assert stmt.execute().fetchall() == [(42,)]
+        # the statement is rebound when the catalog changes
+        duckdb_cursor.execute('drop table tbl')
+        duckdb_cursor.execute("create table tbl as select 'hello' s, 84 j")
+        assert stmt.execute().fetchall() == [('hello', 84)]
+
+    def test_prepare_closed(self, duckdb_cursor):
+        stmt = duckdb_cursor.prepare('select 42')
+        stmt.close()
+        with pytest.raises(duckdb.InvalidInputException, match='Prepared statement already closed'):
+            stmt.execute()
+
+    def test_prepare_closed_connection(self):
+        con = duckdb.connect()
+        stmt = con.prepare('select 42')
+        con.close()
+        with pytest.raises(duckdb.ConnectionException, match='Connection already closed'):
+            stmt.execute()
+
+    def test_prepare_no_result(self, duckdb_cursor):
+        stmt = duckdb_cursor.prepare('select 42')
+        with pytest.raises(duckdb.InvalidInputException, match='No open result set'):
+            stmt.fetchall()
+
+    def test_prepare_arrow(self, duckdb_cursor):
+        pa = pytest.importorskip("pyarrow")
+        stmt = duckdb_cursor.prepare('select * from range(?) t(i)')
+        table = stmt.execute([10]).arrow()
+        assert isinstance(table, pa.Table)
+        assert table.num_rows == 10
+
+    def test_prepare_df(self, duckdb_cursor):
+        pytest.importorskip("pandas")
+        stmt = duckdb_cursor.prepare('select * from range(?) t(i)')
+        df = stmt.execute([10]).df()
+        assert list(df['i']) == list(range(10))
+
+    def test_prepare_module_level(self):
+        stmt = duckdb.prepare('select ?::INTEGER * 2')
+        assert stmt.execute([21]).fetchall() == [(42,)]
+
+    def test_prepare_relation(self, duckdb_cursor):
+        duckdb_cursor.execute('create table tbl as select i, i::VARCHAR s from range(100) t(i)')
+        stmt = duckdb_cursor.prepare('select i, s from tbl where i < ?')
+        rel = stmt.relation([5])
+        assert rel.columns == ['i', 's']
+        assert rel.filter('i > 2').order('i').fetchall() == [(3, '3'), (4, '4')]
+        # the relation holds the result of the execution, it does not change when the statement is executed again
+        assert stmt.relation([2], alias='small').alias == 'small'
+        assert rel.count('*').fetchone() == (5,)
+
+        with pytest.raises(duckdb.InvalidInputException, match='Only a SELECT statement'):
+            duckdb_cursor.prepare('insert into tbl values (?, ?)').relation([1, 'a'])
@@ -0,0 +1,68 @@
+import pytest
+import duckdb
+from duckdb.profiling import QueryProfile
+
+
+class TestProfile(object):
+    def test_relation_profile(self, duckdb_cursor):
+        rel = duckdb_cursor.sql('select i % 10 AS g, sum(i) from range(10000) t(i) group by g')
+        profile = rel.profile()
+        assert isinstance(profile, QueryProfile)
+        assert profile.latency >= 0
+        operators = profile.operators()
+        assert len(operators) > 0
+        names = [node.name for node in operators]
+        assert any('GROUP_BY' in name for name in names)
+        assert any(node.operator_cardinality == 10 for node in operators)
+        # the relation can still be used afterwards
+        assert len(rel.fetchall()) == 10
+
+    def test_execute_profile(self, duckdb_cursor):
+        duckdb_cursor.execute('select * from range(100) t(i) where i < 50', profile=True)
+        # the result is still available
+        assert len(duckdb_cursor.fetchall()) == 50
+        profile = duckdb_cursor.get_profile()
+        assert 'range(100)' in profile.query
+        filters = [node for node in profile.operators() if node.name == 'FILTER']
+        assert len(filters) == 1
+        assert filters[0].operator_cardinality == 50
+
+    def test_profiling_is_restored(self, duckdb_cursor):
+        duckdb_cursor.execute('select 42', profile=True)
+        assert duckdb_cursor.execute("select current_setting('enable_profiling')").fetchone() == (None,)
+
+    def test_profile_with_parameters(self, duckdb_cursor):
+        duckdb_cursor.execute('select ?::INTEGER + 1', [41], profile=True)
+        assert duckdb_cursor.fetchall() == [(42,)]
+        assert len(duckdb_cursor.get_profile().operators()) > 0
+
+    def test_no_profile(self):
+        con = duckdb.connect()
+        with pytest.raises(duckdb.InvalidInputException, match='No query has been profiled yet'):
+            con.get_profile()
+
+    def test_profile_error(self, duckdb_cursor):
+        with pytest.raises(duckdb.Error):
+            duckdb_cursor.execute('select * from non_existent_table', profile=True)
+        assert duckdb_cursor.execute("select current_setting('enable_profiling')").fetchone() == (None,)
+
+    def test_profile_to_dict(self, duckdb_cursor):
+        profile = duckdb_cursor.sql('select * from range(10) t(i) order by i desc').profile()
+        columns = profile.to_dict()
+        assert columns['operator_id'] == list(range(len(profile.operators())))
+        assert columns['parent_id'][0] is None
+        assert columns['depth'][0] == 0
+        for depth, parent_id in zip(columns['depth'][1:], columns['parent_id'][1:]):
+            assert columns['depth'][parent_id] == depth - 1
+
+    def test_profile_df(self, duckdb_cursor):
+        pd = pytest.importorskip("pandas")
+        df = duckdb_cursor.sql('select * from range(10)').profile().df()
+        assert isinstance(df, pd.DataFrame)
+        assert 'operator_timing' in df.columns
+
+    def test_profile_arrow(self, duckdb_cursor):
+        pa = pytest.importorskip("pyarrow")
+        table = duckdb_cursor.sql('select * from range(10)').profile().arrow()
+        assert isinstance(table, pa.Table)
+        assert 'operator_cardinality' in table.column_names
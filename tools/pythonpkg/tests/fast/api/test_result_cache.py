@@ -0,0 +1,162 @@
+import pytest
+import duckdb
+
+pd = pytest.importorskip("pandas")
+
+
+CACHE_SIZE = 16 * 1024 * 1024
+
+
+class TestResultCache(object):
+    def test_disabled_by_default(self, duckdb_cursor):
+        duckdb_cursor.execute('create table tbl as select 42 i')
+        duckdb_cursor.execute('select * from tbl').fetchall()
+        duckdb_cursor.execute('select * from tbl').fetchall()
+        assert duckdb_cursor.result_cache_info() == {
+            'hits': 0,
+            'misses': 0,
+            'size': 0,
+            'memory_usage': 0,
+            'capacity': 0,
+        }
+
+    def test_cache_hit(self, duckdb_cursor):
+        duckdb_cursor.set_result_cache_size(CACHE_SIZE)
+        duckdb_cursor.execute('create table tbl as select i, i::VARCHAR s from range(1000) t(i)')
+        query = 'select sum(i), max(s) from tbl'
+        assert duckdb_cursor.execute(query).fetchall() == [(499500, '999')]
+        assert duckdb_cursor.execute(query).fetchall() == [(499500, '999')]
+        info = duckdb_cursor.result_cache_info()
+        assert info['hits'] == 1
+        assert info['misses'] == 1
+        assert info['size'] == 1
+        assert 0 < info['memory_usage'] <= CACHE_SIZE
+        assert info['capacity'] == CACHE_SIZE
+
+    def test_fetch_methods(self, duckdb_cursor):
+        duckdb_cursor.set_result_cache_size(CACHE_SIZE)
+        duckdb_cursor.execute('create table tbl as select i from range(3) t(i)')
+        query = 'select i from tbl order by i'
+        duckdb_cursor.execute(query)
+        assert duckdb_cursor.description[0][0] == 'i'
+        assert duckdb_cursor.fetchone() == (0,)
+        assert duckdb_cursor.fetchall() == [(1,), (2,)]
+        df = duckdb_cursor.execute(query).df()
+        assert df['i'].tolist() == [0, 1, 2]
+        assert duckdb_cursor.result_cache_info()['hits'] == 1
+
+    def test_parameters(self, duckdb_cursor):
+        duckdb_cursor.set_result_cache_size(CACHE_SIZE)
+        duckdb_cursor.execute('create table tbl as select i, i::VARCHAR s from range(100) t(i)')
+        for _ in range(2):
+            for i in range(5):
+                assert duckdb_cursor.execute('select s from tbl where i = ?', [i]).fetchall() == [(str(i),)]
+        info = duckdb_cursor.result_cache_info()
+        # every combination of parameter values gets its own result
+        assert info['size'] == 5
+        assert info['hits'] == 5
+        # the type of the value is part of the key as well
+        assert duckdb_cursor.execute('select ?', [1]).fetchall() == [(1,)]
+        assert duckdb_cursor.execute('select ?', ['1']).fetchall() == [('1',)]
+
+    def test_invalidation(self, duckdb_cursor):
+        duckdb_cursor.set_result_cache_size(CACHE_SIZE)
+        duckdb_cursor.execute('create table tbl as select 42 i')
+        assert duckdb_cursor.execute('select sum(i) from tbl').fetchall() == [(42,)]
+        duckdb_cursor.execute('insert into tbl values (1)')
+        assert duckdb_cursor.execute('select sum(i) from tbl').fetchall() == [(43,)]
+        assert duckdb_cursor.result_cache_info()['hits'] == 0
+
+    def test_invalidation_other_connection(self, duckdb_cursor):
+        duckdb_cursor.set_result_cache_size(CACHE_SIZE)
+        duckdb_cursor.execute('create table tbl as select 42 i')
+        assert duckdb_cursor.execute('select sum(i) from tbl').fetchall() == [(42,)]
+        assert duckdb_cursor.execute('select sum(i) from tbl').fetchall() == [(42,)]
+        assert duckdb_cursor.result_cache_info()['hits'] == 1
+        # a commit of another connection makes the cached result stale
+        other = duckdb_cursor.cursor()
+        other.execute('update tbl set i = 84')
+        assert duckdb_cursor.execute('select sum(i) from tbl').fetchall() == [(84,)]
+        assert duckdb_cursor.result_cache_info()['hits'] == 1
+
+    def test_uncommitted_changes(self, duckdb_cursor):
+        duckdb_cursor.set_result_cache_size(CACHE_SIZE)
+        duckdb_cursor.execute('create table tbl as select 42 i')
+        other = duckdb_cursor.cursor()
+        other.execute('begin')
+        other.execute('insert into tbl values (1)')
+        assert duckdb_cursor.execute('select sum(i) from tbl').fetchall() == [(42,)]
+        # nothing is cached inside of a transaction
+        assert other.execute('select sum(i) from tbl').fetchall() == [(43,)]
+        assert other.execute('select sum(i) from tbl').fetchall() == [(43,)]
+        assert other.result_cache_info()['misses'] == 0
+        other.execute('commit')
+        assert duckdb_cursor.execute('select sum(i) from tbl').fetchall() == [(43,)]
+        assert duckdb_cursor.result_cache_info()['hits'] == 0
+
+    def test_volatile_functions_not_cached(self, duckdb_cursor):
+        duckdb_cursor.set_result_cache_size(CACHE_SIZE)
+        duckdb_cursor.execute('create table tbl as select i from range(10) t(i)')
+        duckdb_cursor.execute('select random() from tbl').fetchall()
+        duckdb_cursor.execute('select i from tbl where i < random() * 10').fetchall()
+        duckdb_cursor.execute('select now()').fetchall()
+        duckdb_cursor.execute('select i, gen_random_uuid() from tbl').fetchall()
+        assert duckdb_cursor.result_cache_info()['size'] == 0
+        assert duckdb_cursor.result_cache_info()['misses'] == 0
+
+    def test_volatile_functions_in_views_not_cached(self, duckdb_cursor):
+        duckdb_cursor.set_result_cache_size(CACHE_SIZE)
+        duckdb_cursor.execute('create view v as select random() r')
+        duckdb_cursor.execute('create sequence seq')
+        duckdb_cursor.execute("create view w as select nextval('seq') n")
+        duckdb_cursor.execute('create macro ts() as now()')
+        duckdb_cursor.execute('select * from v').fetchall()
+        assert duckdb_cursor.execute('select * from w').fetchall() == [(1,)]
+        assert duckdb_cursor.execute('select * from w').fetchall() == [(2,)]
+        duckdb_cursor.execute('select ts()').fetchall()
+        assert duckdb_cursor.result_cache_info()['size'] == 0
+        # consistent views are cached
+        duckdb_cursor.execute('create view c as select 42 i')
+        duckdb_cursor.execute('select * from c').fetchall()
+        assert duckdb_cursor.execute('select * from c').fetchall() == [(42,)]
+        assert duckdb_cursor.result_cache_info()['hits'] == 1
+
+    def test_external_data_not_cached(self, duckdb_cursor):
+        duckdb_cursor.set_result_cache_size(CACHE_SIZE)
+        df = pd.DataFrame({'i': [1, 2, 3]})
+        assert duckdb_cursor.execute('select sum(i) from df').fetchall() == [(6,)]
+        df['i'] = [4, 5, 6]
+        assert duckdb_cursor.execute('select sum(i) from df').fetchall() == [(15,)]
+        assert duckdb_cursor.result_cache_info()['size'] == 0
+
+    def test_memory_budget(self, duckdb_cursor):
+        duckdb_cursor.set_result_cache_size(CACHE_SIZE)
+        duckdb_cursor.execute('create table tbl as select i from range(10) t(i)')
+        for i in range(5):
+            duckdb_cursor.execute(f'select i + {i} from tbl').fetchall()
+        info = duckdb_cursor.result_cache_info()
+        assert info['size'] == 5
+        # shrinking the cache evicts the least recently used results
+        duckdb_cursor.set_result_cache_size(info['memory_usage'] - 1)
+        info = duckdb_cursor.result_cache_info()
+        assert info['size'] == 4
+        duckdb_cursor.execute('select i + 0 from tbl').fetchall()
+        assert duckdb_cursor.result_cache_info()['hits'] == 0
+        duckdb_cursor.execute('select i + 4 from tbl').fetchall()
+        assert duckdb_cursor.result_cache_info()['hits'] == 1
+        # results that do not fit in the cache are not cached
+        duckdb_cursor.set_result_cache_size(1)
+        assert duckdb_cursor.result_cache_info()['size'] == 0
+        duckdb_cursor.execute('select i from tbl').fetchall()
+        assert duckdb_cursor.result_cache_info()['size'] == 0
+
+    def test_catalog_changes_clear_cache(self, duckdb_cursor):
+        duckdb_cursor.set_result_cache_size(CACHE_SIZE)
+        duckdb_cursor.execute('create table tbl as select 42 i')
+        duckdb_cursor.execute('select * from tbl').fetchall()
+        assert duckdb_cursor.result_cache_info()['size'] == 1
+        duckdb_cursor.execute("set default_order='desc'")
+        assert duckdb_cursor.result_cache_info()['size'] == 0
+        duckdb_cursor.execute('drop table tbl')
+        duckdb_cursor.execute("create table tbl as select 'hello' s")
+        assert duckdb_cursor.execute('select * from tbl').fetchall() == [('hello',)]
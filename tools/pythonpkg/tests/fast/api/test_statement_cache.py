@@ -0,0 +1,133 @@
+import pytest
+import duckdb
+
+
+class TestStatementCache(object):
+    def test_disabled_by_default(self, duckdb_cursor):
+        duckdb_cursor.execute('select ?::INTEGER', [1]).fetchall()
+        duckdb_cursor.execute('select ?::INTEGER', [1]).fetchall()
+        assert duckdb_cursor.statement_cache_info() == {'hits': 0, 'misses': 0, 'size': 0, 'capacity': 0}
+
+    def test_execute_cache(self, duckdb_cursor):
+        duckdb_cursor.set_statement_cache_size(16)
+        duckdb_cursor.execute('create table tbl as select i, i::VARCHAR s from range(100) t(i)')
+        for i in range(10):
+            assert duckdb_cursor.execute('select s from tbl where i = ?', [i]).fetchall() == [(str(i),)]
+        info = duckdb_cursor.statement_cache_info()
+        assert info['hits'] == 9
+        assert info['size'] == 1
+        assert info['capacity'] == 16
+
+    def test_parameter_types(self, duckdb_cursor):
+        duckdb_cursor.set_statement_cache_size(16)
+        assert duckdb_cursor.execute('select ?', [42]).fetchall() == [(42,)]
+        assert duckdb_cursor.execute('select ?', ['hello']).fetchall() == [('hello',)]
+        assert duckdb_cursor.execute('select ?', [43]).fetchall() == [(43,)]
+        # every combination of parameter types gets its own statement
+        info = duckdb_cursor.statement_cache_info()
+        assert info['size'] == 2
+        assert info['hits'] == 1
+
+    def test_sql_with_parameters(self, duckdb_cursor):
+        duckdb_cursor.set_statement_cache_size(16)
+        duckdb_cursor.execute('create table tbl (i INTEGER)')
+        for i in range(5):
+            assert duckdb_cursor.sql('insert into tbl values (?::INTEGER + 1) returning i', params=[i]).fetchall() == [
+                (i + 1,)
+            ]
+        assert duckdb_cursor.statement_cache_info()['hits'] == 4
+        # a SELECT statement with parameters results in a lazy relation, which does not use the cache
+        duckdb_cursor.sql('select ?::INTEGER + 1', params=[1]).fetchall()
+        assert duckdb_cursor.statement_cache_info()['hits'] == 4
+
+    def test_lru_eviction(self, duckdb_cursor):
+        duckdb_cursor.set_statement_cache_size(2)
+        duckdb_cursor.execute('select 1')
+        duckdb_cursor.execute('select 2')
+        duckdb_cursor.execute('select 1')
+        # 'select 2' is the least recently used statement
+        duckdb_cursor.execute('select 3')
+        assert duckdb_cursor.statement_cache_info()['size'] == 2
+        hits = duckdb_cursor.statement_cache_info()['hits']
+        duckdb_cursor.execute('select 1')
+        assert duckdb_cursor.statement_cache_info()['hits'] == hits + 1
+        duckdb_cursor.execute('select 2')
+        assert duckdb_cursor.statement_cache_info()['hits'] == hits + 1
+
+    def test_shrink_cache(self, duckdb_cursor):
+        duckdb_cursor.set_statement_cache_size(16)
+        for i in range(10):
+            duckdb_cursor.execute(f'select {i}')
+        assert duckdb_cursor.statement_cache_info()['size'] == 10
+        duckdb_cursor.set_statement_cache_size(3)
+        assert duckdb_cursor.statement_cache_info()['size'] == 3
+        duckdb_cursor.set_statement_cache_size(0)
+        assert duckdb_cursor.statement_cache_info()['size'] == 0
+
+    def test_invalidation(self, duckdb_cursor):
+        duckdb_cursor.set_statement_cache_size(16)
+        duckdb_cursor.execute('create table tbl as select 42 i')
+        assert duckdb_cursor.execute('select * from tbl').fetchall() == [(42,)]
+        assert duckdb_cursor.statement_cache_info()['size'] == 1
+        # statements that change the catalog or the settings clear the cache
+        duckdb_cursor.execute('drop table tbl')
+        assert duckdb_cursor.statement_cache_info()['size'] == 0
+        duckdb_cursor.execute("create table tbl as select 'hello' s, 84 j")
+        assert duckdb_cursor.execute('select * from tbl').fetchall() == [('hello', 84)]
+
+    def test_invalidation_other_connection(self, duckdb_cursor):
+        duckdb_cursor.set_statement_cache_size(16)
+        duckdb_cursor.execute('create table tbl as select 42 i')
+        assert duckdb_cursor.execute('select * from tbl').fetchall() == [(42,)]
+        # a change made by another connection is picked up when the cached statement is rebound
+        other = duckdb_cursor.cursor()
+        other.execute('alter table tbl add column j VARCHAR')
+        assert duckdb_cursor.execute('select * from tbl').fetchall() == [(42, None)]
+
+    def test_settings_invalidate(self, duckdb_cursor):
+        duckdb_cursor.set_statement_cache_size(16)
+        query = 'select * from (values (1), (2)) t(i) order by i'
+        assert duckdb_cursor.execute(query).fetchall() == [(1,), (2,)]
+        duckdb_cursor.execute("set default_order='desc'")
+        assert duckdb_cursor.execute(query).fetchall() == [(2,), (1,)]
+
+    def test_transactions_keep_cache(self, duckdb_cursor):
+        duckdb_cursor.set_statement_cache_size(16)
+        duckdb_cursor.execute('create table tbl (i INTEGER)')
+        for i in range(3):
+            duckdb_cursor.execute('begin')
+            duckdb_cursor.execute('insert into tbl values (?)', [i])
+            duckdb_cursor.execute('commit')
+        assert duckdb_cursor.statement_cache_info()['hits'] == 2
+        assert duckdb_cursor.execute('select count(*) from tbl').fetchall() == [(3,)]
+
+    def test_multiple_statements_not_cached(self, duckdb_cursor):
+        duckdb_cursor.set_statement_cache_size(16)
+        duckdb_cursor.execute('select 1; select 2')
+        duckdb_cursor.execute('select 1; select 2')
+        assert duckdb_cursor.statement_cache_info()['hits'] == 0
+
+    def test_error_with_cache(self, duckdb_cursor):
+        duckdb_cursor.set_statement_cache_size(16)
+        duckdb_cursor.execute('select ?::INTEGER', ['1'])
+        with pytest.raises(duckdb.ConversionException):
+            duckdb_cursor.execute('select ?::INTEGER', ['abc'])
+        assert duckdb_cursor.execute('select ?::INTEGER', ['2']).fetchall() == [(2,)]
+
+    def test_named_parameter_order(self, duckdb_cursor):
+        duckdb_cursor.set_statement_cache_size(16)
+        query = 'select $a::INTEGER - $b::INTEGER'
+        assert duckdb_cursor.execute(query, {'a': 3, 'b': 1}).fetchall() == [(2,)]
+        assert duckdb_cursor.execute(query, {'b': 1, 'a': 5}).fetchall() == [(4,)]
+        info = duckdb_cursor.statement_cache_info()
+        assert info['size'] == 1
+        assert info['hits'] == 1
+
+    def test_replacement_scan_not_cached(self, duckdb_cursor):
+        pd = pytest.importorskip("pandas")
+        duckdb_cursor.set_statement_cache_size(16)
+        df = pd.DataFrame({'i': [1, 2, 3]})
+        assert duckdb_cursor.execute('select sum(i) from df').fetchall() == [(6,)]
+        df = pd.DataFrame({'i': [10, 20, 30]})
+        assert duckdb_cursor.execute('select sum(i) from df').fetchall() == [(60,)]
+        assert duckdb_cursor.statement_cache_info()['size'] == 0
@@ -291,3 +291,68 @@ class TestArrowFetchRecordBatch(object):
                 assert len(chunk) == remainder
             with pytest.raises(StopIteration):
                 chunk = record_batch_reader.read_next_batch()
+
+    @pytest.mark.parametrize('prefetch', [1, 2, 8])
+    def test_prefetch(self, prefetch):
+        duckdb_cursor = duckdb.connect()
+        duckdb_cursor.execute("CREATE table t as select range a, range::VARCHAR b from range(10000);")
+        record_batch_reader = duckdb_cursor.execute("SELECT a, b FROM t ORDER BY a").fetch_record_batch(
+            1024, prefetch=prefetch
+        )
+        assert record_batch_reader.schema.names == ['a', 'b']
+        sizes = [len(batch) for batch in record_batch_reader]
+        assert sizes == [1024] * 9 + [784]
+
+        record_batch_reader = duckdb_cursor.execute("SELECT a, b FROM t ORDER BY a").fetch_record_batch(
+            1024, prefetch=prefetch
+        )
+        table = record_batch_reader.read_all()
+        assert table.column('a').to_pylist() == list(range(10000))
+        assert table.column('b').to_pylist() == [str(i) for i in range(10000)]
+
+    def test_prefetch_relation(self):
+        duckdb_cursor = duckdb.connect()
+        duckdb_cursor.execute("CREATE table t as select range a from range(3000);")
+        relation = duckdb_cursor.table('t')
+        record_batch_reader = relation.record_batch(1000, prefetch=2)
+        assert sum(len(batch) for batch in record_batch_reader) == 3000
+        record_batch_reader = relation.fetch_arrow_reader(1000, prefetch=2)
+        assert sum(len(batch) for batch in record_batch_reader) == 3000
+
+    def test_prefetch_early_release(self):
+        duckdb_cursor = duckdb.connect()
+        duckdb_cursor.execute("CREATE table t as select range a from range(1000000);")
+        record_batch_reader = duckdb_cursor.execute("SELECT a FROM t").fetch_record_batch(1000, prefetch=4)
+        assert len(record_batch_reader.read_next_batch()) == 1000
+        # releasing the reader stops the background thread, the connection can be used right away
+        del record_batch_reader
+        assert duckdb_cursor.execute("SELECT count(*) FROM t").fetchall() == [(1000000,)]
+
+    def test_prefetch_pandas_scan(self):
+        pd = pytest.importorskip('pandas')
+        duckdb_cursor = duckdb.connect()
+        df = pd.DataFrame({'a': range(10000)})
+        # the background thread needs the GIL to scan the DataFrame
+        record_batch_reader = duckdb_cursor.execute("SELECT a FROM df").fetch_record_batch(1000, prefetch=2)
+        assert record_batch_reader.read_all().num_rows == 10000
+
+    def test_prefetch_error(self):
+        duckdb_cursor = duckdb.connect()
+        # the error is either thrown while executing the query or while fetching the batches
+        with pytest.raises(Exception, match='boom'):
+            record_batch_reader = duckdb_cursor.execute(
+                "SELECT CASE WHEN a < 5000 THEN a ELSE error('boom') END FROM range(10000) t(a)"
+            ).fetch_record_batch(100, prefetch=2)
+            record_batch_reader.read_all()
+
+    def test_prefetch_connection_used(self):
+        duckdb_cursor = duckdb.connect()
+        duckdb_cursor.execute("CREATE table t as select range a from range(1000000);")
+        record_batch_reader = duckdb_cursor.execute("SELECT a FROM t").fetch_record_batch(1000, prefetch=4)
+        assert len(record_batch_reader.read_next_batch()) == 1000
+        # the query waits for the batch that is being fetched, and then closes the result of the reader
+        for _ in range(10):
+            assert duckdb_cursor.execute("SELECT count(*) FROM t").fetchall() == [(1000000,)]
+        # only the batches that were prefetched before the result was closed are left
+        remaining = sum(len(batch) for batch in record_batch_reader)
+        assert remaining < 1000000 - 1000
@@ -0,0 +1,83 @@
+import duckdb
+import numpy as np
+import pandas as pd
+
+
+class TestPandasFilterPushdown(object):
+    def test_filters_are_pushed_down(self, duckdb_cursor):
+        df = pd.DataFrame({'i': np.arange(10000), 's': [str(x) for x in range(10000)]})
+        plan = duckdb_cursor.sql('select s from df where i > 5000').explain()
+        assert 'Filters' in plan
+        assert 'i>5000' in plan
+
+    def test_numeric_filters(self, duckdb_cursor):
+        df = pd.DataFrame({'i': np.arange(100000), 'j': np.arange(100000) % 7, 'f': np.arange(100000) / 2})
+        res = duckdb_cursor.sql('select i, j from df where i >= 50000 and i < 50005 order by i').fetchall()
+        assert res == [(i, i % 7) for i in range(50000, 50005)]
+        # the rows that satisfy the filter are spread over all of the vectors
+        res = duckdb_cursor.sql('select count(*), sum(i) from df where j = 3').fetchall()
+        expected = df[df['j'] == 3]
+        assert res == [(len(expected), expected['i'].sum())]
+        # filters on multiple columns
+        res = duckdb_cursor.sql('select i from df where f > 49000 and j = 0 order by i').fetchall()
+        assert res == [(i,) for i in range(98001, 100000) if i % 7 == 0]
+        # none of the rows satisfy the filter
+        assert duckdb_cursor.sql('select * from df where i > 100000').fetchall() == []
+        assert duckdb_cursor.sql('select * from df where i < 0').fetchall() == []
+
+    def test_filter_column_not_projected(self, duckdb_cursor):
+        df = pd.DataFrame({'a': np.arange(5000), 'b': np.arange(5000) * 2})
+        res = duckdb_cursor.sql('select b from df where a = 4242').fetchall()
+        assert res == [(8484,)]
+
+    def test_nullable_integers(self, duckdb_cursor):
+        values = [None if x % 3 == 0 else x for x in range(10000)]
+        df = pd.DataFrame({'i': pd.Series(values, dtype='Int64')})
+        res = duckdb_cursor.sql('select count(*) from df where i is null').fetchall()
+        assert res == [(3334,)]
+        res = duckdb_cursor.sql('select count(*) from df where i is not null').fetchall()
+        assert res == [(6666,)]
+        res = duckdb_cursor.sql('select i from df where i > 9990 order by i').fetchall()
+        assert res == [(x,) for x in range(9991, 10000) if x % 3 != 0]
+
+    def test_nan_values(self, duckdb_cursor):
+        values = np.arange(10000, dtype='float64')
+        values[:5000] = np.nan
+        df = pd.DataFrame({'f': values})
+        # NaN values are scanned as NULL
+        assert duckdb_cursor.sql('select count(*) from df where f is null').fetchall() == [(5000,)]
+        assert duckdb_cursor.sql('select count(*) from df where f < 6000').fetchall() == [(1000,)]
+        assert duckdb_cursor.sql('select count(*) from df where f > 10000').fetchall() == [(0,)]
+
+    def test_string_filters(self, duckdb_cursor):
+        df = pd.DataFrame({'i': np.arange(10000), 's': ['a' if x % 1000 == 0 else 'b' for x in range(10000)]})
+        res = duckdb_cursor.sql("select i from df where s = 'a' order by i").fetchall()
+        assert res == [(x,) for x in range(0, 10000, 1000)]
+        res = duckdb_cursor.sql("select count(*) from df where s = 'b' and i >= 5000").fetchall()
+        assert res == [(4995,)]
+
+    def test_strided_column(self, duckdb_cursor):
+        df = pd.DataFrame(np.arange(20000).reshape(-1, 2), columns=['a', 'b'])
+        res = duckdb_cursor.sql('select a, b from df where b between 10001 and 10005 order by a').fetchall()
+        assert res == [(10000, 10001), (10002, 10003), (10004, 10005)]
+
+    def test_numpy_dict(self, duckdb_cursor):
+        data = {'x': np.arange(10000, dtype=np.int32), 'y': np.arange(10000, dtype=np.uint8)}
+        res = duckdb_cursor.sql('select x from data where x > 9995 and y > 10 order by x').fetchall()
+        assert res == [(9996,), (9997,), (9998,), (9999,)]
+
+    def test_parallel_scan(self, duckdb_cursor):
+        duckdb_cursor.execute('set threads=4')
+        df = pd.DataFrame({'i': np.arange(1000000)})
+        res = duckdb_cursor.sql('select count(*), min(i), max(i) from df where i between 123456 and 654321').fetchall()
+        assert res == [(530866, 123456, 654321)]
+        res = duckdb_cursor.sql('select i from df where i % 100000 = 0 and i > 0 limit 3').fetchall()
+        assert res == [(100000,), (200000,), (300000,)]
+
+    def test_prepared_statement_mutated_data(self, duckdb_cursor):
+        data = {'i': np.arange(10000)}
+        statement = duckdb_cursor.prepare('select count(*) from data where i >= 9000')
+        assert statement.execute().fetchall() == [(1000,)]
+        # the values change in place between the executions, the zone maps of the first execution are stale
+        data['i'][:5000] = 9999
+        assert statement.execute().fetchall() == [(6000,)]
@@ -131,3 +131,39 @@ class TestRAPIQuery(object):
         other_rel = duckdb_cursor.sql('select a from rel')
         res = other_rel.fetchall()
         assert res == [(84,)]
+
+    def test_query_with_parameters_is_lazy(self, duckdb_cursor):
+        duckdb_cursor.execute("create table tbl as select i from range(10) t(i)")
+        rel = duckdb_cursor.sql("select i from tbl where i >= ? and i < ?", params=[5, 100])
+        duckdb_cursor.execute("insert into tbl values (42)")
+        # The relation is not executed until the result is fetched
+        assert rel.aggregate('count(*)').fetchall() == [(6,)]
+        assert rel.filter('i > 8').order('i').fetchall() == [(9,), (42,)]
+
+    def test_query_with_parameters_column_names(self, duckdb_cursor):
+        rel = duckdb_cursor.sql("select ?, ? + 1, ? as c", params=[1, 2, 3])
+        assert rel.columns == ['$1', '($2 + 1)', 'c']
+        assert rel.fetchall() == [(1, 3, 3)]
+
+    def test_query_with_named_parameters(self, duckdb_cursor):
+        rel = duckdb_cursor.sql(
+            """
+            with cte as (select $min as m)
+            select i from range(10) t(i), cte where i >= m and i in (select i from range($max) t(i))
+            """,
+            params={'min': 5, 'max': 7},
+        )
+        assert rel.fetchall() == [(5,), (6,)]
+
+    def test_query_with_parameters_streaming(self, duckdb_cursor):
+        rel = duckdb_cursor.sql("select i from range(?) t(i)", params=[1000000])
+        res = rel.execute()
+        assert len(res.fetchmany(10)) == 10
+        reader = rel.fetch_record_batch(10000)
+        assert reader.read_next_batch().num_rows == 10000
+
+    def test_query_with_invalid_parameters(self, duckdb_cursor):
+        with pytest.raises(duckdb.InvalidInputException, match='Prepared statement needs 2 parameters, 1 given'):
+            duckdb_cursor.sql("select ?, ?", params=[1])
+        with pytest.raises(duckdb.InvalidInputException):
+            duckdb_cursor.sql("select $a, $b", params={'a': 1})
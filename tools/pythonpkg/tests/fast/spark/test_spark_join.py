@@ -14,7 +14,7 @@ from duckdb.experimental.spark.sql.types import (
     ArrayType,
     MapType,
 )
-from duckdb.experimental.spark.sql.functions import col, struct, when, lit, array_contains
+from duckdb.experimental.spark.sql.functions import col, struct, when, lit, array_contains, broadcast
 from duckdb.experimental.spark.sql.functions import sum, avg, max, min, mean, count
 
 
@@ -328,3 +328,32 @@ class TestDataFrameJoin(object):
             Row(emp_id=5, name='Brown', superior_emp_id=2, superior_emp_name='Rose'),
             Row(emp_id=6, name='Brown', superior_emp_id=2, superior_emp_name='Rose'),
         ]
+
+    @pytest.mark.parametrize('how', ['inner', 'left', 'right', 'outer'])
+    def test_broadcast_join(self, dataframe_a, dataframe_b, how):
+        expected = dataframe_a.join(dataframe_b, dataframe_a.emp_dept_id == dataframe_b.dept_id, how)
+        expected = expected.sort(*expected.columns).collect()
+
+        # Broadcast hints are advisory, they don't change the result of the join
+        df = broadcast(dataframe_a).join(dataframe_b, dataframe_a.emp_dept_id == dataframe_b.dept_id, how)
+        assert df.columns == dataframe_a.columns + dataframe_b.columns
+        assert df.sort(*df.columns).collect() == expected
+
+        df = dataframe_a.join(dataframe_b.hint("broadcast"), dataframe_a.emp_dept_id == dataframe_b.dept_id, how)
+        assert df.sort(*df.columns).collect() == expected
+
+    def test_hint_derived(self, dataframe_a, dataframe_b):
+        # The hints are kept by the DataFrames derived from the hinted DataFrame
+        df = broadcast(dataframe_b).alias("s")
+        assert df._hints == ["broadcast"]
+        assert df.filter(col("dept_id") > 10).select("dept_id")._hints == ["broadcast"]
+        # but not by the result of a join
+        assert dataframe_a.join(df, dataframe_a.emp_dept_id == df.dept_id)._hints == []
+
+    def test_hint_invalid(self, dataframe_a):
+        from duckdb.experimental.spark.errors import PySparkTypeError
+
+        with pytest.raises(PySparkTypeError):
+            dataframe_a.hint(42)
+        # Unknown hints are ignored
+        assert dataframe_a.hint("shuffle_hash").collect() == dataframe_a.collect()
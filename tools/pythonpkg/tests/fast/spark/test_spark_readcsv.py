@@ -23,3 +23,31 @@ class TestSparkReadCSV(object):
         df = spark.read.csv(file_path)
         res = df.collect()
         assert res == [Row(column0=1, column1=2), Row(column0=3, column1=4), Row(column0=5, column1=6)]
+
+    def test_load_csv_multiple_paths(self, spark, tmp_path):
+        from duckdb.experimental.spark.sql.types import StructType, StructField, LongType, StringType
+
+        for i, rows in enumerate([["1;a", "2;b"], ["3;c"]]):
+            with open(tmp_path / f'part{i}.csv', 'w+') as f:
+                f.write("id;name\n" + "\n".join(rows) + "\n")
+
+        schema = StructType([StructField("id", LongType()), StructField("name", StringType())])
+        df = spark.read.load(
+            [(tmp_path / 'part0.csv').as_posix(), (tmp_path / 'part1.csv').as_posix()],
+            format="csv",
+            schema=schema,
+            header="true",
+            delimiter=";",
+        )
+        assert df.schema['id'].dataType.typeName() == 'long'
+        res = sorted(df.collect())
+        assert res == [Row(id=1, name='a'), Row(id=2, name='b'), Row(id=3, name='c')]
+
+        # Directories are expanded to the files they contain, subdirectories are only read by a recursive lookup
+        (tmp_path / 'nested').mkdir()
+        with open(tmp_path / 'nested' / 'part2.csv', 'w+') as f:
+            f.write("id;name\n4;d\n")
+        df = spark.read.load(tmp_path.as_posix(), format="csv", header=True, sep=";")
+        assert df.count() == 3
+        df = spark.read.load(tmp_path.as_posix(), format="csv", header=True, sep=";", recursiveFileLookup="true")
+        assert df.count() == 4
@@ -17,3 +17,21 @@ class TestSparkReadParquet(object):
         df = spark.read.parquet(file_path)
         res = df.collect()
         assert res == [Row(a=42, b=True, c='this is a long string')]
+
+    def test_load_parquet_merge_schema(self, duckdb_cursor, spark, tmp_path):
+        from duckdb.experimental.spark.sql.types import StructType, StructField, LongType
+
+        first = (tmp_path / 'first.parquet').as_posix()
+        second = (tmp_path / 'second.parquet').as_posix()
+        duckdb_cursor.execute(f"COPY (select 1 a, 2 b) to '{first}' (FORMAT PARQUET)")
+        duckdb_cursor.execute(f"COPY (select 3 a, 4 c) to '{second}' (FORMAT PARQUET)")
+
+        df = spark.read.load([first, second], mergeSchema=True)
+        assert df.columns == ['a', 'b', 'c']
+        assert df.count() == 2
+
+        schema = StructType([StructField("a", LongType())])
+        assert spark.read.parquet(first, second, mergeSchema="true").count() == 2
+        df = spark.read.load(tmp_path.as_posix(), format="parquet", schema=schema, mergeSchema=True)
+        assert df.schema['a'].dataType.typeName() == 'long'
+        assert sorted(df.collect()) == [Row(a=1), Row(a=3)]
@@ -91,3 +91,51 @@ class TestSparkSession(object):
 
     def test_udf(self, spark):
         udf_registration = spark.udf
+
+    def test_sql_after_catalog_change(self, spark):
+        spark.sql("create or replace table catalog_change_tbl as select range a from range(5)")
+        assert spark.sql("select * from catalog_change_tbl").columns == ['a']
+        # Changes made directly on the connection are visible to the next query
+        spark.conn.execute("alter table catalog_change_tbl add column b varchar default 'x'")
+        df = spark.sql("select * from catalog_change_tbl where a > 3")
+        assert df.columns == ['a', 'b']
+        assert df.collect() == [Row(a=4, b='x')]
+
+    def test_sql_args(self, spark):
+        df = spark.sql("select $1 + $2 as res", args=[20, 22])
+        assert df.collect() == [Row(res=42)]
+
+    def test_sql_args_statement_cache(self, spark):
+        spark.sql("create or replace table statement_cache_tbl as select range a from range(10)")
+        query = "select a from statement_cache_tbl where a = $1"
+        assert spark.sql(query, args=[3]).collect() == [Row(a=3)]
+        statements = list(spark._statement_cache.values())
+        assert len(statements) == 1
+
+        # the same query (up to whitespace) with parameters of the same types reuses the prepared statement
+        assert spark.sql(f"  {query}\n;", args=[7]).collect() == [Row(a=7)]
+        assert list(spark._statement_cache.values()) == statements
+
+        # the statement is executed again, so the result reflects the current data
+        spark.conn.execute("insert into statement_cache_tbl values (7)")
+        assert spark.sql(query, args=[7]).collect() == [Row(a=7), Row(a=7)]
+        assert list(spark._statement_cache.values()) == statements
+
+        # parameters of a different type use their own prepared statement
+        assert spark.sql(query, args=['4']).collect() == [Row(a=4)]
+        assert len(spark._statement_cache) == 2
+
+    def test_sql_args_statement_cache_invalidation(self, spark):
+        spark.createDataFrame([(1, 'a'), (2, 'b')], ['id', 'name']).createOrReplaceTempView('statement_cache_view')
+        query = "select name from statement_cache_view where id = $1"
+        assert spark.sql(query, args=[1]).collect() == [Row(name='a')]
+        assert len(spark._statement_cache) == 1
+
+        # replacing the view drops the prepared statements
+        spark.createDataFrame([(1, 'c')], ['id', 'name']).createOrReplaceTempView('statement_cache_view')
+        assert len(spark._statement_cache) == 0
+        assert spark.sql(query, args=[1]).collect() == [Row(name='c')]
+
+        # so do statements that are not queries
+        spark.sql("create or replace table statement_cache_other as select 1 i")
+        assert len(spark._statement_cache) == 0
@@ -196,3 +196,14 @@ class TestSparkToCSV(object):
         print(df.collect())
         print(csv_rel.collect())
         assert df.collect() == csv_rel.collect()
+
+    def test_repartition_to_csv(self, spark, tmp_path):
+        temp_dir = os.path.join(tmp_path, "repartitioned")
+        df = spark.range(100).toDF("id")
+
+        df.repartition(2).write.csv(temp_dir, header=True, compression="gzip")
+        assert sorted(os.listdir(temp_dir)) == ["part-00000-000.csv.gz", "part-00001-000.csv.gz"]
+
+        csv_rel = spark.read.csv(os.path.join(temp_dir, "*.csv.gz"), header=True)
+        assert csv_rel.columns == df.columns
+        assert csv_rel.count() == df.count()
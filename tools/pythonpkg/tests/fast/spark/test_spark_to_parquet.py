@@ -1,5 +1,6 @@
 import pytest
 import tempfile
+import re
 
 import os
 
@@ -38,3 +39,72 @@ class TestSparkToParquet(object):
         csv_rel = spark.read.parquet(temp_file_name)
 
         assert df.collect() == csv_rel.collect()
+
+    def test_repartition_to_parquet(self, spark, tmp_path):
+        temp_dir = os.path.join(tmp_path, "repartitioned")
+        df = spark.range(100).toDF("id")
+
+        threads = spark.conn.execute("select current_setting('threads')").fetchone()
+        df.repartition(3).write.parquet(temp_dir)
+        assert sorted(os.listdir(temp_dir)) == [
+            "part-00000-000.parquet",
+            "part-00001-000.parquet",
+            "part-00002-000.parquet",
+        ]
+        # the write does not change the number of threads of the database
+        assert spark.conn.execute("select current_setting('threads')").fetchone() == threads
+
+        parquet_rel = spark.read.parquet(os.path.join(temp_dir, "*.parquet"))
+        assert sorted(df.collect()) == sorted(parquet_rel.collect())
+
+    def test_repartition_by_column_to_parquet(self, df, spark, tmp_path):
+        temp_dir = os.path.join(tmp_path, "repartitioned")
+
+        df.repartition(3, "CourseName").write.parquet(temp_dir)
+        files = sorted(os.listdir(temp_dir))
+        assert all(re.fullmatch(r"part-0000[0-2]-000\.parquet", x) for x in files)
+
+        # the rows with the same value end up in the same file, the column is part of the data
+        courses = [
+            spark.conn.sql(f"select distinct CourseName from '{os.path.join(temp_dir, x)}'").fetchall() for x in files
+        ]
+        assert sorted(x[0] for file_courses in courses for x in file_courses) == ["Java", "PHP", "Python", "Scala"]
+
+        parquet_rel = spark.read.parquet(os.path.join(temp_dir, "*.parquet"))
+        assert sorted(df.collect()) == sorted(parquet_rel.collect())
+
+    def test_partition_by_to_parquet(self, df, spark, tmp_path):
+        temp_dir = os.path.join(tmp_path, "partitioned")
+
+        df.repartition(2).write.parquet(temp_dir, partitionBy="CourseName")
+        assert sorted(os.listdir(temp_dir)) == [
+            "CourseName=Java",
+            "CourseName=PHP",
+            "CourseName=Python",
+            "CourseName=Scala",
+        ]
+        for partition in os.listdir(temp_dir):
+            files = os.listdir(os.path.join(temp_dir, partition))
+            assert all(re.fullmatch(r"part-0000[01]-000\.parquet", x) for x in files)
+
+        res = spark.conn.sql(
+            f"select CourseName, fee from read_parquet('{temp_dir}/*/*.parquet', hive_partitioning=true) order by fee"
+        ).fetchall()
+        assert res == [("PHP", 3000), ("Java", 4000), ("Scala", 4100), ("Scala", 4500), ("Python", 4600)]
+
+    def test_repartition_derived_to_parquet(self, spark, tmp_path):
+        temp_dir = os.path.join(tmp_path, "repartitioned")
+
+        # the partitioning is kept by the DataFrames derived from the repartitioned DataFrame
+        df = spark.range(100).toDF("id").repartition(4).filter("id >= 10").select("id").alias("numbers")
+        df.write.parquet(temp_dir)
+        assert len(os.listdir(temp_dir)) == 4
+        assert spark.read.parquet(os.path.join(temp_dir, "*.parquet")).count() == 90
+
+    def test_coalesce_to_parquet(self, df, spark, tmp_path):
+        temp_file_name = os.path.join(tmp_path, "temp_file.parquet")
+
+        df.repartition(4).coalesce(1).write.parquet(temp_file_name)
+
+        parquet_rel = spark.read.parquet(temp_file_name)
+        assert df.collect() == parquet_rel.collect()
@@ -16,6 +16,7 @@ from duckdb.experimental.spark.sql.types import (
 )
 from duckdb.experimental.spark.sql.functions import col, struct, when, lit
 import duckdb
+from duckdb.experimental.spark.errors import PySparkTypeError
 import re
 
 
@@ -62,3 +63,48 @@ class TestWithColumn(object):
 
         df2 = df.drop("salary")
         assert 'salary' not in df2
+
+    def test_with_columns_chained(self, spark):
+        data = [
+            ('James', 3000),
+            ('Michael', 4000),
+        ]
+        df = spark.createDataFrame(data=data, schema=["name", "salary"])
+
+        df2 = (
+            df.withColumn("bonus", col("salary") * 2)
+            .withColumn("country", lit("USA"))
+            .withColumn("salary", col("salary") + 1)
+            .withColumn("total", col("bonus") + col("salary"))
+        )
+        assert df2.columns == ["name", "salary", "bonus", "country", "total"]
+        res = df2.collect()
+        assert res[0].salary == 3001
+        assert res[0].bonus == 6000
+        assert res[0].country == 'USA'
+        assert res[0].total == 9001
+
+        df3 = df.withColumns({"salary": col("salary") * 100, "doubled": col("salary") * 2})
+        assert df3.schema['doubled'].dataType.typeName() == 'integer'
+        res = df3.collect()
+        assert res[1].salary == 400_000
+        assert res[1].doubled == 8000
+
+        with pytest.raises(PySparkTypeError):
+            df.withColumns({"salary": 5})
+
+    def test_column_lookup(self, spark):
+        df = spark.createDataFrame(data=[('James', 3000)], schema=["name", "salary"])
+        df2 = df.withColumn("Bonus", col("salary") * 2)
+
+        # membership checks are case sensitive
+        assert 'Bonus' in df2
+        assert 'bonus' not in df2
+        assert 'Salary' not in df2
+
+        # private attributes are never looked up as columns, not even on an uninitialized DataFrame
+        uninitialized = type(df).__new__(type(df))
+        with pytest.raises(AttributeError):
+            uninitialized._projection_base
+        with pytest.raises(AttributeError):
+            uninitialized.name
@@ -1,4 +1,8 @@
+import datetime
+import enum
+
 import duckdb
+import numpy as np
 import pytest
 from conftest import NumpyPandas, ArrowPandas
 
@@ -28,3 +32,96 @@ class TestParameterList(object):
         con = duckdb.default_connection
         res = con.execute('select isnan(cast(? as double))', (float("nan"),))
         assert res.fetchone()[0] == True
+
+    @pytest.mark.parametrize(
+        'value, expected_type',
+        [
+            (42, 'INTEGER'),
+            (2**40, 'BIGINT'),
+            (2**64 - 1, 'UBIGINT'),
+            (-(2**100), 'HUGEINT'),
+            (4.5, 'DOUBLE'),
+            ('hello', 'VARCHAR'),
+            (b'\x00\x01', 'BLOB'),
+            (True, 'BOOLEAN'),
+            (None, '"NULL"'),
+            (datetime.datetime(2024, 1, 2, 3, 4, 5, 6), 'TIMESTAMP'),
+            (datetime.date(2024, 1, 2), 'DATE'),
+        ],
+    )
+    def test_scalar_types(self, duckdb_cursor, value, expected_type):
+        res = duckdb_cursor.execute('select ?, typeof(?)', [value, value]).fetchone()
+        assert res == (value, expected_type)
+
+    def test_timezone_aware_datetime(self, duckdb_cursor):
+        value = datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone(datetime.timedelta(hours=1)))
+        res = duckdb_cursor.execute('select typeof(?), epoch(?)', [value, value]).fetchone()
+        assert res == ('TIMESTAMP WITH TIME ZONE', value.timestamp())
+
+    def test_scalar_subclasses(self, duckdb_cursor):
+        class Color(enum.IntEnum):
+            RED = 1
+
+        class MyString(str):
+            pass
+
+        assert duckdb_cursor.execute('select ?', [Color.RED]).fetchone() == (1,)
+        assert duckdb_cursor.execute('select ?', [MyString('hello')]).fetchone() == ('hello',)
+
+    def test_expected_parameter_types(self, duckdb_cursor):
+        duckdb_cursor.execute('create table tbl (t TINYINT, d DOUBLE, s VARCHAR)')
+        duckdb_cursor.executemany(
+            'insert into tbl values (?, ?, ?)',
+            [[1, 1.5, 'a'], [None, 2, None], [3, None, 'c'], [4, 2**53 + 1, 'd']],
+        )
+        assert duckdb_cursor.execute('select * from tbl order by all').fetchall() == [
+            (1, 1.5, 'a'),
+            (3, None, 'c'),
+            (4, float(2**53 + 1), 'd'),
+            (None, 2.0, None),
+        ]
+        # a value that does not fit in the type of the column is not truncated
+        assert duckdb_cursor.execute('select count(*) from tbl where t = ?', [1]).fetchone() == (1,)
+        assert duckdb_cursor.execute('select count(*) from tbl where t < ?', [1000]).fetchone() == (3,)
+        assert duckdb_cursor.execute('select count(*) from tbl where d > ?', [1]).fetchone() == (3,)
+
+    @pytest.mark.parametrize(
+        'dtype, expected_type',
+        [
+            ('bool', 'BOOLEAN[]'),
+            ('int8', 'TINYINT[]'),
+            ('int16', 'SMALLINT[]'),
+            ('int32', 'INTEGER[]'),
+            ('int64', 'BIGINT[]'),
+            ('uint8', 'UTINYINT[]'),
+            ('uint16', 'USMALLINT[]'),
+            ('uint32', 'UINTEGER[]'),
+            ('uint64', 'UBIGINT[]'),
+            ('float32', 'FLOAT[]'),
+            ('float64', 'DOUBLE[]'),
+        ],
+    )
+    def test_numpy_array(self, duckdb_cursor, dtype, expected_type):
+        array = np.array([0, 1, 1, 0], dtype=dtype)
+        res = duckdb_cursor.execute('select ?, typeof(?)', [array, array]).fetchone()
+        assert res == (array.tolist(), expected_type)
+
+    def test_numpy_array_filter(self, duckdb_cursor):
+        duckdb_cursor.execute('create table tbl as select i from range(1000000) t(i)')
+        ids = np.arange(0, 1000000, 10)
+        assert duckdb_cursor.execute('select count(*) from tbl where i = ANY(?)', [ids]).fetchone() == (100000,)
+        res = duckdb_cursor.execute('select count(*) from tbl where i in (select unnest(?))', [ids]).fetchone()
+        assert res == (100000,)
+
+    def test_numpy_array_views(self, duckdb_cursor):
+        array = np.arange(10, dtype='int32')
+        assert duckdb_cursor.execute('select ?', [array[::-3]]).fetchone() == ([9, 6, 3, 0],)
+        assert duckdb_cursor.execute('select ?', [array[1::4]]).fetchone() == ([1, 5, 9],)
+        assert duckdb_cursor.execute('select ?', [array.astype('>i4')]).fetchone() == (array.tolist(),)
+        assert duckdb_cursor.execute('select ?', [np.array([], dtype='int64')]).fetchone() == ([],)
+
+    def test_numpy_array_special_values(self, duckdb_cursor):
+        assert duckdb_cursor.execute('select ?', [np.array([1.5, np.nan])]).fetchone() == ([1.5, None],)
+        masked = np.ma.masked_array([1, 2, 3], mask=[False, True, False])
+        assert duckdb_cursor.execute('select ?', [masked]).fetchone() == ([1, None, 3],)
+        assert duckdb_cursor.execute('select ?', [np.array([[1, 2], [3, 4]])]).fetchone() == ([[1, 2], [3, 4]],)
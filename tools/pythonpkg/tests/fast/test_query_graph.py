@@ -0,0 +1,39 @@
+import os
+
+from duckdb.query_graph.__main__ import align_profiles, format_delta, translate_json_diff_to_html
+
+data_directory = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'data')
+base_profile = os.path.join(data_directory, 'profile_base.json')
+new_profile = os.path.join(data_directory, 'profile_new.json')
+
+
+class TestQueryGraph(object):
+    def test_format_delta_missing_metric(self):
+        assert format_delta(None, 10, False) == "n/a &rarr; 10"
+        assert format_delta(10, None, True) == "10 &rarr; n/a"
+        assert format_delta(10, 10, False) == "10 &rarr; 10 (+0.0%)"
+
+    def test_align_replaced_root(self):
+        base = {'name': 'PROJECTION', 'children': [{'name': 'FILTER', 'children': []}]}
+        new = {'name': 'ORDER_BY', 'children': [{'name': 'FILTER', 'children': []}]}
+        aligned = align_profiles(base, new)
+        assert aligned['replaced']
+        assert aligned['base'] is base and aligned['new'] is new
+        # the children are still compared with each other
+        assert len(aligned['children']) == 1
+        child = aligned['children'][0]
+        assert not child['replaced']
+        assert child['base']['name'] == child['new']['name'] == 'FILTER'
+
+    def test_diff_profiles(self, tmp_path):
+        output = str(tmp_path / 'diff.html')
+        translate_json_diff_to_html(base_profile, new_profile, output)
+        with open(output, 'r', encoding='utf8') as f:
+            html = f.read()
+        assert 'replaces PROJECTION' in html
+        assert 'PROJECTION &rarr; ORDER_BY (replaced)' in html
+        # the filter and the scan are matched, their missing cardinalities are shown as n/a
+        assert '90 &rarr; n/a' in html
+        assert '100 &rarr; n/a' in html
+        assert 'only in' not in html
+        assert '0.3 &rarr; 0.6 (+100.0%)' in html
@@ -481,8 +481,8 @@ class TestRelation(object):
         limited_rel = rel.limit(50)
         assert len(limited_rel.fetchall()) == 50
 
-        # Using parameters also results in a MaterializedRelation
-        materialized_one = duckdb_cursor.sql("select * from range(?)", params=[10]).project(
+        # Statements that are not a SELECT statement result in a MaterializedRelation
+        materialized_one = duckdb_cursor.sql("call range(?)", params=[10]).project(
             ColumnExpression('range').cast(str).alias('range')
         )
         materialized_two = duckdb_cursor.sql("call repeat('a', 5)")
@@ -540,10 +540,10 @@ class TestRelation(object):
 
     def test_materialized_relation_view2(self, duckdb_cursor):
         # This creates a MaterializedRelation
-        rel = duckdb_cursor.sql("select * from (values ($1, $2))", params=[(2,), ("Alice",)])
+        rel = duckdb_cursor.sql("call repeat_row($1, $2, num_rows=1)", params=[(2,), ("Alice",)])
 
         # This creates a ProjectionRelation, wrapping the materialized rel
-        rel = rel.project("col0, col1")
+        rel = rel.project("column0, column1")
 
         # Create a VIEW that contains a ColumnDataRef
         rel.create_view("test", True)
@@ -557,7 +557,11 @@ class TestRelation(object):
         con = duckdb.connect(tmp_database)
 
         def create_view(con, view_name: str):
-            rel = con.sql("select 'this is not a small string ' || range::varchar from range(?)", params=[10])
+            con.execute("create table tbl(a varchar)")
+            rel = con.sql(
+                "insert into tbl select 'this is not a small string ' || range::varchar from range(?) returning *",
+                params=[10],
+            )
             rel.to_view(view_name)
 
         expected = [(f'this is not a small string {i}',) for i in range(10)]
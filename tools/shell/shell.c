@@ -10555,6 +10555,7 @@ struct ShellState {
   int writableSchema;    /* True if PRAGMA writable_schema=ON */
   int showHeader;        /* True to show column names in List or Column mode */
   int nCheck;            /* Number of ".check" commands run */
+  int nTestErr;          /* Number of errors since the last ".testerrors" */
   unsigned nProgress;    /* Number of progress callbacks encountered */
   unsigned mxProgress;   /* Maximum progress callbacks before failing */
   unsigned flgProgress;  /* Flags for the progress callback */
@@ -13609,6 +13610,8 @@ static const char *(azHelp[]) = {
 #endif
   ".tables ?TABLE?          List names of tables matching LIKE pattern TABLE",
   ".testcase NAME           Begin redirecting output to 'testcase-out.txt'",
+  ".testerrors MARKER       Print MARKER and the number of errors since the last",
+  "                           .testerrors to stderr",
   ".timer on|off            Turn SQL timer on or off",
 #ifdef SQLITE_DEBUG
   ".unmodule NAME ...       Unregister virtual table modules",
@@ -18728,6 +18731,21 @@ static int do_meta_command(char *zLine, ShellState *p){
     }
   }else
 
+  /* Report the number of errors since the last .testerrors, used by the test
+  ** harness to find the end (and the status) of a test in a shell that runs
+  ** the statements of many tests
+  */
+  if( c=='t' && strcmp(azArg[0],"testerrors")==0 ){
+    if( nArg!=2 ){
+      raw_printf(stderr, "Usage: .testerrors MARKER\n");
+      rc = 1;
+    }else{
+      utf8_printf(stderr, "%s %d\n", azArg[1], p->nTestErr);
+      fflush(stderr);
+      p->nTestErr = 0;
+    }
+  }else
+
 #ifndef SQLITE_UNTESTABLE
   if( c=='t' && n>=8 && strncmp(azArg[0], "testctrl", n)==0 ){
     static const struct {
@@ -19349,6 +19367,7 @@ static int process_input(ShellState *p){
           break;
         }else if( rc ){
           errCnt++;
+          p->nTestErr++;
         }
       }
       continue;
@@ -19377,7 +19396,9 @@ static int process_input(ShellState *p){
     }
     if( nSql && line_contains_semicolon(&zSql[nSqlPrior], nSql-nSqlPrior)
                 && sqlite3_complete(zSql) ){
-      errCnt += runOneSqlLine(p, zSql, p->in, startline);
+      rc = runOneSqlLine(p, zSql, p->in, startline);
+      errCnt += rc;
+      p->nTestErr += rc;
       nSql = 0;
       if( p->outCount ){
         output_reset(p);
@@ -19391,7 +19412,9 @@ static int process_input(ShellState *p){
     }
   }
   if( nSql && !_all_whitespace(zSql) ){
-    errCnt += runOneSqlLine(p, zSql, p->in, startline);
+    rc = runOneSqlLine(p, zSql, p->in, startline);
+    errCnt += rc;
+    p->nTestErr += rc;
   }
   free(zSql);
   free(zLine);
@@ -1,8 +1,25 @@
 import pytest
+import atexit
+import collections
 import os
+import queue
 import subprocess
 import sys
-from typing import List, NamedTuple, Union
+import threading
+from typing import List, NamedTuple, Optional, Tuple, Union
+
+# printed after every test by the persistent shell, to find the end of the output of the test
+SESSION_SENTINEL = '__shell_test_end_of_test__'
+# the maximum time to wait for the output of a test in the persistent shell, before falling back to a fresh process
+SESSION_TIMEOUT = 60
+# dot commands that can run in the persistent shell, their state is reset by SESSION_RESET
+SESSION_SAFE_COMMANDS = {'.mode', '.headers', '.maxrows', '.open', '.print', '.tables', '.schema', '.indexes', '.dump'}
+SESSION_RESET = ['.output', '.mode list', '.mode duckbox', '.headers on', '.maxrows 40', '.open']
+
+persistent_shell = False
+fresh_shell_required = False
+# the reasons why tests could not use the persistent shell, reported in the terminal summary
+session_fallbacks = collections.Counter()
 
 
 def pytest_addoption(parser):
@@ -10,6 +27,31 @@ def pytest_addoption(parser):
         "--shell-binary", action="store", default=None, help="Provide the shell binary to use for the tests"
     )
     parser.addoption("--start-offset", action="store", type=int, help="Skip the first 'n' tests")
+    parser.addoption(
+        "--persistent-shell",
+        action="store_true",
+        default=False,
+        help="Run the tests in a single shell process (per pytest-xdist worker) instead of a process per test",
+    )
+
+
+def pytest_configure(config):
+    global persistent_shell
+    persistent_shell = config.getoption("--persistent-shell")
+    config.addinivalue_line("markers", "fresh_shell: always run the shell of the test in a fresh process")
+
+
+def pytest_runtest_setup(item):
+    global fresh_shell_required
+    fresh_shell_required = item.get_closest_marker("fresh_shell") is not None
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not session_fallbacks:
+        return
+    terminalreporter.section("tests that did not use the persistent shell")
+    for reason, count in session_fallbacks.most_common():
+        terminalreporter.write_line(f"{count:6d} {reason}")
 
 
 def pytest_collection_modifyitems(config, items):
@@ -46,17 +88,99 @@ class TestResult:
         assert expected in self.stderr
 
 
+class ShellSession:
+    """
+    A shell process that runs the statements of many tests.
+    The output of a test ends with a sentinel on stdout and stderr, the state of the shell is reset after every test.
+    The sentinel on stderr is printed by '.testerrors', together with the number of statements of the test that failed.
+    """
+
+    def __init__(self, arguments: List[str]):
+        self.process = subprocess.Popen(
+            arguments,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            encoding='utf8',
+            errors='replace',
+        )
+        self.stdout = queue.Queue()
+        self.stderr = queue.Queue()
+        # read both pipes in the background, so a full stderr pipe cannot block the shell
+        for pipe, lines in [(self.process.stdout, self.stdout), (self.process.stderr, self.stderr)]:
+            threading.Thread(target=ShellSession.read_lines, args=(pipe, lines), daemon=True).start()
+
+    @staticmethod
+    def read_lines(pipe, lines: queue.Queue):
+        for line in iter(pipe.readline, ''):
+            lines.put(line)
+        # end of file, the process exited
+        lines.put(None)
+
+    @staticmethod
+    def read_until_sentinel(lines: queue.Queue) -> Tuple[str, str]:
+        """Returns the output before the sentinel, and the rest of the line of the sentinel"""
+        result = []
+        while True:
+            line = lines.get(timeout=SESSION_TIMEOUT)
+            if line is None:
+                raise RuntimeError("The shell process exited")
+            if SESSION_SENTINEL in line:
+                # the last line of the output might not end with a newline
+                prefix, suffix = line.split(SESSION_SENTINEL, 1)
+                result.append(prefix)
+                return ''.join(result), suffix.strip()
+            result.append(line)
+
+    def run(self, statements: str) -> TestResult:
+        # reset before the sentinels, so the database is closed (like at the exit of the process) when the test resumes
+        reset = '\n'.join(SESSION_RESET)
+        sentinels = f".print {SESSION_SENTINEL}\n.testerrors {SESSION_SENTINEL}\n"
+        self.process.stdin.write(f"{statements}\n{reset}\n{sentinels}")
+        self.process.stdin.flush()
+        stdout, _ = ShellSession.read_until_sentinel(self.stdout)
+        stderr, error_count = ShellSession.read_until_sentinel(self.stderr)
+        # the shell exits with an error code if any of the statements failed
+        status_code = 1 if int(error_count) > 0 else 0
+        return TestResult(stdout.strip(), stderr.strip(), status_code)
+
+    def close(self):
+        try:
+            self.process.stdin.close()
+        except OSError:
+            pass
+        self.process.kill()
+        self.process.wait()
+
+
+# the persistent shell processes of this (xdist worker) process, by shell binary
+shell_sessions = {}
+
+
+def close_shell_sessions():
+    for session in shell_sessions.values():
+        session.close()
+    shell_sessions.clear()
+
+
+atexit.register(close_shell_sessions)
+
+
 class ShellTest:
     def __init__(self, shell):
         if not shell:
             raise ValueError("Please provide a shell binary")
         self.shell = shell
-        self.arguments = [shell, '--batch', '--init', '/dev/null']
+        self.arguments = ShellTest.default_arguments(shell)
         self.statements: List[str] = []
         self.input = None
         self.output = None
         self.environment = {}
 
+    @staticmethod
+    def default_arguments(shell) -> List[str]:
+        return [shell, '--batch', '--init', '/dev/null']
+
     def add_argument(self, *args):
         self.arguments.extend(args)
         return self
@@ -116,8 +240,48 @@ class ShellTest:
         stderr = res.stderr.decode('utf8').strip()
         return stdout, stderr
 
+    def session_unavailable_reason(self) -> Optional[str]:
+        """Returns why the test can not run in the persistent shell, or None if it can"""
+        if fresh_shell_required:
+            return "marked with fresh_shell"
+        # tests that depend on the arguments, input, output or environment of the process need their own process
+        if self.arguments != ShellTest.default_arguments(self.shell):
+            return "passes arguments to the shell"
+        if self.input:
+            return "reads an input file"
+        if self.output:
+            return "writes to an output file"
+        if self.environment:
+            return "sets environment variables"
+        for statement in self.statements:
+            if statement.startswith('.') and statement.split()[0] not in SESSION_SAFE_COMMANDS:
+                return f"uses the dot command '{statement.split()[0]}'"
+        return None
+
+    def run_in_session(self, statements: str):
+        session = shell_sessions.get(self.shell)
+        if session is None:
+            session = ShellSession(self.arguments)
+            shell_sessions[self.shell] = session
+        try:
+            return session.run(statements)
+        except (RuntimeError, queue.Empty, OSError):
+            # the shell crashed or did not finish the test, run the test in a fresh process instead
+            session.close()
+            del shell_sessions[self.shell]
+            session_fallbacks["crashed or timed out in the persistent shell"] += 1
+            return None
+
     def run(self):
         statements = self.get_statements()
+        if persistent_shell:
+            reason = self.session_unavailable_reason()
+            if reason is None:
+                result = self.run_in_session(statements)
+                if result is not None:
+                    return result
+            else:
+                session_fallbacks[reason] += 1
         command = self.get_command(statements)
         input_data = self.get_input_data(statements)
         output_pipe = self.get_output_pipe()
@@ -8,6 +8,8 @@ from conftest import ShellTest
 import os
 
 
+# the HTTP log can be written after the query finished, which would end up in the output of the next test
+@pytest.mark.fresh_shell
 def test_http_logging_stderr(shell):
     test = (
         ShellTest(shell)
@@ -19,6 +21,7 @@ def test_http_logging_stderr(shell):
     result.check_stderr("HTTP Response")
 
 
+@pytest.mark.fresh_shell
 def test_http_logging_file(shell, tmp_path):
     temp_dir = tmp_path / 'http_logging_dir'
     temp_dir.mkdir()
@@ -0,0 +1,80 @@
+# fmt: off
+
+import pytest
+import conftest
+from conftest import ShellTest, ShellSession
+
+
+@pytest.fixture()
+def session(shell):
+    session = ShellSession(ShellTest.default_arguments(shell))
+    yield session
+    session.close()
+
+
+@pytest.fixture()
+def persistent(monkeypatch):
+    # run the tests of ShellTest in a persistent shell of their own, regardless of --persistent-shell
+    sessions = {}
+    monkeypatch.setattr(conftest, 'persistent_shell', True)
+    monkeypatch.setattr(conftest, 'fresh_shell_required', False)
+    monkeypatch.setattr(conftest, 'shell_sessions', sessions)
+    yield sessions
+    for session in sessions.values():
+        session.close()
+
+
+def test_session_status(session):
+    result = session.run("SELECT 42;")
+    assert result.status_code == 0
+    assert '42' in result.stdout
+
+    result = session.run("SELECT * FROM non_existent_table;")
+    assert result.status_code == 1
+    assert 'non_existent_table' in result.stderr
+
+    # the errors of the previous test are not counted again
+    result = session.run("SELECT 'Error';")
+    assert result.status_code == 0
+    assert 'Error' in result.stdout
+
+
+def test_session_failing_dot_command(session):
+    result = session.run(".mode non_existent_mode")
+    assert result.status_code == 1
+    assert 'mode should be one of' in result.stderr
+
+
+def test_session_reset(session):
+    result = session.run(".mode csv\nCREATE TABLE tbl AS SELECT 42 AS i;\nSELECT * FROM tbl;")
+    assert result.status_code == 0
+    assert result.stdout == 'i\n42'
+
+    # the database and the output mode are reset after every test
+    result = session.run("SELECT * FROM tbl;")
+    assert result.status_code == 1
+    assert 'tbl' in result.stderr
+
+    result = session.run("SELECT 42 AS i;")
+    assert result.status_code == 0
+    assert '│' in result.stdout
+
+
+def test_persistent_shell(shell, persistent):
+    ShellTest(shell).statement("SELECT 42;").run().check_stdout('42')
+    assert shell in persistent
+    process = persistent[shell].process
+
+    ShellTest(shell).statement("SELECT 84;").run().check_stdout('84')
+    assert persistent[shell].process is process
+
+
+def test_persistent_shell_fallback(shell, persistent, monkeypatch):
+    fallbacks = conftest.collections.Counter()
+    monkeypatch.setattr(conftest, 'session_fallbacks', fallbacks)
+
+    # tests that pass arguments or use dot commands that are not reset run in a fresh process
+    ShellTest(shell).add_argument('-csv').statement("SELECT 42 AS i;").run().check_stdout('i\n42')
+    ShellTest(shell).statement(".nullvalue NULL").statement("SELECT NULL;").run().check_stdout('NULL')
+    assert shell not in persistent
+    assert fallbacks == {"passes arguments to the shell": 1, "uses the dot command '.nullvalue'": 1}